@@ -6,8 +6,8 @@ A comprehensive Model Context Protocol server for Oracle Database operations.
 __version__ = "1.0.0"
 __author__ = "HoangLong"
 
-from .server import mcp
-from .config import validate_config
+from .server import mcp, warm_up_pools, start_catalog_refresher
+from .config import validate_config, WARMUP_POOLS
 
 def main():
     """Main entry point for the MCP server."""
@@ -15,6 +15,9 @@ def main():
     logger.info("Starting Oracle MCP Server...")
     try:
         validate_config()
+        if WARMUP_POOLS:
+            warm_up_pools()
+        start_catalog_refresher()
         mcp.run()
     except Exception as e:
         logger.error(f"Failed to start server: {e}")
@@ -0,0 +1,111 @@
+"""
+Caching module for Oracle MCP Server.
+In-process, thread-safe caches used to answer repeat requests without a
+database round trip.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe LRU mapping bounded by entry count.
+    Entries older than 'ttl' seconds (if set) are treated as missing.
+    """
+
+    def __init__(self, max_entries: int = 500, ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, stored_at)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the cached value (marking it recently used) or 'default'."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or (self.ttl and time.monotonic() - item[1] >= self.ttl):
+                if item is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: Any):
+        """Stores a value, evicting the least recently used entries if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None) -> int:
+        """Removes entries whose key matches 'predicate' (all if None). Returns the count."""
+        with self._lock:
+            keys = [k for k in self._data if predicate is None or predicate(k)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache bounded by total size in bytes.
+    Each entry carries its own TTL; get() returns the value with its age.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (value, size, stored_at, ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[tuple]:
+        """Returns (value, age_seconds) for a fresh entry, else None."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None:
+                age = time.monotonic() - item[2]
+                if age < item[3]:
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return item[0], age
+                self._remove(key)
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any, size: int, ttl: float):
+        """Stores a value of 'size' bytes, evicting least recently used entries to fit."""
+        if size > self.max_bytes or ttl <= 0:
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, size, time.monotonic(), ttl)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._remove(next(iter(self._data)))
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None) -> int:
+        """Removes entries whose key matches 'predicate' (all if None). Returns the count."""
+        with self._lock:
+            keys = [k for k in self._data if predicate is None or predicate(k)]
+            for k in keys:
+                self._remove(k)
+            return len(keys)
+
+    def _remove(self, key: Hashable):
+        self.bytes -= self._data.pop(key)[1]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,191 @@
+"""
+Catalog snapshot module for Oracle MCP Server.
+Persists a compact copy of each database's schema (tables, columns, keys,
+indexes, row estimates) to a local SQLite file so a freshly started server
+can answer discovery questions before it has talked to any database.
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    db TEXT PRIMARY KEY,
+    watermark TEXT,          -- MAX(last_ddl_time) seen at the last refresh (ISO format)
+    refreshed_at REAL,       -- time.time() of the last successful refresh
+    stale INTEGER DEFAULT 0  -- set when we ran DDL ourselves; cleared by the next refresh
+);
+CREATE TABLE IF NOT EXISTS tables (
+    db TEXT, table_name TEXT, num_rows INTEGER,
+    PRIMARY KEY (db, table_name)
+);
+CREATE TABLE IF NOT EXISTS columns (
+    db TEXT, table_name TEXT, column_id INTEGER, column_name TEXT, data_type TEXT,
+    data_length INTEGER, data_precision INTEGER, data_scale INTEGER, nullable TEXT,
+    PRIMARY KEY (db, table_name, column_id)
+);
+CREATE TABLE IF NOT EXISTS constraints (
+    db TEXT, table_name TEXT, constraint_name TEXT, constraint_type TEXT,
+    column_name TEXT, position INTEGER, r_constraint_name TEXT
+);
+CREATE TABLE IF NOT EXISTS indexes (
+    db TEXT, table_name TEXT, index_name TEXT, uniqueness TEXT, columns TEXT
+);
+-- Other places an own table's name is visible (synonyms, other schemas); kept
+-- so locate_table can answer from the snapshot with the same detail as live
+CREATE TABLE IF NOT EXISTS aliases (
+    db TEXT, table_name TEXT, owner TEXT, kind TEXT, target TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_tables_name ON tables (table_name);
+CREATE INDEX IF NOT EXISTS ix_aliases_table ON aliases (db, table_name);
+CREATE INDEX IF NOT EXISTS ix_constraints_table ON constraints (db, table_name);
+CREATE INDEX IF NOT EXISTS ix_indexes_table ON indexes (db, table_name);
+"""
+
+# Tables holding per-table detail rows, replaced wholesale for changed tables
+DETAIL_TABLES = ("columns", "constraints", "indexes")
+
+
+class CatalogStore:
+    """
+    SQLite-backed catalog snapshot shared by all databases.
+    Only the connected user's own schema is captured (user_* views).
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ---------- refresh ----------
+
+    def get_watermark(self, db: str) -> Optional[datetime]:
+        """Returns the last_ddl_time watermark of the previous refresh (None = never)."""
+        with self._lock:
+            row = self._conn.execute("SELECT watermark FROM snapshots WHERE db = ?", (db,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def apply_refresh(self, db: str, watermark: Optional[datetime], all_tables: Iterable[Tuple[str, Any]],
+                      changed: Iterable[str], columns: Iterable[Tuple], constraints: Iterable[Tuple],
+                      indexes: Iterable[Tuple], aliases: Iterable[Tuple] = ()):
+        """
+        Applies one refresh in a single transaction.
+        'all_tables' is the full (table_name, num_rows) list: tables missing from it
+        are dropped from the snapshot and row estimates are updated for the rest.
+        Detail rows are replaced only for the 'changed' tables. 'aliases'
+        (table_name, owner, kind, target) is always the full list, since other
+        schemas' DDL does not move our watermark.
+        """
+        all_tables = list(all_tables)
+        changed = list(changed)
+        with self._lock, self._conn:
+            present = {name for name, _ in all_tables}
+            known = {r[0] for r in self._conn.execute("SELECT table_name FROM tables WHERE db = ?", (db,))}
+            dropped = known - present
+            for name in list(dropped) + changed:
+                for detail in DETAIL_TABLES:
+                    self._conn.execute(f"DELETE FROM {detail} WHERE db = ? AND table_name = ?", (db, name))
+            self._conn.executemany(
+                "DELETE FROM tables WHERE db = ? AND table_name = ?", [(db, name) for name in dropped]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tables (db, table_name, num_rows) VALUES (?, ?, ?)",
+                [(db, name, num_rows) for name, num_rows in all_tables]
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO columns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(db, *row) for row in columns]
+            )
+            self._conn.executemany(
+                "INSERT INTO constraints VALUES (?, ?, ?, ?, ?, ?, ?)", [(db, *row) for row in constraints]
+            )
+            self._conn.executemany(
+                "INSERT INTO indexes VALUES (?, ?, ?, ?, ?)", [(db, *row) for row in indexes]
+            )
+            self._conn.execute("DELETE FROM aliases WHERE db = ?", (db,))
+            self._conn.executemany(
+                "INSERT INTO aliases VALUES (?, ?, ?, ?, ?)", [(db, *row) for row in aliases]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots (db, watermark, refreshed_at, stale) VALUES (?, ?, ?, 0)",
+                (db, watermark.isoformat() if watermark else None, time.time())
+            )
+
+    def mark_stale(self, db: str):
+        """Stops answering from the snapshot of 'db' until its next refresh."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE snapshots SET stale = 1 WHERE db = ?", (db,))
+
+    # ---------- lookups ----------
+
+    def snapshot_age(self, db: str) -> Optional[float]:
+        """Seconds since the last refresh of 'db', or None if it has no usable snapshot."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at FROM snapshots WHERE db = ? AND stale = 0", (db,)
+            ).fetchone()
+        return time.time() - row[0] if row and row[0] else None
+
+    def find_table(self, table_name: str) -> List[str]:
+        """Returns the databases whose snapshot contains 'table_name'."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT t.db FROM tables t JOIN snapshots s ON s.db = t.db "
+                "WHERE t.table_name = ? AND s.stale = 0 ORDER BY t.db",
+                (table_name.upper(),)
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def locate(self, table_name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Finds 'table_name' in every usable snapshot in one query.
+
+        Returns:
+            Mapping of database to {"age": seconds since refresh, "aliases": [(owner, kind, target)]}.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT t.db, s.refreshed_at, a.owner, a.kind, a.target FROM tables t "
+                "JOIN snapshots s ON s.db = t.db "
+                "LEFT JOIN aliases a ON a.db = t.db AND a.table_name = t.table_name "
+                "WHERE t.table_name = ? AND s.stale = 0 ORDER BY t.db, a.owner",
+                (table_name.upper(),)
+            ).fetchall()
+        found: Dict[str, Dict[str, Any]] = {}
+        now = time.time()
+        for db, refreshed_at, owner, kind, target in rows:
+            entry = found.setdefault(db, {"age": now - (refreshed_at or 0), "aliases": []})
+            if kind:
+                entry["aliases"].append((owner, kind, target))
+        return found
+
+    def get_table(self, db: str, table_name: str) -> Optional[Dict[str, Any]]:
+        """Returns the snapshot of one table (columns, constraints, indexes, num_rows) or None."""
+        name = table_name.upper()
+        with self._lock:
+            table = self._conn.execute(
+                "SELECT num_rows FROM tables WHERE db = ? AND table_name = ?", (db, name)
+            ).fetchone()
+            if not table:
+                return None
+            columns = self._conn.execute(
+                "SELECT column_name, data_type, data_length, data_precision, data_scale, nullable, NULL "
+                "FROM columns WHERE db = ? AND table_name = ? ORDER BY column_id", (db, name)
+            ).fetchall()
+            constraints = self._conn.execute(
+                "SELECT constraint_name, constraint_type, column_name, r_constraint_name FROM constraints "
+                "WHERE db = ? AND table_name = ? ORDER BY constraint_type, constraint_name, position", (db, name)
+            ).fetchall()
+            indexes = self._conn.execute(
+                "SELECT index_name, uniqueness, columns FROM indexes WHERE db = ? AND table_name = ?", (db, name)
+            ).fetchall()
+        return {"num_rows": table[0], "columns": columns, "constraints": constraints, "indexes": indexes}
@@ -13,10 +13,48 @@ from typing import Dict, Any, List
 # Load environment variables
 load_dotenv()
 
+def _as_bool(value: Any) -> bool:
+    """Interprets JSON booleans and env strings ('1', 'true', 'yes', 'on')."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("1", "true", "yes", "on")
+
 # ============================================
 # CONFIGURATION LOADING LOGIC
 # ============================================
 
+def _pool_settings(db: Dict[str, Any], g: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolves the pool sizing for one database entry.
+    Per-database keys override the global defaults.
+    """
+    return {
+        "pool_min": int(db.get("pool_min", g["pool_min"])),
+        "pool_max": int(db.get("pool_max", g["pool_max"])),
+        "pool_inc": int(db.get("increment", db.get("pool_increment", g["pool_inc"]))),
+        "pool_timeout": int(db.get("timeout", g["pool_timeout"])),
+        "idle_close": float(db.get("idle_close", g["pool_idle_close"])),
+        "getmode": str(db.get("getmode", g["pool_getmode"])).lower(),
+        "acquire_timeout": float(db.get("acquire_timeout", g["acquire_timeout"])),
+        "stmtcachesize": int(db.get("stmtcachesize", g["stmtcachesize"])),
+        "autoscale": _as_bool(db.get("autoscale", g["autoscale"])),
+    }
+
+def _query_settings(db: Dict[str, Any], g: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolves per-database query behaviour (result cache, fetch sizing, call timeout).
+    Per-database keys override the global defaults.
+    """
+    return {
+        "result_cache": _as_bool(db.get("result_cache", g["result_cache"])),
+        "result_cache_ttl": float(db.get("result_cache_ttl", g["result_cache_ttl"])),
+        # Fetch sizing: interactive cursors are capped at max_arraysize, exports use export_arraysize
+        "max_arraysize": int(db.get("max_arraysize", g["max_arraysize"])),
+        "export_arraysize": int(db.get("export_arraysize", g["export_arraysize"])),
+        # Default connection.call_timeout for read tools (0 = no limit)
+        "call_timeout_ms": int(db.get("call_timeout_ms", g["call_timeout_ms"])),
+    }
+
 def load_config() -> Dict[str, Any]:
     """
     Loads configuration from a JSON file (standard or embedded in mcp_config.json).
@@ -57,6 +95,7 @@ def load_config() -> Dict[str, Any]:
             g_settings = json_config.get("global_settings", {})
             config["global"] = {
                 "client_path": g_settings.get("oracle_client_path", os.getenv("ORACLE_CLIENT_PATH")),
+                "driver_mode": str(g_settings.get("driver_mode", os.getenv("DRIVER_MODE", "auto"))).lower(),
                 "default_db": g_settings.get("default_database", "default"),
                 "export_dir": g_settings.get("export_directory", os.getenv("EXPORT_DIRECTORY", os.getcwd())),
                 "log_level": g_settings.get("log_level", os.getenv("LOG_LEVEL", "INFO")),
@@ -64,6 +103,47 @@ def load_config() -> Dict[str, Any]:
                 "pool_min": int(g_settings.get("pool_min", os.getenv("POOL_MIN", "2"))),
                 "pool_max": int(g_settings.get("pool_max", os.getenv("POOL_MAX", "10"))),
                 "pool_inc": int(g_settings.get("pool_increment", os.getenv("POOL_INCREMENT", "1"))),
+                "pool_timeout": int(g_settings.get("pool_timeout", os.getenv("POOL_TIMEOUT", "0"))),
+                "pool_getmode": str(g_settings.get("pool_getmode", os.getenv("POOL_GETMODE", "timedwait"))).lower(),
+                "acquire_timeout": float(g_settings.get("acquire_timeout", os.getenv("POOL_ACQUIRE_TIMEOUT", "30"))),
+                "pool_idle_close": float(g_settings.get("pool_idle_close", os.getenv("POOL_IDLE_CLOSE", "0"))),
+                "pool_reaper_interval": float(g_settings.get("pool_reaper_interval", os.getenv("POOL_REAPER_INTERVAL", "60"))),
+                "stmtcachesize": int(g_settings.get("stmtcachesize", os.getenv("STMT_CACHE_SIZE", "20"))),
+                "pool_retry_backoff": float(g_settings.get("pool_retry_backoff", os.getenv("POOL_RETRY_BACKOFF", "2"))),
+                "pool_retry_max_backoff": float(g_settings.get("pool_retry_max_backoff", os.getenv("POOL_RETRY_MAX_BACKOFF", "60"))),
+                # Adaptive pool sizing
+                "autoscale": _as_bool(g_settings.get("pool_autoscale", os.getenv("POOL_AUTOSCALE", "false"))),
+                "autoscale_interval": float(g_settings.get("autoscale_interval", os.getenv("AUTOSCALE_INTERVAL", "30"))),
+                "autoscale_wait_ms": float(g_settings.get("autoscale_wait_ms", os.getenv("AUTOSCALE_WAIT_MS", "50"))),
+                # Circuit breaker
+                "breaker_threshold": int(g_settings.get("circuit_breaker_threshold", os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3"))),
+                "breaker_cooldown": float(g_settings.get("circuit_breaker_cooldown", os.getenv("CIRCUIT_BREAKER_COOLDOWN", "30"))),
+                # Startup warm-up
+                "warmup_pools": _as_bool(g_settings.get("warmup_pools", os.getenv("WARMUP_POOLS", "false"))),
+                "warmup_timeout": float(g_settings.get("warmup_timeout", os.getenv("WARMUP_TIMEOUT", "30"))),
+                # Metadata cache
+                "metadata_cache_size": int(g_settings.get("metadata_cache_size", os.getenv("METADATA_CACHE_SIZE", "500"))),
+                "metadata_cache_ttl": float(g_settings.get("metadata_cache_ttl", os.getenv("METADATA_CACHE_TTL", "60"))),
+                # Catalog snapshot
+                "catalog_file": g_settings.get("catalog_file", os.getenv("CATALOG_FILE", "")),
+                "catalog_refresh_interval": float(g_settings.get("catalog_refresh_interval", os.getenv("CATALOG_REFRESH_INTERVAL", "300"))),
+                "catalog_max_age": float(g_settings.get("catalog_max_age", os.getenv("CATALOG_MAX_AGE", "900"))),
+                # Multi-database discovery
+                "locate_timeout": float(g_settings.get("locate_timeout", os.getenv("LOCATE_TIMEOUT", "10"))),
+                "object_index": _as_bool(g_settings.get("object_index", os.getenv("OBJECT_INDEX", "false"))),
+                # Read-only result cache (opt-in)
+                "result_cache": _as_bool(g_settings.get("result_cache", os.getenv("RESULT_CACHE", "false"))),
+                "result_cache_ttl": float(g_settings.get("result_cache_ttl", os.getenv("RESULT_CACHE_TTL", "60"))),
+                "result_cache_max_bytes": int(g_settings.get("result_cache_max_bytes", os.getenv("RESULT_CACHE_MAX_BYTES", "67108864"))),
+                # Server-side cursor sessions (open_query / fetch_next)
+                "cursor_idle_timeout": float(g_settings.get("cursor_idle_timeout", os.getenv("CURSOR_IDLE_TIMEOUT", "300"))),
+                "max_open_cursors": int(g_settings.get("max_open_cursors", os.getenv("MAX_OPEN_CURSORS", "5"))),
+                "count_cache_ttl": float(g_settings.get("count_cache_ttl", os.getenv("COUNT_CACHE_TTL", "300"))),
+                # Fetch sizing
+                "max_arraysize": int(g_settings.get("max_arraysize", os.getenv("MAX_ARRAYSIZE", "1000"))),
+                "export_arraysize": int(g_settings.get("export_arraysize", os.getenv("EXPORT_ARRAYSIZE", "5000"))),
+                "call_timeout_ms": int(g_settings.get("call_timeout_ms", os.getenv("CALL_TIMEOUT_MS", "0"))),
+                "progress_interval": float(g_settings.get("progress_interval", os.getenv("PROGRESS_INTERVAL", "1"))),
                 # Query defaults
                 "max_rows": int(g_settings.get("max_rows_display", os.getenv("MAX_ROWS_DISPLAY", "100"))),
             }
@@ -87,7 +167,19 @@ def load_config() -> Dict[str, Any]:
                         "password": db.get("password"),
                         "dsn": dsn,
                         "mode": db.get("mode"),
-                        "encoding": db.get("encoding", "UTF-8")
+                        "encoding": db.get("encoding", "UTF-8"),
+                        # Thick-only features (external auth, pre-12.1 servers, NNE)
+                        "requires_thick": _as_bool(db.get("requires_thick", db.get("externalauth", False))),
+                        # Per-session setup applied once by the pool session callback
+                        "session_settings": db.get("session_settings", {}),
+                        "module": db.get("module", "mcp-oracle-server"),
+                        "action": db.get("action"),
+                        "client_identifier": db.get("client_identifier"),
+                        # Standalone connection reuse (SYSDBA entries)
+                        "sysdba_max": int(db.get("sysdba_max", 2)),
+                        "ping_interval": int(db.get("ping_interval", 60)),
+                        **_pool_settings(db, config["global"]),
+                        **_query_settings(db, config["global"])
                     }
             
             # If loaded successfully, return
@@ -115,24 +207,59 @@ def load_config() -> Dict[str, Any]:
             elif sid:
                 oracle_dsn = oracledb.makedsn(host, port, sid=sid)
 
-    config["databases"]["default"] = {} # Initialize
-    if oracle_user and oracle_password and oracle_dsn:
-        config["databases"]["default"] = {
-            "user": oracle_user,
-            "password": oracle_password,
-            "dsn": oracle_dsn
-        }
-
     config["global"] = {
         "client_path": os.getenv("ORACLE_CLIENT_PATH", r"d:\HoangLong\cty\file_js_rac\mcp-oracle-server\instantclient_23_0"),
+        "driver_mode": os.getenv("DRIVER_MODE", "auto").lower(),
         "default_db": "default",
         "export_dir": os.getenv("EXPORT_DIRECTORY", os.getcwd()),
         "log_level": os.getenv("LOG_LEVEL", "INFO"),
         "pool_min": int(os.getenv("POOL_MIN", "2")),
         "pool_max": int(os.getenv("POOL_MAX", "10")),
         "pool_inc": int(os.getenv("POOL_INCREMENT", "1")),
+        "pool_timeout": int(os.getenv("POOL_TIMEOUT", "0")),
+        "pool_getmode": os.getenv("POOL_GETMODE", "timedwait").lower(),
+        "acquire_timeout": float(os.getenv("POOL_ACQUIRE_TIMEOUT", "30")),
+        "pool_idle_close": float(os.getenv("POOL_IDLE_CLOSE", "0")),
+        "pool_reaper_interval": float(os.getenv("POOL_REAPER_INTERVAL", "60")),
+        "stmtcachesize": int(os.getenv("STMT_CACHE_SIZE", "20")),
+        "pool_retry_backoff": float(os.getenv("POOL_RETRY_BACKOFF", "2")),
+        "pool_retry_max_backoff": float(os.getenv("POOL_RETRY_MAX_BACKOFF", "60")),
+        "autoscale": _as_bool(os.getenv("POOL_AUTOSCALE", "false")),
+        "autoscale_interval": float(os.getenv("AUTOSCALE_INTERVAL", "30")),
+        "autoscale_wait_ms": float(os.getenv("AUTOSCALE_WAIT_MS", "50")),
+        "breaker_threshold": int(os.getenv("CIRCUIT_BREAKER_THRESHOLD", "3")),
+        "breaker_cooldown": float(os.getenv("CIRCUIT_BREAKER_COOLDOWN", "30")),
+        "warmup_pools": _as_bool(os.getenv("WARMUP_POOLS", "false")),
+        "warmup_timeout": float(os.getenv("WARMUP_TIMEOUT", "30")),
+        "metadata_cache_size": int(os.getenv("METADATA_CACHE_SIZE", "500")),
+        "metadata_cache_ttl": float(os.getenv("METADATA_CACHE_TTL", "60")),
+        "catalog_file": os.getenv("CATALOG_FILE", ""),
+        "catalog_refresh_interval": float(os.getenv("CATALOG_REFRESH_INTERVAL", "300")),
+        "catalog_max_age": float(os.getenv("CATALOG_MAX_AGE", "900")),
+        "locate_timeout": float(os.getenv("LOCATE_TIMEOUT", "10")),
+        "object_index": _as_bool(os.getenv("OBJECT_INDEX", "false")),
+        "result_cache": _as_bool(os.getenv("RESULT_CACHE", "false")),
+        "result_cache_ttl": float(os.getenv("RESULT_CACHE_TTL", "60")),
+        "result_cache_max_bytes": int(os.getenv("RESULT_CACHE_MAX_BYTES", "67108864")),
+        "cursor_idle_timeout": float(os.getenv("CURSOR_IDLE_TIMEOUT", "300")),
+        "max_open_cursors": int(os.getenv("MAX_OPEN_CURSORS", "5")),
+        "count_cache_ttl": float(os.getenv("COUNT_CACHE_TTL", "300")),
+        "max_arraysize": int(os.getenv("MAX_ARRAYSIZE", "1000")),
+        "export_arraysize": int(os.getenv("EXPORT_ARRAYSIZE", "5000")),
+        "call_timeout_ms": int(os.getenv("CALL_TIMEOUT_MS", "0")),
+        "progress_interval": float(os.getenv("PROGRESS_INTERVAL", "1")),
         "max_rows": int(os.getenv("MAX_ROWS_DISPLAY", "100"))
     }
+
+    config["databases"]["default"] = {} # Initialize
+    if oracle_user and oracle_password and oracle_dsn:
+        config["databases"]["default"] = {
+            "user": oracle_user,
+            "password": oracle_password,
+            "dsn": oracle_dsn,
+            **_pool_settings({}, config["global"]),
+            **_query_settings({}, config["global"])
+        }
     
     return config
 
@@ -146,6 +273,7 @@ GLOBAL_CONFIG = _loaded_config["global"]
 
 # Accessors for global settings
 ORACLE_CLIENT_PATH = GLOBAL_CONFIG["client_path"]
+DRIVER_MODE = GLOBAL_CONFIG["driver_mode"]  # thin | thick | auto
 EXPORT_DIRECTORY = GLOBAL_CONFIG["export_dir"]
 LOG_LEVEL = GLOBAL_CONFIG["log_level"]
 LOG_FILE = os.getenv("LOG_FILE", "mcp_oracle.log")
@@ -157,9 +285,54 @@ LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
 POOL_MIN_CONNECTIONS = GLOBAL_CONFIG["pool_min"]
 POOL_MAX_CONNECTIONS = GLOBAL_CONFIG["pool_max"]
 POOL_INCREMENT = GLOBAL_CONFIG["pool_inc"]
+POOL_TIMEOUT = GLOBAL_CONFIG["pool_timeout"]
+POOL_GETMODE = GLOBAL_CONFIG["pool_getmode"]  # wait | timedwait | nowait | forceget
+POOL_ACQUIRE_TIMEOUT = GLOBAL_CONFIG["acquire_timeout"]  # Seconds (timedwait mode)
+POOL_IDLE_CLOSE = GLOBAL_CONFIG["pool_idle_close"]  # Seconds unused before a pool is closed (0 = never)
+POOL_REAPER_INTERVAL = GLOBAL_CONFIG["pool_reaper_interval"]
+STMT_CACHE_SIZE = GLOBAL_CONFIG["stmtcachesize"]
+POOL_RETRY_BACKOFF = GLOBAL_CONFIG["pool_retry_backoff"]  # Seconds, doubled per consecutive failure
+POOL_RETRY_MAX_BACKOFF = GLOBAL_CONFIG["pool_retry_max_backoff"]
+
+# Adaptive Pool Sizing
+AUTOSCALE_INTERVAL = GLOBAL_CONFIG["autoscale_interval"]
+AUTOSCALE_WAIT_MS = GLOBAL_CONFIG["autoscale_wait_ms"]
+
+# Circuit Breaker Settings
+CIRCUIT_BREAKER_THRESHOLD = GLOBAL_CONFIG["breaker_threshold"]  # Consecutive connect failures before opening
+CIRCUIT_BREAKER_COOLDOWN = GLOBAL_CONFIG["breaker_cooldown"]  # Seconds to fail fast before a trial call
+
+# Startup Warm-up Settings
+WARMUP_POOLS = GLOBAL_CONFIG["warmup_pools"]
+WARMUP_TIMEOUT = GLOBAL_CONFIG["warmup_timeout"]
+
+# Metadata Cache Settings
+METADATA_CACHE_SIZE = GLOBAL_CONFIG["metadata_cache_size"]  # Max tables cached (LRU)
+METADATA_CACHE_TTL = GLOBAL_CONFIG["metadata_cache_ttl"]  # Seconds served without revalidation (0 = off)
+
+# Catalog Snapshot Settings
+CATALOG_FILE = GLOBAL_CONFIG["catalog_file"]  # SQLite file; empty string (default) disables the snapshot
+CATALOG_REFRESH_INTERVAL = GLOBAL_CONFIG["catalog_refresh_interval"]
+CATALOG_MAX_AGE = GLOBAL_CONFIG["catalog_max_age"]  # Older snapshots are bypassed for a live query
+
+# Discovery Settings
+LOCATE_TIMEOUT = GLOBAL_CONFIG["locate_timeout"]  # Seconds locate_table waits for all databases
+OBJECT_INDEX = GLOBAL_CONFIG["object_index"]  # In-memory name index for find_objects (opt-in)
+
+# Result Cache Settings (TTL and enable flag are resolved per database)
+RESULT_CACHE_MAX_BYTES = GLOBAL_CONFIG["result_cache_max_bytes"]  # Total budget across databases
+
+# Server-side Cursor Settings
+CURSOR_IDLE_TIMEOUT = GLOBAL_CONFIG["cursor_idle_timeout"]  # Seconds before an unused open_query cursor is closed
+MAX_OPEN_CURSORS = GLOBAL_CONFIG["max_open_cursors"]  # Per MCP client
 
 # Query Settings
+COUNT_CACHE_TTL = GLOBAL_CONFIG["count_cache_ttl"]  # Seconds a count_mode="cached" total is reused
 MAX_ROWS_DISPLAY = GLOBAL_CONFIG["max_rows"]
+MAX_ARRAYSIZE = GLOBAL_CONFIG["max_arraysize"]  # Largest fetch array for interactive tools
+EXPORT_ARRAYSIZE = GLOBAL_CONFIG["export_arraysize"]  # Fetch array for exports and bulk reads
+CALL_TIMEOUT_MS = GLOBAL_CONFIG["call_timeout_ms"]  # Default per-call limit for read tools (0 = none)
+PROGRESS_INTERVAL = GLOBAL_CONFIG["progress_interval"]  # Min seconds between progress notifications (0 = off)
 DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "50"))
 MAX_CSV_ROWS = int(os.getenv("MAX_CSV_ROWS", "100000"))
 BATCH_SIZE = int(os.getenv("BATCH_SIZE", "1000"))
@@ -2,7 +2,9 @@
 Logging module for Oracle MCP Server.
 Provides centralized logging with file rotation and formatting.
 """
+import bisect
 import logging
+import threading
 from logging.handlers import RotatingFileHandler
 import os
 from .config import LOG_LEVEL, LOG_FILE, LOG_FORMAT, LOG_MAX_BYTES, LOG_BACKUP_COUNT
@@ -60,17 +62,20 @@ class QueryLogger:
         self.query_history = []
         self.max_history = 100
     
-    def log_query(self, query: str, duration_ms: float, rows_affected: int = 0, 
-                  success: bool = True, error: str = None):
+    def log_query(self, query: str, duration_ms: float, rows_affected: int = 0,
+                  success: bool = True, error: str = None, bind_count: int = 0,
+                  round_trips: int = None):
         """
         Logs a query execution.
-        
+
         Args:
-            query: The SQL query executed
+            query: The SQL query executed (parameterized text; bind values are never logged)
             duration_ms: Execution time in milliseconds
             rows_affected: Number of rows affected
             success: Whether the query succeeded
             error: Error message if failed
+            bind_count: Number of bind variables passed with the query
+            round_trips: Estimated database round trips for execute + fetch (if known)
         """
         # Truncate long queries for logging
         display_query = query[:200] + "..." if len(query) > 200 else query
@@ -80,7 +85,9 @@ class QueryLogger:
             "duration_ms": duration_ms,
             "rows_affected": rows_affected,
             "success": success,
-            "error": error
+            "error": error,
+            "bind_count": bind_count,
+            "round_trips": round_trips
         }
         
         # Add to history
@@ -90,8 +97,9 @@ class QueryLogger:
         
         # Log
         if success:
+            trips = f" | Round trips: {round_trips}" if round_trips is not None else ""
             self.logger.info(
-                f"Query executed in {duration_ms:.2f}ms | Rows: {rows_affected} | {display_query}"
+                f"Query executed in {duration_ms:.2f}ms | Rows: {rows_affected} | Binds: {bind_count}{trips} | {display_query}"
             )
         else:
             self.logger.error(
@@ -107,6 +115,56 @@ class QueryLogger:
         return [q for q in self.query_history if q["duration_ms"] > threshold_ms]
 
 
+class Histogram:
+    """
+    Fixed-bucket histogram for latency and size metrics.
+    Thread-safe; percentiles are estimated as the upper bound of the bucket.
+    """
+
+    def __init__(self, bounds: list):
+        self.bounds = sorted(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)  # Last bucket is overflow
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, value: float):
+        """Adds one observation."""
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def percentile(self, pct: float) -> float:
+        """Returns the bucket upper bound below which 'pct' percent of values fall."""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            threshold = self.count * pct / 100.0
+            seen = 0
+            for index, bucket_count in enumerate(self.counts):
+                seen += bucket_count
+                if seen >= threshold:
+                    return self.bounds[index] if index < len(self.bounds) else self.max
+            return self.max
+
+    def format_buckets(self, unit: str = "") -> str:
+        """Formats non-empty buckets, e.g. '<=5ms: 12, <=10ms: 3, >1000ms: 1'."""
+        with self._lock:
+            parts = []
+            for index, bucket_count in enumerate(self.counts):
+                if not bucket_count:
+                    continue
+                if index < len(self.bounds):
+                    parts.append(f"<={self.bounds[index]:g}{unit}: {bucket_count}")
+                else:
+                    parts.append(f">{self.bounds[-1]:g}{unit}: {bucket_count}")
+            return ", ".join(parts) or "no samples"
+
+
 # Global logger instance
 logger = setup_logger()
 query_logger = QueryLogger(logger)
@@ -0,0 +1,115 @@
+"""
+Object index module for Oracle MCP Server.
+In-memory inverted trigram index over object and column names of every
+configured database, used for fuzzy, ranked name lookups without a
+database round trip.
+"""
+import threading
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+def trigrams(name: str) -> Set[str]:
+    """Trigrams of a name, padded so short names and prefixes still match."""
+    padded = f"  {name.upper()} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ObjectIndex:
+    """
+    Thread-safe trigram index of object names across databases.
+    Names are stored once; each name maps to its (database, type, parent)
+    occurrences, so a column name shared by many tables costs one posting.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: Dict[str, Set[str]] = defaultdict(set)  # trigram -> names
+        self._names: Dict[str, Dict[str, List[Tuple[str, Optional[str]]]]] = {}  # name -> db -> [(type, parent)]
+        self._signatures: Dict[str, Any] = {}  # db -> signature of the indexed object list
+
+    def signature(self, db: str) -> Any:
+        """Signature stored with the last load of 'db' (None if never indexed)."""
+        return self._signatures.get(db)
+
+    def databases(self) -> List[str]:
+        return sorted(self._signatures)
+
+    def replace(self, db: str, objects: Iterable[Tuple[str, str, Optional[str]]], signature: Any = None) -> int:
+        """
+        Replaces all entries of 'db' with (name, type, parent) rows.
+        'parent' is the table of a column, None otherwise. Returns the entry count.
+        """
+        grouped: Dict[str, List[Tuple[str, Optional[str]]]] = defaultdict(list)
+        count = 0
+        for name, obj_type, parent in objects:
+            grouped[name.upper()].append((obj_type, parent))
+            count += 1
+
+        with self._lock:
+            for name in [n for n, dbs in self._names.items() if db in dbs and n not in grouped]:
+                del self._names[name][db]
+                if not self._names[name]:
+                    del self._names[name]
+                    for tri in trigrams(name):
+                        self._postings[tri].discard(name)
+                        if not self._postings[tri]:
+                            del self._postings[tri]
+            for name, occurrences in grouped.items():
+                if name not in self._names:
+                    self._names[name] = {}
+                    for tri in trigrams(name):
+                        self._postings[tri].add(name)
+                self._names[name][db] = occurrences
+            self._signatures[db] = signature
+        return count
+
+    def search(self, query: str, limit: int = 20, types: Optional[Set[str]] = None,
+               databases: Optional[Set[str]] = None, min_score: float = 0.2) -> List[Dict[str, Any]]:
+        """
+        Ranked fuzzy search. The score is trigram similarity (shared / union),
+        boosted for exact, prefix and substring matches.
+
+        Returns:
+            Up to 'limit' dicts with name, score and matching occurrences.
+        """
+        query = query.strip().upper()
+        if not query:
+            return []
+        query_tris = trigrams(query)
+
+        with self._lock:
+            shared = Counter()
+            for tri in query_tris:
+                shared.update(self._postings.get(tri, ()))
+
+            scored = []
+            for name, common in shared.items():
+                score = common / (len(query_tris) + len(name) + 1 - common)
+                if name == query:
+                    score += 1.0
+                elif name.startswith(query):
+                    score += 0.5
+                elif query in name:
+                    score += 0.25
+                if score >= min_score:
+                    scored.append((score, name))
+            scored.sort(key=lambda item: (-item[0], len(item[1]), item[1]))
+
+            results = []
+            for score, name in scored:
+                occurrences = [
+                    (db, obj_type, parent)
+                    for db, items in sorted(self._names[name].items())
+                    if databases is None or db in databases
+                    for obj_type, parent in items
+                    if types is None or obj_type in types
+                ]
+                if occurrences:
+                    results.append({"name": name, "score": score, "occurrences": occurrences})
+                    if len(results) >= limit:
+                        break
+        return results
+
+    def __len__(self) -> int:
+        return len(self._names)
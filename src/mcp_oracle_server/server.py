@@ -8,43 +8,393 @@ import oracledb
 import csv
 import time
 import re
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
 from typing import Optional, List, Tuple, Dict, Any, Union
 import json
+import datetime
+import functools
+import hashlib
+import uuid
+import base64
+import threading
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+import anyio
 import pandas as pd
 from faker import Faker
 
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import FastMCP, Context
 from .config import (
-    DATABASES, GLOBAL_CONFIG, ORACLE_CLIENT_PATH,
+    DATABASES, GLOBAL_CONFIG, ORACLE_CLIENT_PATH, DRIVER_MODE,
     POOL_MIN_CONNECTIONS, POOL_MAX_CONNECTIONS, POOL_INCREMENT,
+    POOL_TIMEOUT, POOL_GETMODE, POOL_ACQUIRE_TIMEOUT, POOL_IDLE_CLOSE, POOL_REAPER_INTERVAL, STMT_CACHE_SIZE, POOL_RETRY_BACKOFF, POOL_RETRY_MAX_BACKOFF, AUTOSCALE_INTERVAL, AUTOSCALE_WAIT_MS,
+    WARMUP_POOLS, WARMUP_TIMEOUT, CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN,
     MAX_ROWS_DISPLAY, DEFAULT_PAGE_SIZE, MAX_CSV_ROWS, BATCH_SIZE,
-    PROTECTED_TABLES, DANGEROUS_KEYWORDS, EXPORT_DIRECTORY, validate_config
+    METADATA_CACHE_SIZE, METADATA_CACHE_TTL, CATALOG_FILE, CATALOG_REFRESH_INTERVAL, CATALOG_MAX_AGE, LOCATE_TIMEOUT, OBJECT_INDEX,
+    RESULT_CACHE_MAX_BYTES, CURSOR_IDLE_TIMEOUT, MAX_OPEN_CURSORS, COUNT_CACHE_TTL, MAX_ARRAYSIZE, EXPORT_ARRAYSIZE, CALL_TIMEOUT_MS, PROGRESS_INTERVAL,
+PROTECTED_TABLES, DANGEROUS_KEYWORDS, EXPORT_DIRECTORY, validate_config
 )
-from .logger import logger, query_logger
+from .logger import logger, query_logger, Histogram
+from .cache import LRUCache, ResultCache
+from .catalog import CatalogStore
+from .object_index import ObjectIndex
 
 # Initialize MCP Server
 mcp = FastMCP("Oracle Database Manager")
 _pools: Dict[str, oracledb.ConnectionPool] = {}
+_pools_lock = threading.Lock()
+_pool_creations: Dict[str, Future] = {}  # In-flight pool creations (single-flight per database)
+_pool_failures: Dict[str, Dict[str, Any]] = {}  # Last creation failure + retry deadline
 _oracle_client_initialized = False
+_acquire_waits: Dict[str, List[float]] = defaultdict(list)  # Acquire wait times (ms) since last autoscale tick
+_autoscaler_started = False
+_sysdba_caches: Dict[str, "StandaloneConnectionCache"] = {}
+_breakers: Dict[str, "CircuitBreaker"] = {}
+_pool_metrics: Dict[str, "PoolMetrics"] = {}
+# (database, owner, table) -> {"ddl_time", "checked_at", "data": {(sql, binds): rows}}
+_metadata_cache = LRUCache(max_entries=METADATA_CACHE_SIZE)
+_catalog: Optional[CatalogStore] = None
+_catalog_refresher_started = False
+_object_index = ObjectIndex()
+# (database, kind, normalized sql, binds, ...) -> query result, see cached_result()
+_result_cache = ResultCache(max_bytes=RESULT_CACHE_MAX_BYTES)
+# (database, normalized sql, binds) -> total row count, for count_mode="cached"
+_count_cache = LRUCache(max_entries=1000, ttl=COUNT_CACHE_TTL)
+_query_sessions: Dict[str, "QuerySession"] = {}
+_inflight: Dict[str, "InFlightRequest"] = {}
+_inflight_lock = threading.Lock()
+_query_sessions_lock = threading.Lock()
+_cursor_reaper_started = False
+_pool_users: Dict[str, int] = defaultdict(int)  # Connections currently checked out per database
+_pool_last_used: Dict[str, float] = {}  # time.monotonic() of last checkout/checkin
+_reaped_pools = set()
+_reaper_started = False
+
+# Errors meaning the session is gone (end-of-file on channel / not connected)
+CONNECTION_LOST_ERRORS = ("ORA-03113", "ORA-03114", "DPY-4011")
+
+
+def threaded_tool(*tool_args, **tool_kwargs):
+    """
+    Registers a blocking tool with FastMCP as an async tool.
+    The tool body runs in a worker thread, so one slow query (e.g. an export)
+    no longer stalls the event loop and concurrent calls overlap their
+    database round trips. The original function is returned unchanged so it
+    can still be called directly.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def async_fn(*args, **kwargs):
+            return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs))
+
+        mcp.add_tool(async_fn, *tool_args, **tool_kwargs)
+        return fn
+    return decorator
+
+class ProgressReporter:
+    """
+    Sends throttled MCP progress notifications from a tool's worker thread.
+    update() is cheap enough for hot loops: between notifications it only
+    reads the monotonic clock. A no-op without a Context, when the client sent
+    no progress token, or when PROGRESS_INTERVAL is 0.
+    """
+
+    def __init__(self, ctx: Optional["Context"], total: Optional[int] = None, interval: float = None):
+        self.ctx = ctx
+        self.total = total
+        self.interval = PROGRESS_INTERVAL if interval is None else interval
+        self.started = time.monotonic()
+        self._last_sent = self.started
+        if not self.interval:
+            self.ctx = None
+
+    def update(self, done: int, bytes_written: Optional[int] = None, force: bool = False):
+        if self.ctx is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_sent < self.interval:
+            return
+        self._last_sent = now
+
+        elapsed = now - self.started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        message = f"{done:,}" + (f"/{self.total:,}" if self.total else "") + f" rows, {rate:,.0f} rows/s"
+        if bytes_written is not None:
+            message += f", {bytes_written / 1048576:.1f} MB written"
+        if self.total and rate > 0 and done < self.total:
+            message += f", ETA {(self.total - done) / rate:.0f}s"
+        try:
+            anyio.from_thread.run(self.ctx.report_progress, done, self.total, message)
+        except Exception as e:
+            # Not running under the MCP event loop (direct call) or the client went away
+            logger.debug(f"Progress reporting disabled: {e}")
+            self.ctx = None
 
 # ============================================
 # CONNECTION MANAGEMENT
 # ============================================
 
+def resolve_driver_mode() -> str:
+    """
+    Resolves the configured driver mode to 'thin' or 'thick'.
+    'auto' picks thin mode (no Instant Client load) unless a configured
+    database is flagged 'requires_thick'.
+    """
+    mode = DRIVER_MODE
+    if mode not in ("thin", "thick", "auto"):
+        raise ValueError(f"Invalid driver_mode '{mode}'. Use 'thin', 'thick' or 'auto'.")
+    if mode == "auto":
+        needs_thick = [name for name, conf in DATABASES.items() if conf and conf.get("requires_thick")]
+        return "thick" if needs_thick else "thin"
+    return mode
+
 def init_oracle_client():
-    """Initializes Oracle Client in Thick Mode (Global, once)."""
+    """Initializes the Oracle driver in Thin or Thick Mode (Global, once)."""
     global _oracle_client_initialized
     if not _oracle_client_initialized:
+        start_time = time.perf_counter()
+        mode = resolve_driver_mode()
+        if mode == "thin":
+            _oracle_client_initialized = True
+            duration = (time.perf_counter() - start_time) * 1000
+            logger.info(f"Oracle driver ready in thin mode in {duration:.2f}ms (Instant Client not loaded)")
+            return
         try:
             oracledb.init_oracle_client(lib_dir=ORACLE_CLIENT_PATH)
-            logger.info("Oracle Client initialized successfully")
+            duration = (time.perf_counter() - start_time) * 1000
+            logger.info(f"Oracle Client initialized in thick mode in {duration:.2f}ms")
             _oracle_client_initialized = True
         except oracledb.DatabaseError as e:
             if "DPY-1001" not in str(e): # Already initialized
                 logger.warning(f"Oracle Client init warning: {e}")
             _oracle_client_initialized = True
 
+def build_session_sql(settings: Dict[str, Any]) -> Optional[str]:
+    """
+    Builds one anonymous PL/SQL block applying all ALTER SESSION settings,
+    so session setup costs a single round trip.
+    NLS_* values are quoted literals; others (CURRENT_SCHEMA, OPTIMIZER_MODE)
+    must be plain identifiers.
+    """
+    if not settings:
+        return None
+    statements = []
+    for key, value in settings.items():
+        key = str(key).upper()
+        if not validate_identifier(key) or "." in key:
+            raise ValueError(f"Invalid session setting name: {key}")
+        value = str(value)
+        if key.startswith("NLS_"):
+            # Quoted twice: once for the literal, once inside EXECUTE IMMEDIATE
+            value = "''" + value.replace("'", "''''") + "''"
+        elif not validate_identifier(value) or "." in value:
+            raise ValueError(f"Invalid value for session setting {key}: {value}")
+        statements.append(f"EXECUTE IMMEDIATE 'ALTER SESSION SET {key} = {value}';")
+    return "BEGIN " + " ".join(statements) + " END;"
+
+def get_session_tag(db_conf: Dict[str, Any]) -> Optional[str]:
+    """Derives a stable pool tag from the database's session settings."""
+    settings = db_conf.get("session_settings")
+    if not settings:
+        return None
+    digest = hashlib.sha1(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+    return f"MCP_SESSION={digest}"
+
+def init_session(db_name: str, conn, requested_tag):
+    """
+    Session callback: runs when a session is new or its tag does not match
+    the requested one, so the work below is skipped on reuse.
+    - Pre-parses the fixed metadata statements into the statement cache.
+    - Applies the database's 'session_settings' (NLS formats, CURRENT_SCHEMA...).
+    - Sets module/action/client_identifier so V$SESSION shows MCP sessions.
+    """
+    db_conf = DATABASES.get(db_name) or {}
+    if not conn.tag:
+        # Brand new session (retagged sessions already have these statements)
+        for sql in METADATA_STATEMENTS[:conn.stmtcachesize]:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.parse(sql)
+            except oracledb.DatabaseError as e:
+                logger.debug(f"Could not pre-parse metadata statement: {e}")
+
+    session_sql = build_session_sql(db_conf.get("session_settings"))
+    if session_sql:
+        with conn.cursor() as cursor:
+            cursor.execute(session_sql)
+
+    # Piggybacked on the next round trip, no extra cost
+    conn.module = db_conf.get("module", "mcp-oracle-server")
+    if db_conf.get("action"):
+        conn.action = db_conf["action"]
+    if db_conf.get("client_identifier"):
+        conn.client_identifier = db_conf["client_identifier"]
+    if requested_tag:
+        conn.tag = requested_tag
+
+class PoolBusyError(ConnectionError):
+    """Raised when no connection could be acquired within the acquire timeout."""
+
+    def __init__(self, db_name: str, max_connections: int, waiters: int, waited: Optional[float]):
+        self.db_name = db_name
+        self.waiters = waiters
+        waited_str = f" after waiting {waited:.1f}s" if waited else ""
+        super().__init__(
+            f"Database '{db_name}' busy: all {max_connections} connections in use, "
+            f"{waiters} waiters{waited_str}. Retry later or raise its pool_max."
+        )
+
+# Errors raised by pool.acquire() when the get mode gives up (timed wait / no wait)
+POOL_EXHAUSTED_ERRORS = ("DPY-4005", "ORA-24418", "ORA-24457", "ORA-24459")
+
+GETMODES = {
+    "wait": oracledb.POOL_GETMODE_WAIT,
+    "timedwait": oracledb.POOL_GETMODE_TIMEDWAIT,
+    "nowait": oracledb.POOL_GETMODE_NOWAIT,
+    "forceget": oracledb.POOL_GETMODE_FORCEGET,
+}
+
+class PoolMetrics:
+    """Acquire-wait and queue-depth histograms for one database."""
+    WAIT_BOUNDS_MS = [1, 5, 10, 50, 100, 500, 1000, 5000, 30000]
+    QUEUE_BOUNDS = [0, 1, 2, 5, 10, 20, 50]
+
+    def __init__(self):
+        self.acquire_wait = Histogram(self.WAIT_BOUNDS_MS)
+        self.queue_depth = Histogram(self.QUEUE_BOUNDS)
+        self.timeouts = 0
+        self.waiters = 0  # Callers currently blocked in acquire
+        self.lock = threading.Lock()
+
+    def enter(self) -> int:
+        """Registers a waiting caller and records the queue depth it saw."""
+        with self.lock:
+            depth = self.waiters
+            self.waiters += 1
+        self.queue_depth.record(depth)
+        return depth
+
+    def leave(self, wait_ms: float, timed_out: bool = False):
+        with self.lock:
+            self.waiters -= 1
+            if timed_out:
+                self.timeouts += 1
+        self.acquire_wait.record(wait_ms)
+
+def pool_metrics_for(db_name: str) -> PoolMetrics:
+    """Returns the metrics for a database, creating them on first use."""
+    with _pools_lock:
+        metrics = _pool_metrics.get(db_name)
+        if metrics is None:
+            metrics = PoolMetrics()
+            _pool_metrics[db_name] = metrics
+        return metrics
+
+def is_connection_lost(error: Exception) -> bool:
+    """Returns True if the error means the underlying session is dead."""
+    message = str(error)
+    return any(code in message for code in CONNECTION_LOST_ERRORS)
+
+class StandaloneConnectionCache:
+    """
+    Keeps a small set of standalone connections open for reuse.
+    SYSDBA sessions cannot come from a pool, so without this every tool call
+    pays a full logon. Connections idle for longer than 'ping_interval' seconds
+    are pinged before reuse; dead ones are replaced transparently.
+    """
+
+    def __init__(self, db_name: str, db_conf: Dict[str, Any]):
+        self.db_name = db_name
+        self.db_conf = db_conf
+        self.max_connections = db_conf.get("sysdba_max", 2)
+        self.ping_interval = db_conf.get("ping_interval", 60)
+        self._idle: List[Tuple[Any, float]] = []  # (connection, last used)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self.opened = 0
+        self.busy = 0
+
+    def _connect(self):
+        conn = oracledb.connect(
+            user=self.db_conf["user"],
+            password=self.db_conf["password"],
+            dsn=self.db_conf["dsn"],
+            mode=oracledb.SYSDBA,
+            stmtcachesize=self.db_conf.get("stmtcachesize", STMT_CACHE_SIZE)
+        )
+        init_session(self.db_name, conn, None)
+        with self._lock:
+            self.opened += 1
+        logger.info(f"Opened SYSDBA connection for '{self.db_name}' ({self.opened}/{self.max_connections})")
+        return conn
+
+    def _discard(self, conn):
+        with self._lock:
+            self.opened -= 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _is_alive(self, conn, last_used: float) -> bool:
+        if not conn.is_healthy():
+            return False
+        if time.monotonic() - last_used >= self.ping_interval:
+            try:
+                conn.ping()
+            except oracledb.DatabaseError as e:
+                logger.info(f"SYSDBA connection for '{self.db_name}' failed liveness ping: {e}")
+                return False
+        return True
+
+    def acquire(self, timeout: Optional[float] = None):
+        """
+        Returns a live connection, blocking while 'sysdba_max' are in use.
+        Raises PoolBusyError if no slot frees up within 'timeout' seconds.
+        """
+        if not self._slots.acquire(timeout=timeout):
+            raise PoolBusyError(self.db_name, self.max_connections, 0, timeout)
+        try:
+            while True:
+                with self._lock:
+                    entry = self._idle.pop() if self._idle else None
+                if entry is None:
+                    conn = self._connect()
+                    break
+                conn, last_used = entry
+                if self._is_alive(conn, last_used):
+                    break
+                self._discard(conn)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self.busy += 1
+        return conn
+
+    def release(self, conn, discard: bool = False):
+        """Returns a connection to the cache, or closes it if it is broken."""
+        try:
+            with self._lock:
+                self.busy -= 1
+            if not discard and conn.is_healthy() and conn.transaction_in_progress:
+                # Never leak an uncommitted transaction into the next tool call
+                conn.rollback()
+            if discard or not conn.is_healthy():
+                self._discard(conn)
+            else:
+                with self._lock:
+                    self._idle.append((conn, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Closes all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn, _ in idle:
+            self._discard(conn)
+
 def get_pool(db_name: Optional[str] = None) -> oracledb.ConnectionPool:
     """Gets or creates the connection pool for a specific database."""
     global _pools
@@ -62,32 +412,253 @@ def get_pool(db_name: Optional[str] = None) -> oracledb.ConnectionPool:
         else:
              raise ValueError(f"Database '{db_name}' not defined in configuration. Available: {list(DATABASES.keys())}")
 
-    if db_name not in _pools:
-        validate_config()
-        init_oracle_client()
-        
-        db_conf = DATABASES[db_name]
+    while True:
+        with _pools_lock:
+            if db_name in _pools:
+                return _pools[db_name]
+            failure = _pool_failures.get(db_name)
+            if failure and time.monotonic() < failure["retry_at"]:
+                raise failure["error"]
+            creation = _pool_creations.get(db_name)
+            is_creator = creation is None
+            if is_creator:
+                creation = Future()
+                _pool_creations[db_name] = creation
+
+        if not is_creator:
+            # Another caller is already building this pool; share its outcome
+            return creation.result()
+
         try:
-            # For SYSDBA mode, we cannot use pool - must use direct connection
-            if db_conf.get("mode", "").upper() == "SYSDBA":
-                _pools[db_name] = None  # Signal to use direct connection
-                logger.info(f"SYSDBA mode configured for '{db_name}' - will use direct connections")
-            else:
-                pool = oracledb.create_pool(
-                    user=db_conf["user"],
-                    password=db_conf["password"],
-                    dsn=db_conf["dsn"],
-                    min=POOL_MIN_CONNECTIONS,
-                    max=POOL_MAX_CONNECTIONS,
-                    increment=POOL_INCREMENT
-                )
-                _pools[db_name] = pool
-                logger.info(f"Connection pool created for '{db_name}'")
+            pool = _create_pool(db_name)
+        except Exception as e:
+            with _pools_lock:
+                attempts = _pool_failures.get(db_name, {}).get("attempts", 0) + 1
+                backoff = min(POOL_RETRY_BACKOFF * (2 ** (attempts - 1)), POOL_RETRY_MAX_BACKOFF)
+                _pool_failures[db_name] = {
+                    "error": e, "attempts": attempts, "retry_at": time.monotonic() + backoff
+                }
+                del _pool_creations[db_name]
+            logger.error(f"Failed to create pool for '{db_name}' (attempt {attempts}, retry in {backoff:.0f}s): {e}")
+            creation.set_exception(e)
+            raise
+
+        with _pools_lock:
+            _pools[db_name] = pool
+            _pool_last_used[db_name] = time.monotonic()
+            _pool_failures.pop(db_name, None)
+            del _pool_creations[db_name]
+        creation.set_result(pool)
+        return pool
+
+def _create_pool(db_name: str) -> Optional[oracledb.ConnectionPool]:
+    """Builds the pool (or SYSDBA connection cache) for one database. Called single-flight."""
+    validate_config()
+    init_oracle_client()
+
+    db_conf = DATABASES[db_name]
+    if db_conf.get("idle_close", POOL_IDLE_CLOSE):
+        start_pool_reaper()
+    if db_name in _reaped_pools:
+        logger.info(f"Recreating pool for '{db_name}' after idle close")
+    # For SYSDBA mode, we cannot use pool - must use direct connection
+    if db_conf.get("mode", "").upper() == "SYSDBA":
+        _sysdba_caches[db_name] = StandaloneConnectionCache(db_name, db_conf)
+        logger.info(f"SYSDBA mode configured for '{db_name}' - will use cached direct connections")
+        return None  # Signal to use direct connection
+
+    pool = oracledb.create_pool(
+        user=db_conf["user"],
+        password=db_conf["password"],
+        dsn=db_conf["dsn"],
+        min=db_conf.get("pool_min", POOL_MIN_CONNECTIONS),
+        max=db_conf.get("pool_max", POOL_MAX_CONNECTIONS),
+        increment=db_conf.get("pool_inc", POOL_INCREMENT),
+        timeout=db_conf.get("pool_timeout", POOL_TIMEOUT),
+        stmtcachesize=db_conf.get("stmtcachesize", STMT_CACHE_SIZE),
+        getmode=GETMODES[db_conf.get("getmode", POOL_GETMODE)],
+        wait_timeout=int(db_conf.get("acquire_timeout", POOL_ACQUIRE_TIMEOUT) * 1000),
+        session_callback=functools.partial(init_session, db_name)
+    )
+    logger.info(f"Connection pool created for '{db_name}' (min={pool.min}, max={pool.max})")
+    if db_conf.get("autoscale"):
+        start_pool_autoscaler()
+    return pool
+
+def _acquire_connection(db_name: str, db_conf: Dict[str, Any], pool):
+    """
+    Acquires a connection from the pool (or SYSDBA cache), recording the wait
+    time and queue depth. Translates acquire timeouts into PoolBusyError.
+    """
+    metrics = pool_metrics_for(db_name)
+    timeout = db_conf.get("acquire_timeout", POOL_ACQUIRE_TIMEOUT)
+    waiters = metrics.enter()
+    wait_start = time.perf_counter()
+    timed_out = False
+    try:
+        if pool is None:
+            return _sysdba_caches[db_name].acquire(timeout=timeout or None)
+        return pool.acquire(tag=get_session_tag(db_conf))
+    except PoolBusyError:
+        timed_out = True
+        raise PoolBusyError(db_name, _sysdba_caches[db_name].max_connections, waiters, timeout)
+    except oracledb.DatabaseError as e:
+        if any(code in str(e) for code in POOL_EXHAUSTED_ERRORS):
+            timed_out = True
+            raise PoolBusyError(db_name, pool.max, waiters, timeout) from e
+        raise
+    finally:
+        wait_ms = (time.perf_counter() - wait_start) * 1000
+        metrics.leave(wait_ms, timed_out)
+        if db_conf.get("autoscale"):  # Only the autoscaler drains these
+            _acquire_waits[db_name].append(wait_ms)
+        if timed_out:
+            logger.warning(f"Acquire timed out for '{db_name}' after {wait_ms:.0f}ms ({waiters} waiters ahead)")
+
+def _checkout_pool(db_name: str) -> Optional[oracledb.ConnectionPool]:
+    """
+    Gets the pool and marks it in use, so the idle reaper cannot close it
+    between lookup and acquire. Must be paired with _checkin_pool().
+    """
+    while True:
+        pool = get_pool(db_name)
+        with _pools_lock:
+            if db_name in _pools and _pools[db_name] is pool:
+                _pool_users[db_name] += 1
+                _pool_last_used[db_name] = time.monotonic()
+                return pool
+        # Reaped between lookup and checkout; get_pool() recreates it
+
+def _checkin_pool(db_name: str):
+    """Marks one use of the pool as finished."""
+    with _pools_lock:
+        _pool_users[db_name] -= 1
+        _pool_last_used[db_name] = time.monotonic()
+
+# ============================================
+# IDLE POOL REAPING
+# ============================================
+
+def reap_idle_pools():
+    """
+    Closes pools (and idle SYSDBA connections) of databases unused for longer
+    than their 'idle_close' seconds. Closed pools are recreated lazily on the
+    next get_connection().
+    """
+    now = time.monotonic()
+    for name in list(_pools):
+        idle_close = (DATABASES.get(name) or {}).get("idle_close", POOL_IDLE_CLOSE)
+        if not idle_close:
+            continue
+        with _pools_lock:
+            idle_for = now - _pool_last_used.get(name, now)
+            if name not in _pools or _pool_users[name] > 0 or idle_for < idle_close:
+                continue
+            pool = _pools.pop(name)
+            _reaped_pools.add(name)
+            cache = _sysdba_caches.pop(name, None)
+        try:
+            if pool is not None:
+                pool.close(force=True)
+            if cache is not None:
+                cache.close()
+            logger.info(f"Closed idle pool for '{name}' after {idle_for:.0f}s unused (recreated on next use)")
         except Exception as e:
-             logger.error(f"Failed to create pool for '{db_name}': {e}")
-             raise
+            logger.warning(f"Failed to close idle pool for '{name}': {e}")
+
+def start_pool_reaper():
+    """Starts the background idle-pool reaper thread (once per process)."""
+    global _reaper_started
+    with _pools_lock:
+        if _reaper_started:
+            return
+        _reaper_started = True
+
+    def loop():
+        while True:
+            time.sleep(POOL_REAPER_INTERVAL)
+            reap_idle_pools()
 
-    return _pools.get(db_name)
+    threading.Thread(target=loop, name="pool-reaper", daemon=True).start()
+    logger.info(f"Idle pool reaper started (interval={POOL_REAPER_INTERVAL}s)")
+
+# ============================================
+# CIRCUIT BREAKER
+# ============================================
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of connecting while a database's circuit is open."""
+
+class CircuitBreaker:
+    """
+    Per-database circuit breaker around connection acquisition.
+    - closed: calls go through; consecutive connect failures are counted.
+    - open: after 'threshold' failures, calls fail fast for 'cooldown' seconds.
+    - half-open: after the cooldown one trial call is let through; success
+      closes the circuit, failure re-opens it.
+    """
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, db_name: str, threshold: int, cooldown: float):
+        self.db_name = db_name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raises CircuitOpenError if the call must not reach the database."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self._opened_at + self.cooldown - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+                logger.info(f"Circuit for '{self.db_name}' half-open: allowing a trial connection")
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            raise CircuitOpenError(
+                f"Database '{self.db_name}' is unavailable (circuit {self.state} after "
+                f"{self.failures} failures, retry in {max(remaining, 0):.0f}s). Last error: {self.last_error}"
+            )
+
+    def record_success(self):
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info(f"Circuit for '{self.db_name}' closed: database reachable again")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, error: Exception):
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Circuit for '{self.db_name}' opened after {self.failures} failures "
+                        f"(cooldown {self.cooldown:.0f}s): {error}"
+                    )
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+
+def get_circuit_breaker(db_name: str) -> CircuitBreaker:
+    """Returns the circuit breaker for a database, creating it on first use."""
+    with _pools_lock:
+        breaker = _breakers.get(db_name)
+        if breaker is None:
+            breaker = CircuitBreaker(db_name, CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_COOLDOWN)
+            _breakers[db_name] = breaker
+        return breaker
 
 @contextmanager
 def get_connection(db_name: Optional[str] = None):
@@ -103,35 +674,452 @@ def get_connection(db_name: Optional[str] = None):
             else:
                 raise ValueError(f"Database '{db_name}' not defined.")
         
-        # Ensure pool/config is initialized
-        get_pool(db_name)
-        
         db_conf = DATABASES[db_name]
-        
-        # Check if SYSDBA mode - use direct connection
-        if db_conf.get("mode", "").upper() == "SYSDBA":
-            conn = oracledb.connect(
-                user=db_conf["user"],
-                password=db_conf["password"],
-                dsn=db_conf["dsn"],
-                mode=oracledb.SYSDBA
-            )
+        is_sysdba = db_conf.get("mode", "").upper() == "SYSDBA"
+        checked_out = False
+
+        # Fail fast while the database is known to be unreachable
+        breaker = get_circuit_breaker(db_name)
+        breaker.before_call()
+        try:
+            # Ensure pool/config is initialized and keep the reaper away while in use
+            pool = _checkout_pool(db_name)
+            checked_out = True
+            conn = _acquire_connection(db_name, db_conf, pool)
+        except PoolBusyError:
+            # The database answered; it is just saturated
+            _checkin_pool(db_name)
+            breaker.record_success()
+            raise
+        except Exception as e:
+            if checked_out:
+                _checkin_pool(db_name)
+            breaker.record_failure(e)
+            raise
+        breaker.record_success()
+
+        # Check if SYSDBA mode - use cached direct connection
+        if is_sysdba:
+            lost = False
             try:
                 yield conn
+            except oracledb.DatabaseError as e:
+                lost = is_connection_lost(e)
+                raise
             finally:
-                conn.close()
+                _sysdba_caches[db_name].release(conn, discard=lost)
+                _checkin_pool(db_name)
         else:
             # Use pool
-            pool = _pools[db_name]
-            conn = pool.acquire()
             try:
                 yield conn
             finally:
                 pool.release(conn)
+                _checkin_pool(db_name)
     except Exception as e:
         logger.error(f"Connection error (DB: {db_name}): {e}")
         raise
 
+# ============================================
+# ADAPTIVE POOL SIZING
+# ============================================
+
+def autoscale_target(current_min: int, busy: int, opened: int, avg_wait_ms: float,
+                     lower: int, upper: int, increment: int) -> int:
+    """
+    Decides the new warm-session floor (pool 'min') for one pool.
+    Grows when most sessions are busy or callers waited on acquire, shrinks
+    when the pool is mostly idle. The result stays within [lower, upper].
+    """
+    utilization = busy / opened if opened else 0.0
+    if utilization >= 0.8 or avg_wait_ms >= AUTOSCALE_WAIT_MS:
+        return min(upper, current_min + increment)
+    if utilization <= 0.25 and avg_wait_ms == 0:
+        return max(lower, current_min - increment)
+    return current_min
+
+def autoscale_pools():
+    """Runs one autoscale pass over all pools that have 'autoscale' enabled."""
+    for name, pool in list(_pools.items()):
+        db_conf = DATABASES.get(name) or {}
+        if pool is None or not db_conf.get("autoscale"):
+            continue
+        waits, _acquire_waits[name] = _acquire_waits[name], []
+        avg_wait = sum(waits) / len(waits) if waits else 0.0
+        try:
+            target = autoscale_target(
+                pool.min, pool.busy, pool.opened, avg_wait,
+                lower=db_conf.get("pool_min", POOL_MIN_CONNECTIONS),
+                upper=db_conf.get("pool_max", POOL_MAX_CONNECTIONS),
+                increment=db_conf.get("pool_inc", POOL_INCREMENT)
+            )
+            if target != pool.min:
+                logger.info(
+                    f"Autoscaling pool '{name}': min {pool.min} -> {target} "
+                    f"(busy={pool.busy}, opened={pool.opened}, avg wait={avg_wait:.2f}ms)"
+                )
+                pool.reconfigure(min=target)
+        except Exception as e:
+            logger.warning(f"Autoscale failed for '{name}': {e}")
+
+def start_pool_autoscaler():
+    """Starts the background autoscale thread (once per process)."""
+    global _autoscaler_started
+    with _pools_lock:
+        if _autoscaler_started:
+            return
+        _autoscaler_started = True
+
+    def loop():
+        while True:
+            time.sleep(AUTOSCALE_INTERVAL)
+            autoscale_pools()
+
+    threading.Thread(target=loop, name="pool-autoscaler", daemon=True).start()
+    logger.info(f"Pool autoscaler started (interval={AUTOSCALE_INTERVAL}s)")
+
+# ============================================
+# CATALOG SNAPSHOT
+# ============================================
+
+def get_catalog() -> Optional[CatalogStore]:
+    """Opens the on-disk catalog snapshot on first use (None if disabled or unavailable)."""
+    global _catalog
+    if _catalog is None and CATALOG_FILE:
+        with _pools_lock:
+            if _catalog is None:
+                try:
+                    _catalog = CatalogStore(CATALOG_FILE)
+                except Exception as e:
+                    logger.warning(f"Catalog snapshot disabled, cannot open '{CATALOG_FILE}': {e}")
+                    return None
+    return _catalog
+
+def fresh_snapshot_age(catalog: CatalogStore, db_name: str) -> Optional[float]:
+    """
+    Age in seconds of a database's snapshot if it may be served, else None.
+    Idle databases are not refreshed in the background, so snapshots older
+    than CATALOG_MAX_AGE are bypassed in favour of a live query.
+    """
+    age = catalog.snapshot_age(db_name)
+    if age is None or age > CATALOG_MAX_AGE:
+        return None
+    return age
+
+def refresh_catalog(db_name: str) -> int:
+    """
+    Incrementally refreshes the catalog snapshot of one database.
+    Only tables changed since the stored last_ddl_time watermark are re-read;
+    row estimates and the table list are refreshed every time.
+
+    Returns:
+        Number of tables whose detail was re-read.
+    """
+    catalog = get_catalog()
+    if catalog is None:
+        return 0
+    start_time = time.time()
+    previous = catalog.get_watermark(db_name) or datetime.datetime(1900, 1, 1)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SQL_CATALOG_WATERMARK)
+            watermark = cursor.fetchone()[0]
+            cursor.execute(SQL_CATALOG_TABLES)
+            all_tables = cursor.fetchall()
+            cursor.execute(SQL_CATALOG_ALIASES)
+            aliases = cursor.fetchall()
+            cursor.execute(SQL_CATALOG_CHANGED, wm=previous)
+            changed = [r[0] for r in cursor.fetchall()]
+            columns = constraints = indexes = []
+            if changed:
+                cursor.execute(SQL_CATALOG_COLUMNS, wm=previous)
+                columns = cursor.fetchall()
+                cursor.execute(SQL_CATALOG_CONSTRAINTS, wm=previous)
+                constraints = cursor.fetchall()
+                cursor.execute(SQL_CATALOG_INDEXES, wm=previous)
+                indexes = cursor.fetchall()
+        finally:
+            cursor.close()
+    catalog.apply_refresh(db_name, watermark, all_tables, changed, columns, constraints, indexes, aliases)
+    duration = (time.time() - start_time) * 1000
+    logger.info(
+        f"Catalog snapshot for '{db_name}' refreshed in {duration:.2f}ms "
+        f"({len(all_tables)} tables, {len(changed)} changed)"
+    )
+    return len(changed)
+
+def refresh_object_index(db_name: str) -> int:
+    """
+    Reloads the in-memory object index for one database if its object list
+    changed since the last load.
+
+    Returns:
+        Number of names loaded (0 if unchanged).
+    """
+    start_time = time.time()
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SQL_OBJECT_INDEX_SIGNATURE)
+            signature = tuple(cursor.fetchone())
+            if signature == _object_index.signature(db_name):
+                return 0
+            tune_fetch(cursor, fetch_sizing(db_name, bulk=True))
+            cursor.execute(SQL_OBJECT_INDEX_NAMES)
+            count = _object_index.replace(db_name, cursor.fetchall(), signature)
+        finally:
+            cursor.close()
+    duration = (time.time() - start_time) * 1000
+    logger.info(f"Object index for '{db_name}' loaded in {duration:.2f}ms ({count} objects and columns)")
+    return count
+
+def refresh_catalogs(only_open: bool = False):
+    """
+    Refreshes every database's catalog snapshot and object index.
+    With 'only_open', skips databases without an open pool.
+    """
+    for name, conf in list(DATABASES.items()):
+        if not conf or (only_open and name not in _pools):
+            continue
+        try:
+            refresh_catalog(name)
+            if OBJECT_INDEX:
+                refresh_object_index(name)
+        except Exception as e:
+            logger.warning(f"Catalog refresh skipped for '{name}': {e}")
+
+def start_catalog_refresher():
+    """
+    Starts the background catalog and object index refresher (once per process).
+    The first pass covers every database; later passes only databases whose
+    pool is open, so the refresher never keeps idle pools alive.
+    """
+    global _catalog_refresher_started
+    if get_catalog() is None and not OBJECT_INDEX:
+        return
+    with _pools_lock:
+        if _catalog_refresher_started:
+            return
+        _catalog_refresher_started = True
+
+    def loop():
+        refresh_catalogs()
+        while True:
+            time.sleep(CATALOG_REFRESH_INTERVAL)
+            refresh_catalogs(only_open=True)
+
+    threading.Thread(target=loop, name="catalog-refresher", daemon=True).start()
+    logger.info(f"Catalog refresher started (snapshot '{CATALOG_FILE}', refresh every {CATALOG_REFRESH_INTERVAL}s)")
+
+def _warm_up_database(db_name: str, deadline: float):
+    """
+    Opens one database's pool and proves it with a real logon. In thin mode
+    create_pool() returns before any session exists, so one connection is
+    acquired and released, then pool_min sessions are awaited until 'deadline'
+    (a monotonic time).
+    """
+    with get_connection(db_name):
+        pass
+    pool = _pools.get(db_name)
+    while pool is not None and pool.opened < pool.min and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+def warm_up_pools(timeout: float = None) -> Dict[str, str]:
+    """
+    Opens the connection pools of all configured databases concurrently and
+    logs on to each before serving. Initializes the Oracle Client once up front
+    so the first tool call does not pay for client init and logon. Databases
+    whose logon fails or does not finish within the deadline are skipped (they
+    are retried lazily on first use).
+
+    Returns:
+        Mapping of database name to "ready" or the reason it was skipped.
+    """
+    timeout = WARMUP_TIMEOUT if timeout is None else timeout
+    names = [name for name, conf in DATABASES.items() if conf]
+    if not names:
+        return {}
+
+    start_time = time.time()
+    init_oracle_client()
+
+    results: Dict[str, str] = {}
+    executor = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="pool-warmup")
+    deadline = time.monotonic() + timeout
+    futures = {executor.submit(_warm_up_database, name, deadline): name for name in names}
+    # Small grace so a worker that stops polling for pool_min at the deadline still counts
+    done, not_done = wait(futures, timeout=timeout + 0.5)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    for future in done:
+        name = futures[future]
+        error = future.exception()
+        if error:
+            results[name] = f"failed: {error}"
+            logger.warning(f"Warm-up skipped '{name}': {error}")
+        else:
+            results[name] = "ready"
+    for future in not_done:
+        name = futures[future]
+        results[name] = f"timed out after {timeout:.0f}s"
+        logger.warning(f"Warm-up skipped '{name}': no connection within {timeout:.0f}s deadline")
+
+    ready = sum(1 for status in results.values() if status == "ready")
+    duration = (time.time() - start_time) * 1000
+    logger.info(f"Pool warm-up finished in {duration:.2f}ms: {ready}/{len(names)} databases ready")
+    return results
+
+# ============================================
+# FIXED METADATA SQL
+# ============================================
+# Kept as constants so every call sends byte-identical text: the statements
+# are pre-parsed into each new session's statement cache (see init_session).
+
+SQL_USER_TABLE_EXISTS = "SELECT COUNT(*) FROM user_tables WHERE table_name = :tn"
+SQL_ALL_TABLE_EXISTS = "SELECT COUNT(*) FROM all_tables WHERE owner = :o AND table_name = :tn"
+SQL_OBJECT_TYPE = "SELECT object_type FROM user_objects WHERE object_name = :n"
+# Tables and synonyms visible to the session, with the session's schema (one round trip)
+SQL_LOCATE_TABLE = """
+    SELECT owner, 'TABLE', NULL, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA') FROM all_tables
+    WHERE table_name = :tn AND (:o IS NULL OR owner = :o)
+    UNION ALL
+    SELECT owner, 'SYNONYM', table_owner || '.' || table_name, SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')
+    FROM all_synonyms
+    WHERE synonym_name = :tn AND (:o IS NULL OR owner = :o)
+    ORDER BY 1
+"""
+SQL_LIST_TABLES = "SELECT table_name FROM user_tables ORDER BY table_name"
+SQL_DESCRIBE_COLUMNS = """
+    SELECT column_name, data_type, data_length, data_precision, data_scale, nullable, data_default
+    FROM user_tab_columns WHERE table_name = :tn ORDER BY column_id
+"""
+SQL_DESCRIBE_ALL_COLUMNS = SQL_DESCRIBE_COLUMNS.replace("user_tab_columns", "all_tab_columns")
+SQL_CONSTRAINTS = """
+    SELECT c.constraint_name, c.constraint_type, c.search_condition,
+           cc.column_name, c.r_constraint_name
+    FROM user_constraints c
+    JOIN user_cons_columns cc ON c.constraint_name = cc.constraint_name
+    WHERE c.table_name = :tn
+    ORDER BY c.constraint_type, c.constraint_name, cc.position
+"""
+SQL_INDEXES = """
+    SELECT i.index_name, i.index_type, i.uniqueness,
+           LISTAGG(ic.column_name, ', ') WITHIN GROUP (ORDER BY ic.column_position) as columns
+    FROM user_indexes i
+    JOIN user_ind_columns ic ON i.index_name = ic.index_name
+    WHERE i.table_name = :tn
+    GROUP BY i.index_name, i.index_type, i.uniqueness
+"""
+# Batch describe: columns, PK position and comments of many tables in one query.
+# The table filter is appended by describe_tables_sql().
+SQL_DESCRIBE_TABLES = """
+    SELECT c.table_name, c.column_name, c.data_type, c.data_length, c.data_precision, c.data_scale,
+           c.nullable, pk.position, cm.comments, tc.comments
+    FROM user_tab_columns c
+    LEFT JOIN user_col_comments cm ON cm.table_name = c.table_name AND cm.column_name = c.column_name
+    LEFT JOIN user_tab_comments tc ON tc.table_name = c.table_name
+    LEFT JOIN (
+        SELECT k.table_name, kc.column_name, kc.position
+        FROM user_constraints k
+        JOIN user_cons_columns kc ON kc.constraint_name = k.constraint_name
+        WHERE k.constraint_type = 'P'
+    ) pk ON pk.table_name = c.table_name AND pk.column_name = c.column_name
+    WHERE {filter}
+    ORDER BY c.table_name, c.column_id
+"""
+# Name lists are padded to one of these sizes so only a few statement texts exist
+DESCRIBE_TABLES_BUCKETS = (10, 25, 50, 100)
+# Pattern mode: the table list is capped before any column is read
+SQL_DESCRIBE_TABLES_PATTERN = """
+    c.table_name IN (
+        SELECT object_name FROM user_objects
+        WHERE object_type IN ('TABLE', 'VIEW') AND object_name LIKE :pattern
+        ORDER BY object_name FETCH FIRST :max_tables ROWS ONLY
+    )
+"""
+SQL_TEXT_COLUMNS = """
+    SELECT column_name FROM user_tab_columns
+    WHERE table_name = :tn AND data_type IN ('CHAR','VARCHAR2')
+"""
+SQL_MOCK_COLUMNS = "SELECT column_name, data_type, data_length FROM user_tab_columns WHERE table_name = :tn ORDER BY column_id"
+SQL_IMPORT_COLUMNS = "SELECT column_name, data_type, nullable FROM user_tab_columns WHERE table_name=:t"
+SQL_IMPORT_ALL_COLUMNS = "SELECT column_name, data_type, nullable FROM all_tab_columns WHERE owner=:o AND table_name=:t"
+SQL_LAST_DDL_TIME = """
+    SELECT MAX(last_ddl_time) FROM user_objects
+    WHERE object_name = :tn
+       OR object_name IN (SELECT index_name FROM user_indexes WHERE table_name = :tn)
+"""
+SQL_ALL_LAST_DDL_TIME = """
+    SELECT MAX(last_ddl_time) FROM all_objects
+    WHERE owner = :o
+      AND (object_name = :tn
+           OR object_name IN (SELECT index_name FROM all_indexes WHERE table_owner = :o AND table_name = :tn))
+"""
+SQL_INVALID_OBJECTS = """
+    SELECT object_name, object_type, last_ddl_time
+    FROM user_objects
+    WHERE status = 'INVALID'
+    ORDER BY object_type, object_name
+"""
+
+METADATA_STATEMENTS = [
+    SQL_USER_TABLE_EXISTS, SQL_ALL_TABLE_EXISTS, SQL_OBJECT_TYPE, SQL_LIST_TABLES,
+    SQL_DESCRIBE_COLUMNS, SQL_DESCRIBE_ALL_COLUMNS, SQL_CONSTRAINTS, SQL_INDEXES,
+    SQL_TEXT_COLUMNS, SQL_MOCK_COLUMNS, SQL_IMPORT_COLUMNS, SQL_IMPORT_ALL_COLUMNS,
+    SQL_INVALID_OBJECTS, SQL_LAST_DDL_TIME, SQL_ALL_LAST_DDL_TIME, SQL_LOCATE_TABLE,
+]
+
+# Catalog snapshot refresh: set-based, only tables whose (or whose indexes')
+# last_ddl_time reached the previous watermark
+SQL_CATALOG_WATERMARK = "SELECT MAX(last_ddl_time) FROM user_objects WHERE object_type IN ('TABLE', 'INDEX')"
+SQL_CATALOG_TABLES = "SELECT table_name, num_rows FROM user_tables"
+SQL_CATALOG_ALIASES = """
+    SELECT t.table_name, s.owner, 'SYNONYM', s.table_owner || '.' || s.table_name
+    FROM user_tables t JOIN all_synonyms s ON s.synonym_name = t.table_name
+    UNION ALL
+    SELECT t.table_name, a.owner, 'TABLE', NULL
+    FROM user_tables t JOIN all_tables a ON a.table_name = t.table_name
+    WHERE a.owner <> SYS_CONTEXT('USERENV', 'CURRENT_SCHEMA')
+"""
+SQL_CATALOG_CHANGED = """
+    SELECT o.object_name FROM user_objects o
+    WHERE o.object_type = 'TABLE' AND o.last_ddl_time >= :wm
+    UNION
+    SELECT i.table_name FROM user_indexes i
+    JOIN user_objects o ON o.object_name = i.index_name AND o.object_type = 'INDEX'
+    WHERE o.last_ddl_time >= :wm
+"""
+SQL_CATALOG_COLUMNS = f"""
+    SELECT table_name, column_id, column_name, data_type, data_length, data_precision, data_scale, nullable
+    FROM user_tab_columns WHERE table_name IN ({SQL_CATALOG_CHANGED})
+"""
+SQL_CATALOG_CONSTRAINTS = f"""
+    SELECT c.table_name, c.constraint_name, c.constraint_type, cc.column_name, cc.position, c.r_constraint_name
+    FROM user_constraints c
+    JOIN user_cons_columns cc ON c.constraint_name = cc.constraint_name
+    WHERE c.constraint_type IN ('P', 'R', 'U') AND c.table_name IN ({SQL_CATALOG_CHANGED})
+"""
+SQL_CATALOG_INDEXES = f"""
+    SELECT i.table_name, i.index_name, i.uniqueness,
+           LISTAGG(ic.column_name, ', ') WITHIN GROUP (ORDER BY ic.column_position)
+    FROM user_indexes i
+    JOIN user_ind_columns ic ON i.index_name = ic.index_name
+    WHERE i.table_name IN ({SQL_CATALOG_CHANGED})
+    GROUP BY i.table_name, i.index_name, i.uniqueness
+"""
+
+# Object index: names of searchable objects and columns. The signature
+# changes on any DDL, create or drop, so unchanged schemas are not reloaded.
+SQL_OBJECT_INDEX_SIGNATURE = "SELECT MAX(last_ddl_time), COUNT(*) FROM user_objects"
+SQL_OBJECT_INDEX_NAMES = """
+    SELECT object_name, object_type, NULL FROM user_objects
+    WHERE object_type IN ('TABLE', 'VIEW', 'MATERIALIZED VIEW', 'SYNONYM', 'SEQUENCE',
+                          'PROCEDURE', 'FUNCTION', 'PACKAGE', 'TRIGGER', 'TYPE')
+    UNION ALL
+    SELECT column_name, 'COLUMN', table_name FROM user_tab_columns
+"""
+
 # ============================================
 # SECURITY & VALIDATION UTILITIES
 # ============================================
@@ -144,23 +1132,225 @@ def validate_identifier(name: str) -> bool:
     pattern = r'^[A-Za-z][A-Za-z0-9_$#\.]*$' 
     return bool(re.match(pattern, name)) and len(name) <= 128
 
-def check_table_exists(cursor, table_name: str) -> bool:
-    """Checks if a table exists."""
-    # Handle Schema.Table format
-    owner = None
+def split_table_name(table_name: str) -> Tuple[Optional[str], str]:
+    """Splits 'SCHEMA.TABLE' into (owner, name), upper-cased. Owner is None if absent."""
     if "." in table_name:
         parts = table_name.split(".")
-        owner = parts[0].upper()
-        name = parts[1].upper()
+        return parts[0].upper(), parts[1].upper()
+    return None, table_name.upper()
+
+def _last_ddl_time(cursor, owner: Optional[str], name: str):
+    """Latest DDL time of a table and its indexes (None if it does not exist)."""
+    if owner:
+        cursor.execute(SQL_ALL_LAST_DDL_TIME, o=owner, tn=name)
     else:
-        name = table_name.upper()
+        cursor.execute(SQL_LAST_DDL_TIME, tn=name)
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+_UNSET = object()
+
+def cached_metadata(cursor, database_name: Optional[str], table_name: str, sql: str, **binds) -> List[Tuple]:
+    """
+    Runs a fixed metadata query about one table through the metadata cache.
+    Within METADATA_CACHE_TTL seconds repeat calls are answered without a
+    round trip. After that, the table's last_ddl_time is compared (one cheap
+    query) and cached results are kept only if the table has not changed.
+    """
+    if not METADATA_CACHE_TTL:
+        cursor.execute(sql, **binds)
+        return cursor.fetchall()
+
+    owner, name = split_table_name(table_name)
+    key = (database_name or GLOBAL_CONFIG["default_db"], owner or "", name)
+    now = time.monotonic()
+    entry = _metadata_cache.get(key)
+    ddl_time = _UNSET
+    if entry is not None and now - entry["checked_at"] >= METADATA_CACHE_TTL:
+        ddl_time = _last_ddl_time(cursor, owner, name)
+        if ddl_time == entry["ddl_time"]:
+            entry["checked_at"] = now
+        else:
+            logger.debug(f"Metadata cache: DDL change detected for {key}, refreshing")
+            entry = None
+    if entry is None:
+        if ddl_time is _UNSET:
+            ddl_time = _last_ddl_time(cursor, owner, name)
+        entry = {"ddl_time": ddl_time, "checked_at": now, "data": {}}
+        _metadata_cache.put(key, entry)
+
+    query_key = (sql, tuple(sorted(binds.items())))
+    rows = entry["data"].get(query_key)
+    if rows is None:
+        cursor.execute(sql, **binds)
+        rows = cursor.fetchall()
+        entry["data"][query_key] = rows
+    return rows
+
+def invalidate_metadata_cache(database_name: Optional[str] = None) -> int:
+    """Drops cached metadata for one database (or all). Returns the number of tables dropped."""
+    if database_name is None:
+        return _metadata_cache.invalidate()
+    return _metadata_cache.invalidate(lambda key: key[0] == database_name)
+
+def check_table_exists(cursor, table_name: str, database_name: Optional[str] = None) -> bool:
+    """Checks if a table exists."""
+    # Handle Schema.Table format
+    owner, name = split_table_name(table_name)
 
     if owner:
-         cursor.execute("SELECT COUNT(*) FROM all_tables WHERE owner = :o AND table_name = :tn", o=owner, tn=name)
+        rows = cached_metadata(cursor, database_name, table_name, SQL_ALL_TABLE_EXISTS, o=owner, tn=name)
     else:
-         cursor.execute("SELECT COUNT(*) FROM user_tables WHERE table_name = :tn", tn=name)
-         
-    return cursor.fetchone()[0] > 0
+        rows = cached_metadata(cursor, database_name, table_name, SQL_USER_TABLE_EXISTS, tn=name)
+
+    return rows[0][0] > 0
+
+# Errors raised when a call exceeds connection.call_timeout, or is cancelled
+CALL_TIMEOUT_ERRORS = ("DPY-4024", "ORA-03156", "DPI-1067")
+CANCEL_ERRORS = ("ORA-01013", "DPY-4008")
+
+class QueryInterruptedError(Exception):
+    """Raised when a tracked call times out or is cancelled through cancel_query."""
+
+class InFlightRequest:
+    """A database call in progress that cancel_query can interrupt."""
+
+    def __init__(self, conn, db_name: str, sql: str, timeout_ms: int):
+        self.request_id = uuid.uuid4().hex[:8]
+        self.conn = conn
+        self.db_name = db_name
+        self.sql = sql
+        self.timeout_ms = timeout_ms
+        self.started = time.monotonic()
+        self.cancelled = False
+
+def resolve_call_timeout(database_name: Optional[str], timeout_ms: Optional[int]) -> int:
+    """Per-call timeout_ms, else the database's 'call_timeout_ms' (0 = no limit)."""
+    if timeout_ms is not None:
+        return max(0, int(timeout_ms))
+    db_conf = DATABASES.get(database_name or GLOBAL_CONFIG["default_db"]) or {}
+    return db_conf.get("call_timeout_ms", CALL_TIMEOUT_MS)
+
+@contextmanager
+def tracked_call(conn, database_name: Optional[str], sql: str, timeout_ms: Optional[int] = None):
+    """
+    Runs database calls under connection.call_timeout and registers them for
+    cancel_query. The pooled connection's timeout is reset on exit. Timeouts
+    and cancellations are re-raised as QueryInterruptedError.
+    """
+    req = InFlightRequest(conn, database_name or GLOBAL_CONFIG["default_db"], sql,
+                          resolve_call_timeout(database_name, timeout_ms))
+    conn.call_timeout = req.timeout_ms
+    with _inflight_lock:
+        _inflight[req.request_id] = req
+    try:
+        yield req
+    except oracledb.Error as e:
+        message = str(e)
+        if req.cancelled or any(code in message for code in CANCEL_ERRORS):
+            raise QueryInterruptedError(f"Query {req.request_id} was cancelled.") from e
+        if any(code in message for code in CALL_TIMEOUT_ERRORS):
+            logger.warning(f"Query {req.request_id} on '{req.db_name}' exceeded call_timeout={req.timeout_ms}ms")
+            raise QueryInterruptedError(
+                f"Query {req.request_id} timed out after {req.timeout_ms}ms (call_timeout). "
+                f"Narrow the query or pass a larger timeout_ms."
+            ) from e
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(req.request_id, None)
+        try:
+            conn.call_timeout = 0
+        except Exception:
+            pass
+
+def fetch_sizing(database_name: Optional[str], expected_rows: Optional[int] = None,
+                 bulk: bool = False) -> Tuple[int, int]:
+    """
+    Chooses (arraysize, prefetchrows) for a cursor from the rows a tool expects.
+    - expected_rows: small, known result (lookups, one page). The rows and the
+      end-of-fetch marker come back with the execute, in a single round trip.
+    - bulk: exports and full scans use the database's 'export_arraysize'.
+    - otherwise: unknown size, use the database's 'max_arraysize'.
+    """
+    db_conf = DATABASES.get(database_name or GLOBAL_CONFIG["default_db"]) or {}
+    max_size = db_conf.get("max_arraysize", MAX_ARRAYSIZE)
+    if bulk:
+        size = db_conf.get("export_arraysize", EXPORT_ARRAYSIZE)
+        return size, size
+    if expected_rows is not None and expected_rows < max_size:
+        return max(expected_rows, 1), expected_rows + 1
+    return max_size, max_size
+
+def tune_fetch(cursor, sizing: Tuple[int, int]):
+    """Applies fetch_sizing() to a cursor (must be called before execute)."""
+    cursor.arraysize, cursor.prefetchrows = sizing
+
+def estimate_round_trips(rows_fetched: int, sizing: Tuple[int, int]) -> int:
+    """Round trips for execute + fetch: prefetched rows ride on the execute, the rest come 'arraysize' at a time."""
+    arraysize, prefetchrows = sizing
+    remaining = rows_fetched + 1 - prefetchrows  # +1: the fetch that detects the end
+    return 1 + max(0, -(-remaining // arraysize))
+
+def normalize_sql(sql: str) -> str:
+    """Collapses whitespace outside string literals and drops a trailing ';' (cache key form)."""
+    parts = re.split(r"('(?:[^']|'')*')", sql.strip().rstrip(";"))
+    return "".join(part if i % 2 else re.sub(r"\s+", " ", part) for i, part in enumerate(parts)).strip()
+
+BindParams = Optional[Union[Dict[str, Any], List[Any], str]]
+
+def parse_bind_params(params: BindParams) -> Union[Dict[str, Any], List[Any]]:
+    """
+    Normalizes the 'params' tool argument into cursor.execute() binds.
+    Accepts a dict (named :binds), a list (positional :1, :2...) or the same as a JSON string.
+    Raises ValueError for anything else.
+    """
+    if params is None or params == "":
+        return {}
+    if isinstance(params, str):
+        try:
+            params = json.loads(params)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"'params' is not valid JSON: {e}")
+    if isinstance(params, dict):
+        return {str(k).lstrip(":"): v for k, v in params.items()}
+    if isinstance(params, list):
+        return params
+    raise ValueError("'params' must be a JSON object (named binds) or list (positional binds).")
+
+def bind_key(binds: Union[Dict[str, Any], List[Any]]) -> str:
+    """Hashable, order-independent form of bind values for cache keys."""
+    return json.dumps(binds, sort_keys=True, default=str)
+
+def cached_result(database_name: Optional[str], key: Tuple, loader, use_cache: bool = True) -> Tuple[Any, Optional[float]]:
+    """
+    Returns loader() through the read-only result cache.
+    Only used if the database has 'result_cache' enabled and the caller did
+    not opt out. The cache key is prefixed with the resolved database name.
+
+    Returns:
+        (value, age in seconds) - age is None when the value was just loaded.
+    """
+    db_name = database_name or GLOBAL_CONFIG["default_db"]
+    db_conf = DATABASES.get(db_name) or {}
+    if not use_cache or not db_conf.get("result_cache"):
+        return loader(), None
+
+    full_key = (db_name,) + key
+    hit = _result_cache.get(full_key)
+    if hit is not None:
+        return hit
+    value = loader()
+    _result_cache.put(full_key, value, len(repr(value)), db_conf.get("result_cache_ttl", 0))
+    return value, None
+
+def invalidate_result_cache(database_name: Optional[str] = None) -> int:
+    """Drops cached query results for one database (or all) after a write."""
+    if database_name is None:
+        return _result_cache.invalidate()
+    return _result_cache.invalidate(lambda key: key[0] == database_name)
+
+DDL_KEYWORDS = ("CREATE", "ALTER", "DROP", "TRUNCATE", "RENAME", "COMMENT", "GRANT", "REVOKE")
 
 def check_dangerous_query(query: str) -> Optional[str]:
     """Checks for dangerous keywords."""
@@ -173,7 +1363,7 @@ def check_dangerous_query(query: str) -> Optional[str]:
 def get_object_type(cursor, object_name: str) -> Optional[str]:
     """Helper to detect object type."""
     try:
-        cursor.execute("SELECT object_type FROM user_objects WHERE object_name = :n", n=object_name.upper())
+        cursor.execute(SQL_OBJECT_TYPE, n=object_name.upper())
         row = cursor.fetchone()
         return row[0] if row else None
     except:
@@ -205,7 +1395,7 @@ def format_bytes(size_bytes: int) -> str:
 # DISCOVERY & MULTI-DB TOOLS
 # ============================================
 
-@mcp.tool()
+@threaded_tool()
 def list_databases() -> str:
     """
     Lists all configured database connections. 
@@ -215,51 +1405,281 @@ def list_databases() -> str:
         return "No databases configured."
     
     result = "## Configured Databases\n\n"
-    result += "| Name | User | DSN | Status |\n|---|---|---|---|\n"
+    result += "| Name | User | DSN | Status | Circuit |\n|---|---|---|---|---|\n"
     
     for name, conf in DATABASES.items():
         status = "Active" if name in _pools else "Idle"
-        result += f"| **{name}** | {conf['user']} | {conf['dsn']} | {status} |\n"
+        breaker = _breakers.get(name)
+        circuit = breaker.state if breaker else CircuitBreaker.CLOSED
+        if breaker and breaker.state != CircuitBreaker.CLOSED:
+            circuit += f" ({breaker.failures} failures)"
+        result += f"| **{name}** | {conf.get('user')} | {conf.get('dsn')} | {status} | {circuit} |\n"
         
     result += f"\n**Default Database**: `{GLOBAL_CONFIG['default_db']}`"
     return result
 
-@mcp.tool()
-def locate_table(table_name: str) -> str:
+def _locate_in_database(db_name: str, table_name: str) -> List[str]:
+    """
+    Returns where 'table_name' is visible in one database: own tables,
+    other schemas' tables (all_tables) and synonyms.
+    """
+    owner, name = split_table_name(table_name)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(SQL_LOCATE_TABLE, tn=name, o=owner)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+    return [describe_location(row_owner, kind, target, name, current_schema)
+            for row_owner, kind, target, current_schema in rows]
+
+def describe_location(owner: str, kind: str, target: Optional[str], name: str, current_schema: str) -> str:
+    """Formats one locate_table hit (own table, other schema's table or synonym)."""
+    if kind == "SYNONYM":
+        label = "public synonym" if owner == "PUBLIC" else f"synonym {owner}.{name}"
+        return f"{label} -> {target}"
+    if owner == current_schema:
+        return "own table"
+    return f"table {owner}.{name}"
+
+@threaded_tool()
+def locate_table(table_name: str, timeout: float = None) -> str:
+    """
+    Global Search: Finds which database(s) contain a specific table.
+    CRITICAL: ALWAYS run this first if you are unsure which database to query.
+    All databases are searched concurrently (own tables, other schemas and
+    synonyms). Databases that do not answer within 'timeout' seconds are
+    listed as unreachable instead of delaying the answer.
+    """
+    if not validate_identifier(table_name):
+        return "Error: Invalid table name."
+
+    timeout = LOCATE_TIMEOUT if timeout is None else timeout
+    start_time = time.time()
+    found: Dict[str, List[str]] = {}
+    unreachable: Dict[str, str] = {}
+    catalog = get_catalog()
+    snapshot = catalog.locate(table_name) if catalog is not None and "." not in table_name else {}
+    from_snapshot = []
+
+    live = []
+    for db_name, conf in DATABASES.items():
+        if not conf:
+            continue
+        hit = snapshot.get(db_name)
+        if hit and hit["age"] <= CATALOG_MAX_AGE:
+            # Own table confirmed by the on-disk catalog snapshot, which also
+            # records its synonyms and same-named tables in other schemas
+            from_snapshot.append(db_name)
+            found[db_name] = ["own table"] + [
+                describe_location(owner, kind, target, table_name.upper(), None)
+                for owner, kind, target in hit["aliases"]
+            ]
+        else:
+            live.append(db_name)
+
+    if live:
+        executor = ThreadPoolExecutor(max_workers=len(live), thread_name_prefix="locate")
+        futures = {executor.submit(_locate_in_database, name, table_name): name for name in live}
+        done, not_done = wait(futures, timeout=timeout)
+        executor.shutdown(wait=False, cancel_futures=True)
+        for future in done:
+            name = futures[future]
+            error = future.exception()
+            if error:
+                unreachable[name] = str(error).splitlines()[0]
+            elif future.result():
+                found[name] = future.result()
+        for future in not_done:
+            unreachable[futures[future]] = f"timed out after {timeout:g}s"
+
+    duration = (time.time() - start_time) * 1000
+    logger.info(
+        f"locate_table '{table_name}': {len(found)} found, {len(unreachable)} unreachable "
+        f"in {duration:.2f}ms"
+    )
+
+    matches = sorted(found)
+    details = "".join(f"\n- **{name}**: {', '.join(found[name])}" for name in matches)
+    note = ""
+    if unreachable:
+        note += "\n\n**Timed out / unreachable** (result may be incomplete):"
+        note += "".join(f"\n- `{name}`: {reason}" for name, reason in sorted(unreachable.items()))
+    if from_snapshot:
+        note += f"\n\n*Answered from catalog snapshot for: {', '.join(sorted(from_snapshot))}.*"
+
+    if not matches:
+        return f"❌ Table `{table_name}` NOT found in any connected databases." + note
+
+    if len(matches) == 1:
+        return f"✅ **FOUND**: Table `{table_name}` is unique to database **`{matches[0]}`**.{details}\nYou should proceed using `database_name='{matches[0]}'`." + note
+
+    return f"⚠️ **AMBIGUOUS**: Table `{table_name}` found in **MULTIPLE** databases: `{', '.join(matches)}`.{details}\n\n**PROTOCOL**: You MUST ask the user which database they want to use." + note
+
+@threaded_tool()
+def find_objects(name: str, object_types: str = None, database_name: str = None, limit: int = 20) -> str:
     """
-    Global Search: Finds which database(s) contain a specific table.
-    CRITICAL: ALWAYS run this first if you are unsure which database to query.
+    Fuzzy Search: Finds tables, views, synonyms, columns and PL/SQL objects
+    whose name resembles 'name' (e.g. CUSTOMER finds CUSTOMERS, CUST_MASTER)
+    across all databases, ranked by similarity. Answered from an in-memory
+    index without querying any database.
+
+    Args:
+        name: Full or partial object name.
+        object_types: Optional comma-separated filter (e.g. "TABLE,VIEW,COLUMN").
+        database_name: Optional database to restrict the search to.
+        limit: Maximum number of names to return.
     """
-    if not validate_identifier(table_name):
-        return "Error: Invalid table name."
-        
-    matches = []
-    
-    # Iterate through all configured databases
-    for db_name in DATABASES.keys():
+    if not OBJECT_INDEX:
+        return "Error: Object index is disabled (object_index = false)."
+    if not re.match(r'^[A-Za-z0-9_$# ]+$', name or ""):
+        return "Error: Invalid object name pattern."
+
+    types = {t.strip().upper() for t in object_types.split(",")} if object_types else None
+    databases = {database_name} if database_name else None
+    start_time = time.time()
+    results = _object_index.search(name, limit=max(1, min(limit, 200)), types=types, databases=databases)
+    duration = (time.time() - start_time) * 1000
+
+    missing = [db for db, conf in DATABASES.items() if conf and _object_index.signature(db) is None]
+    note = ""
+    if missing:
+        note = f"\n\n*Not indexed yet (refresh pending or unreachable): {', '.join(missing)}.*"
+
+    if not results:
+        return f"No objects resembling `{name}` found ({len(_object_index)} names indexed, {duration:.1f}ms)." + note
+
+    result = f"## Objects resembling `{name}` ({len(results)} names, {duration:.1f}ms)\n\n"
+    result += "| Name | Score | Database | Type | Table |\n|---|---|---|---|---|\n"
+    for match in results:
+        for db, obj_type, parent in match["occurrences"]:
+            result += f"| {match['name']} | {match['score']:.2f} | {db} | {obj_type} | {parent or ''} |\n"
+    return result + note
+
+def _query_one_database(db_name: str, sql_query: str, binds: Union[Dict[str, Any], List[Any]],
+                        timeout_ms: Optional[int], max_rows: int) -> Tuple[List[str], List[Tuple], float]:
+    """Runs one read-only query on one database. Returns (columns, rows, latency in ms)."""
+    start_time = time.time()
+    sizing = fetch_sizing(db_name, max_rows + 1)
+    with get_connection(db_name) as conn:
+        cursor = conn.cursor()
         try:
-            with get_connection(db_name) as conn:
-                cursor = conn.cursor()
-                if check_table_exists(cursor, table_name):
-                    matches.append(db_name)
-                cursor.close()
-        except Exception:
-            # Ignore connection errors during discovery
-            pass
-            
-    if not matches:
-        return f"❌ Table `{table_name}` NOT found in any connected databases."
-    
-    if len(matches) == 1:
-        return f"✅ **FOUND**: Table `{table_name}` is unique to database **`{matches[0]}`**.\nYou should proceed using `database_name='{matches[0]}'`."
-    
-    return f"⚠️ **AMBIGUOUS**: Table `{table_name}` found in **MULTIPLE** databases: `{', '.join(matches)}`.\n\n**PROTOCOL**: You MUST ask the user which database they want to use."
+            tune_fetch(cursor, sizing)
+            with tracked_call(conn, db_name, sql_query, timeout_ms):
+                cursor.execute(sql_query, binds)
+                if not cursor.description:
+                    raise ValueError("Query returned no result set.")
+                columns = [col[0] for col in cursor.description]
+                rows = cursor.fetchmany(max_rows + 1)
+        finally:
+            cursor.close()
+    latency = (time.time() - start_time) * 1000
+    query_logger.log_query(sql_query, latency, len(rows), bind_count=len(binds),
+                           round_trips=estimate_round_trips(len(rows), sizing))
+    return columns, rows, latency
+
+@threaded_tool()
+def run_query_on_databases(sql_query: str, databases: Union[List[str], str] = "*", params: BindParams = None,
+                           timeout_ms: int = None, max_rows_per_database: int = None) -> str:
+    """
+    Runs the same READ-ONLY query on several databases at once and merges the
+    results with a leading DATABASE column, plus a per-database latency/error
+    summary. Wall time is that of the slowest database, not the sum.
+
+    Args:
+        sql_query: SELECT (or WITH) query; every database must return the same columns.
+        databases: List of database names, a comma-separated string, or "*" for all.
+        params: Optional bind variables (JSON object for :name binds, list for :1, :2).
+        timeout_ms: Per-database time limit (default: each database's call_timeout_ms,
+            or LOCATE_TIMEOUT seconds where that is 0).
+        max_rows_per_database: Rows shown per database (default and max MAX_ROWS_DISPLAY).
+    """
+    error = check_read_only_query(sql_query)
+    if error:
+        return error
+    try:
+        binds = parse_bind_params(params)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    configured = [name for name, conf in DATABASES.items() if conf]
+    if databases == "*" or databases == ["*"] or not databases:
+        names = configured
+    else:
+        names = [d.strip() for d in databases.split(",")] if isinstance(databases, str) else list(databases)
+        unknown = [d for d in names if d not in configured]
+        if unknown:
+            return f"Error: Unknown database(s): {', '.join(unknown)}. Use list_databases."
+    max_rows = max(1, min(max_rows_per_database or MAX_ROWS_DISPLAY, MAX_ROWS_DISPLAY))
+
+    # call_timeout bounds each database call (LOCATE_TIMEOUT where none is configured,
+    # so one hung database cannot stall the merge); the wall deadline also covers
+    # each database's own pool acquire timeout
+    timeouts = {name: resolve_call_timeout(name, timeout_ms) or int(LOCATE_TIMEOUT * 1000) for name in names}
+    deadline = max(
+        (timeouts[name] / 1000 + DATABASES[name].get("acquire_timeout", POOL_ACQUIRE_TIMEOUT) for name in names),
+        default=0
+    )
+
+    start_time = time.time()
+    executor = ThreadPoolExecutor(max_workers=max(len(names), 1), thread_name_prefix="multi-db")
+    futures = {executor.submit(_query_one_database, name, sql_query, binds, timeouts[name], max_rows): name
+               for name in names}
+    done, not_done = wait(futures, timeout=deadline)
+    executor.shutdown(wait=False, cancel_futures=True)
+    wall = (time.time() - start_time) * 1000
+
+    results: Dict[str, Tuple[List[str], List[Tuple], float]] = {}
+    errors: Dict[str, str] = {}
+    for future in done:
+        name = futures[future]
+        if future.exception():
+            errors[name] = str(future.exception()).splitlines()[0]
+        else:
+            results[name] = future.result()
+    for future in not_done:
+        errors[futures[future]] = f"no answer within {deadline:.0f}s"
+
+    # Merge result sets that agree on the column list of the first successful database
+    merged_columns = None
+    merged_rows = []
+    truncated = []
+    for name in sorted(results):
+        columns, rows, _ = results[name]
+        if merged_columns is None:
+            merged_columns = columns
+        elif columns != merged_columns:
+            errors[name] = f"column mismatch: {', '.join(columns)}"
+            continue
+        if len(rows) > max_rows:
+            rows = rows[:max_rows]
+            truncated.append(name)
+        merged_rows.extend((name,) + tuple(row) for row in rows)
+
+    result = f"## Results from {len(names)} databases ({wall:.0f}ms wall)\n\n"
+    if merged_columns is not None and merged_rows:
+        result += format_as_markdown_table(["DATABASE"] + merged_columns, merged_rows)
+    else:
+        result += "No results."
+    if truncated:
+        result += f"\n\n*Showing first {max_rows} rows for: {', '.join(truncated)}.*"
+
+    result += "\n\n### Summary\n\n| Database | Status | Rows | Latency |\n|---|---|---|---|\n"
+    for name in sorted(names):
+        if name in errors:
+            result += f"| {name} | ❌ {errors[name]} | - | - |\n"
+        else:
+            _, rows, latency = results[name]
+            result += f"| {name} | ✅ ok | {min(len(rows), max_rows)}{'+' if len(rows) > max_rows else ''} | {latency:.0f}ms |\n"
+    return result
 
 # ============================================
 # BASIC DATABASE TOOLS
 # ============================================
 
-@mcp.tool()
+@threaded_tool()
 def list_tables(database_name: str = None) -> str:
     """Lists all tables in the specified database (or default)."""
     start_time = time.time()
@@ -267,7 +1687,8 @@ def list_tables(database_name: str = None) -> str:
         with get_connection(database_name) as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute("SELECT table_name FROM user_tables ORDER BY table_name")
+                tune_fetch(cursor, fetch_sizing(database_name))
+                cursor.execute(SQL_LIST_TABLES)
                 tables = [row[0] for row in cursor.fetchall()]
                 duration = (time.time() - start_time) * 1000
                 
@@ -280,73 +1701,158 @@ def list_tables(database_name: str = None) -> str:
     except Exception as e:
         return f"Error listing tables: {str(e)}"
 
-@mcp.tool()
+def format_column_type(data_type: str, length, precision, scale) -> str:
+    """Formats an Oracle column type the way describe_table shows it."""
+    if data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
+        return f"{data_type}({length})"
+    if data_type == 'NUMBER' and precision:
+        return f"NUMBER({precision},{scale or 0})"
+    return data_type
+
+def format_table_schema(table_name: str, database_name: Optional[str], columns: List[Tuple]) -> str:
+    """Formats describe_table output from (name, type, length, precision, scale, nullable, default) rows."""
+    result = f"## Schema for `{table_name.upper()}` (DB: {database_name or 'Default'})\n\n"
+    result += f"| {'Column':<30} | {'Type':<20} | {'Nullable':<8} |\n"
+    result += f"|{'-'*31}|{'-'*21}|{'-'*9}|\n"
+    for col in columns:
+        col_name, data_type, length, precision, scale, nullable, default = col
+        type_str = format_column_type(data_type, length, precision, scale)
+        result += f"| {col_name:<30} | {type_str:<20} | {nullable:<8} |\n"
+    return result
+
+@threaded_tool()
 def describe_table(table_name: str, database_name: str = None) -> str:
     """Gets the schema/structure of a table. Optional: specify database."""
     if not validate_identifier(table_name):
         return "Error: Invalid table name format."
+
+    catalog = get_catalog()
+    db_key = database_name or GLOBAL_CONFIG["default_db"]
+    if catalog is not None and "." not in table_name:
+        age = fresh_snapshot_age(catalog, db_key)
+        snapshot = catalog.get_table(db_key, table_name) if age is not None else None
+        if snapshot:
+            result = format_table_schema(table_name, database_name, snapshot["columns"])
+            return result + f"\n*From catalog snapshot ({age:.0f}s old, ~{snapshot['num_rows'] or 0:,} rows).*"
+
     try:
         with get_connection(database_name) as conn:
             cursor = conn.cursor()
             try:
-                if not check_table_exists(cursor, table_name):
+                if not check_table_exists(cursor, table_name, database_name):
                     return f"Table '{table_name}' not found in database '{database_name or 'Default'}'."
                 
                 # Check column metadata
-                query = """
-                    SELECT column_name, data_type, data_length, data_precision, data_scale, nullable, data_default
-                    FROM user_tab_columns WHERE table_name = :tn ORDER BY column_id
-                """
+                query = SQL_DESCRIBE_COLUMNS
                 # Handle schema prefix if present for query execution? 
                 # user_tab_columns only shows current schema. If table_name has schema prefix (HR.EMP), we need all_tab_columns
                 if "." in table_name:
-                    query = query.replace("user_tab_columns", "all_tab_columns")
+                    query = SQL_DESCRIBE_ALL_COLUMNS
                     # We also need to owner filter, but keeping it simple for now or rely on synonym/grants
                     # For robust fix:
                     parts = table_name.split(".")
                     # Ideally we filter by owner. But let's stick to standard usage first.
                 
-                cursor.execute(query, tn=table_name.split(".")[-1].upper())
-                columns = cursor.fetchall()
-                
-                result = f"## Schema for `{table_name.upper()}` (DB: {database_name or 'Default'})\n\n"
-                result += f"| {'Column':<30} | {'Type':<20} | {'Nullable':<8} |\n"
-                result += f"|{'-'*31}|{'-'*21}|{'-'*9}|\n"
-                for col in columns:
-                    col_name, data_type, length, precision, scale, nullable, default = col
-                    if data_type in ('VARCHAR2', 'CHAR', 'NVARCHAR2', 'NCHAR'):
-                        type_str = f"{data_type}({length})"
-                    elif data_type == 'NUMBER' and precision:
-                        type_str = f"NUMBER({precision},{scale or 0})"
-                    else:
-                        type_str = data_type
-                    result += f"| {col_name:<30} | {type_str:<20} | {nullable:<8} |\n"
-                return result
+                columns = cached_metadata(cursor, database_name, table_name, query,
+                                          tn=table_name.split(".")[-1].upper())
+                return format_table_schema(table_name, database_name, columns)
             finally:
                 cursor.close()
     except Exception as e:
         return f"Error describing table: {str(e)}"
 
+def describe_tables_sql(names: List[str]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Builds the batch describe statement and binds for a list of table names.
+    The list is padded with NULLs to the next bucket size.
+    """
+    size = next(b for b in DESCRIBE_TABLES_BUCKETS if b >= len(names))
+    padded = [n.upper() for n in names] + [None] * (size - len(names))
+    binds = {f"t{i}": name for i, name in enumerate(padded)}
+    placeholders = ", ".join(f":t{i}" for i in range(size))
+    return SQL_DESCRIBE_TABLES.format(filter=f"c.table_name IN ({placeholders})"), binds
+
+@threaded_tool()
+def describe_tables(table_names: List[str] = None, pattern: str = None, database_name: str = None) -> str:
+    """
+    Batch describe: columns, primary keys and comments of many tables in a
+    single query. Use instead of calling describe_table repeatedly.
+
+    Args:
+        table_names: List of table names in the current schema (max 100).
+        pattern: Alternatively, a LIKE pattern such as 'ORDER%' (max 100 tables returned).
+        database_name: Optional database.
+    """
+    max_tables = DESCRIBE_TABLES_BUCKETS[-1]
+    if bool(table_names) == bool(pattern):
+        return "Error: Provide either 'table_names' or 'pattern'."
+    if table_names:
+        if len(table_names) > max_tables:
+            return f"Error: At most {max_tables} tables per call."
+        invalid = [t for t in table_names if not validate_identifier(t) or "." in t]
+        if invalid:
+            return f"Error: Invalid table name(s): {', '.join(invalid)}"
+        sql, binds = describe_tables_sql(table_names)
+    else:
+        if not re.match(r'^[A-Za-z0-9_$#%]+$', pattern):
+            return "Error: Invalid pattern. Use letters, digits, _, $, # and %."
+        sql = SQL_DESCRIBE_TABLES.format(filter=SQL_DESCRIBE_TABLES_PATTERN)
+        # One extra table tells us the pattern matched more than we show
+        binds = {"pattern": pattern.upper(), "max_tables": max_tables + 1}
+
+    start_time = time.time()
+    try:
+        with get_connection(database_name) as conn:
+            cursor = conn.cursor()
+            try:
+                tune_fetch(cursor, fetch_sizing(database_name))
+                cursor.execute(sql, **binds)
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+    except Exception as e:
+        return f"Error describing tables: {str(e)}"
+    duration = (time.time() - start_time) * 1000
+
+    tables: Dict[str, List[Tuple]] = {}
+    for row in rows:
+        tables.setdefault(row[0], []).append(row)
+    truncated = len(tables) > max_tables
+    names = sorted(tables)[:max_tables]
+
+    result = f"## {len(names)} tables (DB: {database_name or 'Default'}, {duration:.0f}ms)\n"
+    for name in names:
+        table_comment = tables[name][0][9]
+        result += f"\n### {name}" + (f" -- {table_comment}" if table_comment else "") + "\n"
+        for _, col, data_type, length, precision, scale, nullable, pk_pos, comment, _ in tables[name]:
+            line = f"- {col} {format_column_type(data_type, length, precision, scale)}"
+            if pk_pos:
+                line += " PK"
+            if nullable == "N":
+                line += " NOT NULL"
+            if comment:
+                line += f" -- {comment}"
+            result += line + "\n"
+
+    if table_names:
+        missing = sorted({t.upper() for t in table_names} - set(tables))
+        if missing:
+            result += f"\n**Not found**: {', '.join(missing)}\n"
+    if truncated:
+        result += f"\n*Pattern matched more than {max_tables} tables; narrow it to see the rest.*\n"
+    return result
+
 # ============================================
 # ADVANCED INSPECTION TOOLS
 # ============================================
 
-@mcp.tool()
+@threaded_tool()
 def list_constraints(table_name: str, database_name: str = None) -> str:
     """Lists constraints (Primary Key, Foreign Key, Check, Unique) for a table."""
     with get_connection(database_name) as conn:
         cursor = conn.cursor()
         try:
-            sql = """
-                SELECT c.constraint_name, c.constraint_type, c.search_condition, 
-                       cc.column_name, c.r_constraint_name
-                FROM user_constraints c
-                JOIN user_cons_columns cc ON c.constraint_name = cc.constraint_name
-                WHERE c.table_name = :tn
-                ORDER BY c.constraint_type, c.constraint_name, cc.position
-            """
-            cursor.execute(sql, tn=table_name.upper())
-            rows = cursor.fetchall()
+            rows = cached_metadata(cursor, database_name, table_name, SQL_CONSTRAINTS, tn=table_name.upper())
             
             if not rows: return f"No constraints found for `{table_name}`."
             
@@ -366,22 +1872,13 @@ def list_constraints(table_name: str, database_name: str = None) -> str:
         finally:
             cursor.close()
 
-@mcp.tool()
+@threaded_tool()
 def list_indexes(table_name: str, database_name: str = None) -> str:
     """Lists indexes on a specific table."""
     with get_connection(database_name) as conn:
         cursor = conn.cursor()
         try:
-            sql = """
-                SELECT i.index_name, i.index_type, i.uniqueness,
-                       LISTAGG(ic.column_name, ', ') WITHIN GROUP (ORDER BY ic.column_position) as columns
-                FROM user_indexes i
-                JOIN user_ind_columns ic ON i.index_name = ic.index_name
-                WHERE i.table_name = :tn
-                GROUP BY i.index_name, i.index_type, i.uniqueness
-            """
-            cursor.execute(sql, tn=table_name.upper())
-            rows = cursor.fetchall()
+            rows = cached_metadata(cursor, database_name, table_name, SQL_INDEXES, tn=table_name.upper())
             
             if not rows: return f"No indexes found for `{table_name}`."
             
@@ -395,7 +1892,7 @@ def list_indexes(table_name: str, database_name: str = None) -> str:
         finally:
             cursor.close()
 
-@mcp.tool()
+@threaded_tool()
 def get_object_ddl(object_name: str, object_type: str = "TABLE", database_name: str = None) -> str:
     """
     Gets the detailed DDL or source code for an object.
@@ -422,54 +1919,91 @@ def get_object_ddl(object_name: str, object_type: str = "TABLE", database_name:
         finally:
             cursor.close()
 
-@mcp.tool()
-def run_read_only_query(sql_query: str, database_name: str = None) -> str:
-    """Executes a READ-ONLY SQL query (SELECT only)."""
+def check_read_only_query(sql_query: str) -> Optional[str]:
+    """Returns an error message if 'sql_query' is not an allowed read-only query."""
     normalized = sql_query.strip().upper()
     if not normalized.startswith("SELECT") and not normalized.startswith("WITH"):
         return "Error: Only SELECT queries are allowed."
-        
     danger = check_dangerous_query(sql_query)
-    if danger: return f"Error: Query contains blocked keyword: {danger}"
-    
+    if danger:
+        return f"Error: Query contains blocked keyword: {danger}"
+    return None
+
+@threaded_tool()
+def run_read_only_query(sql_query: str, database_name: str = None, use_cache: bool = True,
+                        params: BindParams = None, timeout_ms: int = None) -> str:
+    """
+    Executes a READ-ONLY SQL query (SELECT only).
+    Pass values as bind variables through 'params' instead of inlining them,
+    e.g. sql_query="SELECT * FROM emp WHERE dept_id = :dept", params={"dept": 10}
+    (or a list for positional :1, :2 binds). Same text means no new hard parse.
+    timeout_ms: Abort the query after this many milliseconds (default: the database's call_timeout_ms).
+    If the database has the result cache enabled, a repeat of the same query
+    within its TTL is answered from memory (marked "cached, age Ns");
+    pass use_cache=False to force a fresh read.
+    """
+    error = check_read_only_query(sql_query)
+    if error:
+        return error
+    normalized = sql_query.strip().upper()
+    try:
+        binds = parse_bind_params(params)
+    except ValueError as e:
+        return f"Error: {e}"
+
     dml_keywords = ["INSERT", "UPDATE", "DELETE", "DROP", "ALTER", "TRUNCATE", "CREATE"]
     for kw in dml_keywords:
         if kw in normalized.split(): # Basic token check
             # Be careful with subqueries/comments, but strict safe for now
              pass # Regex is better, but this is a quick safety net
     
-    start_time = time.time()
-    try:
+    sizing = fetch_sizing(database_name, MAX_ROWS_DISPLAY + 1)
+
+    def load():
         with get_connection(database_name) as conn:
             cursor = conn.cursor()
             try:
-                cursor.execute(sql_query)
-                if not cursor.description:
-                     return "Query executed but returned no results (no cursor description)."
-                columns = [col[0] for col in cursor.description]
-                rows = cursor.fetchmany(MAX_ROWS_DISPLAY + 1)
-                duration = (time.time() - start_time) * 1000
-                
-                query_logger.log_query(sql_query[:200], duration, len(rows))
-                
-                if not rows:
-                    return f"[DB: {database_name or 'Default'}] Query returned no results."
-                
-                has_more = len(rows) > MAX_ROWS_DISPLAY
-                display_rows = rows[:MAX_ROWS_DISPLAY]
-                
-                result = f"## Results (DB: {database_name or 'Default'})\n"
-                result += format_as_markdown_table(columns, display_rows)
-                if has_more:
-                    result += f"\n\n*Showing first {MAX_ROWS_DISPLAY} rows.*"
-                result += f"\n\n*Query executed in {duration:.2f}ms*"
-                return result
+                tune_fetch(cursor, sizing)
+                with tracked_call(conn, database_name, sql_query, timeout_ms):
+                    cursor.execute(sql_query, binds)
+                    if not cursor.description:
+                        return None, []
+                    columns = [col[0] for col in cursor.description]
+                    return columns, cursor.fetchmany(MAX_ROWS_DISPLAY + 1)
             finally:
                 cursor.close()
+
+    start_time = time.time()
+    try:
+        (columns, rows), age = cached_result(
+            database_name, ("query", normalize_sql(sql_query), bind_key(binds), MAX_ROWS_DISPLAY), load, use_cache
+        )
     except Exception as e:
         return f"Database Error ({database_name or 'Default'}): {str(e)}"
+    duration = (time.time() - start_time) * 1000
+
+    if age is None:
+        query_logger.log_query(sql_query, duration, len(rows), bind_count=len(binds),
+                               round_trips=estimate_round_trips(len(rows), sizing))
+    if columns is None:
+        return "Query executed but returned no results (no cursor description)."
+    if not rows:
+        return f"[DB: {database_name or 'Default'}] Query returned no results."
+
+    has_more = len(rows) > MAX_ROWS_DISPLAY
+    display_rows = rows[:MAX_ROWS_DISPLAY]
+
+    result = f"## Results (DB: {database_name or 'Default'})\n"
+    result += format_as_markdown_table(columns, display_rows)
+    if has_more:
+        result += f"\n\n*Showing first {MAX_ROWS_DISPLAY} rows.*"
+    if age is not None:
+        result += f"\n\n*cached, age {age:.0f}s*"
+    else:
+        result += f"\n\n*Query executed in {duration:.2f}ms*"
+    return result
 
-@mcp.tool()
+@threaded_tool()
 def explain_query_plan(sql_query: str, database_name: str = None) -> str:
     """
     Gets the Execution Plan for a query to analyze performance.
@@ -496,10 +2030,13 @@ def explain_query_plan(sql_query: str, database_name: str = None) -> str:
         finally:
              cursor.close()
 
-@mcp.tool()
-def export_query_to_csv(sql_query: str, filename: str, output_path: str = None, database_name: str = None) -> str:
+@threaded_tool()
+def export_query_to_csv(sql_query: str, filename: str, output_path: str = None, database_name: str = None,
+                        params: BindParams = None, timeout_ms: int = None, ctx: Context = None) -> str:
     """
     Exports query results to a CSV file.
+    params: Optional bind variables (JSON object for :name binds, list for :1, :2).
+    timeout_ms: Limit for each database call of the export (default: the database's call_timeout_ms).
     output_path: Optional absolute path to save the file (e.g. 'D:/Data/report.csv').
     If output_path is provided, 'filename' is ignored (or used as fallback if path is a dir).
     If output_path is NOT provided, saves to configured EXPORT_DIRECTORY with 'filename'.
@@ -516,77 +2053,490 @@ def export_query_to_csv(sql_query: str, filename: str, output_path: str = None,
 
     if not full_path.lower().endswith('.csv'):
         full_path += '.csv'
-        
+    try:
+        binds = parse_bind_params(params)
+    except ValueError as e:
+        return f"Error: {e}"
+
     try:
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
     except Exception as e:
         return f"Error creating directory for {full_path}: {e}"
     
+    start_time = time.time()
+    sizing = fetch_sizing(database_name, bulk=True)
     with get_connection(database_name) as conn:
         cursor = conn.cursor()
         try:
-            cursor.execute(sql_query)
-            if not cursor.description:
-                return "Query returned no results."
-                
-            headers = [col[0] for col in cursor.description]
-            
-            with open(full_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-                
-                rows_written = 0
-                while True:
-                    rows = cursor.fetchmany(BATCH_SIZE)
-                    if not rows: break
-                    writer.writerows(rows)
-                    rows_written += len(rows)
-                    if rows_written >= MAX_CSV_ROWS:
-                        break
-                        
+            tune_fetch(cursor, sizing)
+            with tracked_call(conn, database_name, sql_query, timeout_ms):
+                cursor.execute(sql_query, binds)
+                if not cursor.description:
+                    return "Query returned no results."
+
+                headers = [col[0] for col in cursor.description]
+
+                progress = ProgressReporter(ctx)
+                with open(full_path, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(headers)
+
+                    rows_written = 0
+                    while True:
+                        rows = cursor.fetchmany(max(BATCH_SIZE, sizing[0]))
+                        if not rows: break
+                        writer.writerows(rows)
+                        rows_written += len(rows)
+                        progress.update(rows_written, f.tell())
+                        if rows_written >= MAX_CSV_ROWS:
+                            break
+                    progress.update(rows_written, f.tell(), force=True)
+
+            query_logger.log_query(sql_query, (time.time() - start_time) * 1000, rows_written, bind_count=len(binds),
+                                   round_trips=estimate_round_trips(rows_written, sizing))
             return f"✅ Exported {rows_written} rows to: `{full_path}`"
         except Exception as e:
             return f"Export failed: {e}"
         finally:
             cursor.close()
 
-@mcp.tool()
-def run_query_with_pagination(sql_query: str, page: int = 1, page_size: int = 50, database_name: str = None) -> str:
-    """Executes a SELECT query with pagination. Returns a specific page of results."""
+def parse_order_by(order_by: str) -> List[Tuple[str, bool]]:
+    """Parses "COL1, COL2 DESC" into [(COL1, False), (COL2, True)]. Raises ValueError."""
+    keys = []
+    for item in order_by.split(","):
+        parts = item.split()
+        if not parts or len(parts) > 2 or not validate_identifier(parts[0]) or "." in parts[0] \
+                or (len(parts) == 2 and parts[1].upper() not in ("ASC", "DESC")):
+            raise ValueError(f"Invalid order_by item: '{item.strip()}'")
+        keys.append((parts[0].upper(), len(parts) == 2 and parts[1].upper() == "DESC"))
+    return keys
+
+def encode_continuation_token(values: List[Any], fingerprint: str) -> str:
+    """Packs the last row's key values into an opaque, URL-safe token."""
+    encoded = [{"$dt": v.isoformat()} if isinstance(v, (datetime.datetime, datetime.date)) else v for v in values]
+    payload = json.dumps({"q": fingerprint, "k": encoded}, default=str)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+def decode_continuation_token(token: str, fingerprint: str) -> List[Any]:
+    """Unpacks a continuation token, checking it belongs to the same query. Raises ValueError."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        values, token_fingerprint = payload["k"], payload["q"]
+    except Exception:
+        raise ValueError("Invalid continuation token.")
+    if token_fingerprint != fingerprint:
+        raise ValueError("Continuation token belongs to a different query, order_by or params.")
+    return [datetime.datetime.fromisoformat(v["$dt"]) if isinstance(v, dict) else v for v in values]
+
+COUNT_MODES = ("exact", "cached", "estimate", "none")
+SQL_COUNT_ESTIMATE = "SELECT cardinality FROM plan_table WHERE statement_id = 'MCP_COUNT_ESTIMATE' AND id = 0"
+
+def get_total_count(conn, cursor, count_mode: str, database_name: Optional[str], sql_query: str,
+                    binds: Union[Dict[str, Any], List[Any]]) -> Tuple[Optional[int], str]:
+    """
+    Resolves the total row count of a query according to 'count_mode':
+    - exact: SELECT COUNT(*) on every call
+    - cached: exact count once per query fingerprint, reused for COUNT_CACHE_TTL seconds
+    - estimate: optimizer cardinality from EXPLAIN PLAN (no rows are read)
+    - none: no count
+
+    Returns:
+        (count or None, label shown next to it)
+    """
+    if count_mode == "none":
+        return None, ""
+    if count_mode == "estimate":
+        # EXPLAIN PLAN writes to the session's plan_table; rolling back removes the row again
+        try:
+            cursor.execute(f"EXPLAIN PLAN SET STATEMENT_ID = 'MCP_COUNT_ESTIMATE' FOR {sql_query}")
+            cursor.execute(SQL_COUNT_ESTIMATE)
+            row = cursor.fetchone()
+        finally:
+            conn.rollback()
+        return (row[0] if row else None), "estimate"
+
+    key = (database_name or GLOBAL_CONFIG["default_db"], normalize_sql(sql_query), bind_key(binds))
+    if count_mode == "cached":
+        total = _count_cache.get(key)
+        if total is not None:
+            return total, "cached"
+    cursor.execute(f"SELECT COUNT(*) FROM ({sql_query})", binds)
+    total = cursor.fetchone()[0]
+    _count_cache.put(key, total)
+    return total, ""
+
+def keyset_fingerprint(sql_query: str, order_by: str, binds: Union[Dict[str, Any], List[Any]]) -> str:
+    """Identifies the query a continuation token was issued for."""
+    return hashlib.sha1(f"{normalize_sql(sql_query)}|{order_by}|{bind_key(binds)}".encode()).hexdigest()[:16]
+
+def build_keyset_query(sql_query: str, keys: List[Tuple[str, bool]], last_values: Optional[List[Any]],
+                       binds: Union[Dict[str, Any], List[Any]], fetch_rows: int) -> Tuple[str, Union[Dict[str, Any], List[Any]]]:
+    """
+    Builds a seek-predicate page query: rows strictly after 'last_values' in
+    'keys' order, so the database never re-reads earlier pages. Oracle has no
+    row-value comparison, so (a, b) > (:a, :b) is expanded into
+    a > :a OR (a = :a AND b > :b).
+    """
+    seek = []
+    occurrences = []  # (bind name, value) per placeholder, in text order (positional binds)
+    if last_values is not None:
+        for i, (column, descending) in enumerate(keys):
+            terms = []
+            for j in range(i):
+                terms.append(f"{keys[j][0]} = :mcp_k{j}")
+                occurrences.append((f"mcp_k{j}", last_values[j]))
+            terms.append(f"{column} {'<' if descending else '>'} :mcp_k{i}")
+            occurrences.append((f"mcp_k{i}", last_values[i]))
+            seek.append("(" + " AND ".join(terms) + ")")
+    where = f" WHERE {' OR '.join(seek)}" if seek else ""
+    order = ", ".join(f"{column}{' DESC' if descending else ''}" for column, descending in keys)
+    page_query = f"SELECT * FROM ({sql_query}){where} ORDER BY {order} FETCH FIRST :mcp_fetch_rows ROWS ONLY"
+
+    if isinstance(binds, list):
+        page_binds = binds + [value for _, value in occurrences] + [fetch_rows]
+    else:
+        page_binds = {**binds, **dict(occurrences), "mcp_fetch_rows": fetch_rows}
+    return page_query, page_binds
+
+@threaded_tool()
+def run_query_with_pagination(sql_query: str, page: int = 1, page_size: int = 50, database_name: str = None,
+                              use_cache: bool = True, params: BindParams = None, order_by: str = None,
+                              continuation_token: str = None, count_mode: str = "exact", timeout_ms: int = None) -> str:
+    """
+    Executes a SELECT query with pagination. Returns a specific page of results.
+    Pages are served from the result cache when enabled (use_cache=False to bypass).
+    params: Optional bind variables (JSON object for :name binds, list for :1, :2).
+
+    Keyset mode (recommended for deep paging): pass 'order_by' with key columns
+    that uniquely order the rows, e.g. "ID" or "CREATED_AT, ID" (or a selected
+    ROWID alias). Each page returns a continuation token; pass it back as
+    'continuation_token' to get the next page. Cost per page is independent of
+    depth. Key columns must be in the select list and non-null; 'page' is ignored.
+
+    count_mode: How the total is obtained - "exact" (COUNT(*) per call), "cached"
+    (counted once, reused across pages), "estimate" (optimizer estimate, no scan)
+    or "none". Use cached/estimate/none on large tables.
+    timeout_ms: Abort after this many milliseconds per call (default: the database's call_timeout_ms).
+    """
     if page < 1: return "Error: Page number must be >= 1"
-    
-    offset = (page - 1) * page_size
-    paginated_query = f"SELECT * FROM ({sql_query}) OFFSET {offset} ROWS FETCH NEXT {page_size} ROWS ONLY"
-    count_query = f"SELECT COUNT(*) FROM ({sql_query})"
-    
-    start_time = time.time()
+    count_mode = (count_mode or "exact").lower()
+    if count_mode not in COUNT_MODES:
+        return f"Error: count_mode must be one of {', '.join(COUNT_MODES)}."
+    if continuation_token and not order_by:
+        return "Error: 'continuation_token' requires the same 'order_by' used for the first page."
     try:
+        binds = parse_bind_params(params)
+        keys = parse_order_by(order_by) if order_by else None
+        last_values = None
+        if keys and continuation_token:
+            fingerprint = keyset_fingerprint(sql_query, order_by, binds)
+            last_values = decode_continuation_token(continuation_token, fingerprint)
+            if len(last_values) != len(keys):
+                raise ValueError("Invalid continuation token.")
+    except ValueError as e:
+        return f"Error: {e}"
+
+    if keys:
+        # One extra row tells whether a next page exists
+        paginated_query, page_binds = build_keyset_query(sql_query, keys, last_values, binds, page_size + 1)
+    else:
+        offset = (page - 1) * page_size
+        # Offset and page size are binds too, so every page shares one cursor
+        paginated_query = f"SELECT * FROM ({sql_query}) OFFSET :mcp_offset ROWS FETCH NEXT :mcp_page_size ROWS ONLY"
+        if isinstance(binds, list):
+            page_binds = binds + [offset, page_size]
+        else:
+            page_binds = {**binds, "mcp_offset": offset, "mcp_page_size": page_size}
+
+    sizing = fetch_sizing(database_name, page_size + 1)
+
+    def load():
         with get_connection(database_name) as conn:
             cursor = conn.cursor()
             try:
-                # Get Count
-                cursor.execute(count_query)
-                total_rows = cursor.fetchone()[0]
-                total_pages = (total_rows + page_size - 1) // page_size
-                
-                # Get Data
-                cursor.execute(paginated_query)
-                columns = [col[0] for col in cursor.description]
-                rows = cursor.fetchall()
-                duration = (time.time() - start_time) * 1000
-                
-                result = f"## Page {page} of {total_pages} (Total: {total_rows:,} | DB: {database_name or 'Default'})\n\n"
-                if not rows:
-                    result += "No results on this page."
-                else:
-                    result += format_as_markdown_table(columns, rows)
-                return result
+                with tracked_call(conn, database_name, paginated_query, timeout_ms):
+                    # Get Count
+                    total_rows, count_label = get_total_count(conn, cursor, count_mode, database_name, sql_query, binds)
+
+                    # Get Data
+                    tune_fetch(cursor, sizing)
+                    cursor.execute(paginated_query, page_binds)
+                    columns = [col[0] for col in cursor.description]
+                    return total_rows, count_label, columns, cursor.fetchall()
             finally:
                 cursor.close()
+
+    start_time = time.time()
+    try:
+        (total_rows, count_label, columns, rows), age = cached_result(
+            database_name,
+            ("page", normalize_sql(sql_query), bind_key(binds), page, page_size, order_by, continuation_token, count_mode),
+            load, use_cache
+        )
     except Exception as e:
         return f"Pagination Error: {str(e)}"
+    if age is None:
+        query_logger.log_query(paginated_query, (time.time() - start_time) * 1000, len(rows),
+                               bind_count=len(page_binds), round_trips=estimate_round_trips(len(rows), sizing))
+
+    db_label = f"DB: {database_name or 'Default'}"
+    approx = "~" if count_label == "estimate" else ""
+    total_label = ""
+    if total_rows is not None:
+        total_label = f"Total: {approx}{total_rows:,}" + (f" ({count_label})" if count_label else "") + " | "
+    next_token = None
+    if keys:
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            missing = [column for column, _ in keys if column not in columns]
+            if missing:
+                return f"Error: order_by column(s) not in the select list: {', '.join(missing)}"
+            fingerprint = keyset_fingerprint(sql_query, order_by, binds)
+            next_token = encode_continuation_token([rows[-1][columns.index(column)] for column, _ in keys], fingerprint)
+        result = f"## Keyset Page ({total_label}{len(rows)} rows | {db_label})\n\n"
+    elif total_rows is not None:
+        total_pages = (total_rows + page_size - 1) // page_size
+        result = f"## Page {page} of {approx}{total_pages} ({total_label}{db_label})\n\n"
+    else:
+        result = f"## Page {page} ({db_label})\n\n"
+
+    if not rows:
+        result += "No results on this page."
+    else:
+        result += format_as_markdown_table(columns, rows)
+    if keys:
+        if next_token:
+            result += f"\n\n**Next page**: `continuation_token=\"{next_token}\"`"
+        else:
+            result += "\n\n*Last page.*"
+    if age is not None:
+        result += f"\n\n*cached, age {age:.0f}s*"
+    return result
+
+# ============================================
+# SERVER-SIDE CURSOR SESSIONS
+# ============================================
+
+class QuerySession:
+    """An open cursor kept on a dedicated pooled connection between tool calls."""
+
+    def __init__(self, query_id: str, client: str, db_name: str, sql: str, stack: ExitStack, cursor,
+                 label: str = ""):
+        self.query_id = query_id
+        self.client = client  # Server-side session key the per-client cap counts against
+        self.label = label or client  # Client-supplied id, for logs only
+        self.db_name = db_name
+        self.sql = sql
+        self.stack = stack  # Holds the get_connection() context; closing it returns the connection
+        self.cursor = cursor
+        self.columns = [col[0] for col in cursor.description]
+        self.rows_fetched = 0
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+
+    def close(self):
+        try:
+            self.cursor.close()
+        except Exception:
+            pass
+        try:
+            self.stack.close()
+        except Exception as e:
+            logger.warning(f"Error returning connection of query session {self.query_id}: {e}")
+
+def client_key(ctx: Optional[Context]) -> str:
+    """
+    Identifies the MCP session for per-client limits. Keyed on the server-side
+    session object, not the client-supplied client_id, which a client could
+    reuse or rotate to share or dodge a cap.
+    """
+    if ctx is None:
+        return "local"
+    try:
+        return f"session-{id(ctx.session):x}"
+    except Exception:
+        return "local"
+
+def client_label(ctx: Optional[Context]) -> str:
+    """Client-supplied id for log messages (falls back to the session key)."""
+    try:
+        return ctx.client_id or client_key(ctx)
+    except Exception:
+        return client_key(ctx)
 
-@mcp.tool()
+def close_idle_query_sessions() -> int:
+    """
+    Closes query sessions unused for CURSOR_IDLE_TIMEOUT seconds. Returns the count.
+    Sessions busy in a fetch are skipped and retried on the next pass.
+    """
+    now = time.monotonic()
+    expired = []
+    with _query_sessions_lock:
+        for qs in list(_query_sessions.values()):
+            if now - qs.last_used >= CURSOR_IDLE_TIMEOUT and qs.lock.acquire(blocking=False):
+                del _query_sessions[qs.query_id]
+                expired.append(qs)
+    for qs in expired:
+        try:
+            qs.close()
+        finally:
+            qs.lock.release()
+        logger.info(
+            f"Closed idle query session {qs.query_id} ({qs.db_name}, client {qs.label}, {qs.rows_fetched} rows fetched)"
+        )
+    return len(expired)
+
+def start_cursor_reaper():
+    """Starts the background reaper for idle query sessions (once per process)."""
+    global _cursor_reaper_started
+    with _query_sessions_lock:
+        if _cursor_reaper_started:
+            return
+        _cursor_reaper_started = True
+
+    def loop():
+        while True:
+            time.sleep(max(1.0, min(30.0, CURSOR_IDLE_TIMEOUT / 2)))
+            close_idle_query_sessions()
+
+    threading.Thread(target=loop, name="cursor-reaper", daemon=True).start()
+
+def _fetch_page(qs: QuerySession, rows: int) -> str:
+    """Fetches the next rows of a query session and formats them (closes it when exhausted)."""
+    with qs.lock:
+        start_time = time.time()
+        batch = qs.cursor.fetchmany(rows)
+        duration = (time.time() - start_time) * 1000
+        qs.rows_fetched += len(batch)
+        qs.last_used = time.monotonic()
+        exhausted = len(batch) < rows
+
+    start = qs.rows_fetched - len(batch) + 1
+    result = f"## Query `{qs.query_id}` rows {start}-{qs.rows_fetched} (DB: {qs.db_name}, {duration:.1f}ms)\n\n"
+    result += format_as_markdown_table(qs.columns, batch) if batch else "No more rows."
+    if exhausted:
+        with _query_sessions_lock:
+            _query_sessions.pop(qs.query_id, None)
+        qs.close()
+        result += f"\n\n*End of results ({qs.rows_fetched} rows). Query closed.*"
+    else:
+        result += f"\n\n*More rows available: `fetch_next(query_id=\"{qs.query_id}\")`*"
+    return result
+
+@threaded_tool()
+def open_query(sql_query: str, database_name: str = None, page_size: int = 50, params: BindParams = None,
+               timeout_ms: int = None, ctx: Context = None) -> str:
+    """
+    Opens a server-side cursor for a SELECT and returns its first page plus a query_id.
+    Use fetch_next(query_id) for the following pages: each costs one fetch instead
+    of re-running the query. Close with close_query(query_id) when done; idle
+    queries are closed automatically. Holds one pooled connection while open.
+    """
+    error = check_read_only_query(sql_query)
+    if error:
+        return error
+    if page_size < 1:
+        return "Error: page_size must be >= 1"
+    page_size = min(page_size, MAX_ARRAYSIZE)
+    try:
+        binds = parse_bind_params(params)
+    except ValueError as e:
+        return f"Error: {e}"
+
+    close_idle_query_sessions()
+    client = client_key(ctx)
+    with _query_sessions_lock:
+        open_count = sum(1 for qs in _query_sessions.values() if qs.client == client)
+    if open_count >= MAX_OPEN_CURSORS:
+        return (f"Error: {open_count} queries already open for this client (max {MAX_OPEN_CURSORS}). "
+                f"Close one with close_query first.")
+
+    stack = ExitStack()
+    try:
+        conn = stack.enter_context(get_connection(database_name))
+        cursor = conn.cursor()
+        # The first page arrives with the execute round trip, later pages in one fetch each
+        tune_fetch(cursor, (page_size, page_size + 1))
+        start_time = time.time()
+        with tracked_call(conn, database_name, sql_query, timeout_ms):
+            cursor.execute(sql_query, binds)
+        query_logger.log_query(sql_query, (time.time() - start_time) * 1000, 0, bind_count=len(binds), round_trips=1)
+        if not cursor.description:
+            cursor.close()
+            stack.close()
+            return "Query executed but returned no results (no cursor description)."
+    except Exception as e:
+        stack.close()
+        return f"Database Error ({database_name or 'Default'}): {str(e)}"
+
+    qs = QuerySession(uuid.uuid4().hex[:12], client, database_name or GLOBAL_CONFIG["default_db"],
+                      sql_query, stack, cursor, label=client_label(ctx))
+    with _query_sessions_lock:
+        _query_sessions[qs.query_id] = qs
+    start_cursor_reaper()
+    return _fetch_page(qs, page_size)
+
+@threaded_tool()
+def fetch_next(query_id: str, rows: int = None) -> str:
+    """Fetches the next page of an open_query cursor ('rows' defaults to its page size, max MAX_ARRAYSIZE)."""
+    if rows is not None and rows < 1:
+        return "Error: rows must be >= 1"
+    close_idle_query_sessions()
+    with _query_sessions_lock:
+        qs = _query_sessions.get(query_id)
+    if qs is None:
+        return f"Error: Query '{query_id}' is not open (finished, closed or expired after {CURSOR_IDLE_TIMEOUT:.0f}s idle)."
+    try:
+        return _fetch_page(qs, min(rows or qs.cursor.arraysize, MAX_ARRAYSIZE))
+    except Exception as e:
+        with _query_sessions_lock:
+            _query_sessions.pop(query_id, None)
+        qs.close()
+        return f"Database Error ({qs.db_name}): {str(e)}. Query closed."
+
+@threaded_tool()
+def close_query(query_id: str) -> str:
+    """Closes an open_query cursor and returns its connection to the pool."""
+    with _query_sessions_lock:
+        qs = _query_sessions.pop(query_id, None)
+    if qs is None:
+        return f"Query '{query_id}' is not open."
+    with qs.lock:  # Let a fetch in progress finish first
+        qs.close()
+    return f"✅ Query `{query_id}` closed after {qs.rows_fetched} rows."
+
+@threaded_tool()
+def cancel_query(request_id: str = None) -> str:
+    """
+    Cancels an in-flight query (connection.cancel()) so its connection returns
+    to the pool. Without 'request_id', lists the queries currently running.
+    """
+    with _inflight_lock:
+        running = sorted(_inflight.values(), key=lambda r: r.started)
+        req = _inflight.get(request_id) if request_id else None
+
+    if not request_id:
+        if not running:
+            return "No queries are running."
+        now = time.monotonic()
+        result = "## Running Queries\n\n| Request | Database | Running | Timeout | SQL |\n|---|---|---|---|---|\n"
+        for r in running:
+            sql = " ".join(r.sql.split())[:80].replace("|", "\\|")
+            timeout = f"{r.timeout_ms}ms" if r.timeout_ms else "none"
+            result += f"| `{r.request_id}` | {r.db_name} | {now - r.started:.1f}s | {timeout} | {sql} |\n"
+        return result
+
+    if req is None:
+        return f"Query '{request_id}' is not running (already finished or unknown)."
+    req.cancelled = True
+    try:
+        req.conn.cancel()
+    except Exception as e:
+        return f"Error cancelling query {request_id}: {e}"
+    logger.info(f"Cancelled query {request_id} on '{req.db_name}' after {time.monotonic() - req.started:.1f}s")
+    return f"✅ Cancel sent to query `{request_id}` on {req.db_name}."
+
+@threaded_tool()
 def run_modification_query(sql_query: str, database_name: str = None) -> str:
     """Executes DML/DDL commands. Auto-commits. CAUTION: Ensure correct database_name!"""
     normalized = sql_query.strip().upper()
@@ -604,9 +2554,14 @@ def run_modification_query(sql_query: str, database_name: str = None) -> str:
                 cursor.execute(sql_query)
                 rows_affected = cursor.rowcount
                 conn.commit()
+                invalidate_result_cache(database_name or GLOBAL_CONFIG["default_db"])
+                if normalized.split()[0] in DDL_KEYWORDS:
+                    invalidate_metadata_cache(database_name or GLOBAL_CONFIG["default_db"])
+                    if get_catalog() is not None:
+                        get_catalog().mark_stale(database_name or GLOBAL_CONFIG["default_db"])
                 duration = (time.time() - start_time) * 1000
                 
-                query_logger.log_query(sql_query[:200], duration, rows_affected)
+                query_logger.log_query(sql_query, duration, rows_affected)
                 return f"✅ [DB: {database_name or 'Default'}] Query executed successfully.\n- Rows affected: {rows_affected}\n- Duration: {duration:.2f}ms"
             except Exception as e:
                 conn.rollback()
@@ -624,7 +2579,7 @@ def run_modification_query(sql_query: str, database_name: str = None) -> str:
 # We will alias it or let the user use get_object_ddl. 
 # actually let's remove it to avoid clutter since get_object_ddl covers it.
 # Or keep existing function for simpler prompt matching.
-@mcp.tool()
+@threaded_tool()
 def get_table_ddl(table_name: str, database_name: str = None) -> str:
     """(Deprecated) Gets the detailed DDL for a table. Use get_object_ddl instead."""
     return get_object_ddl(table_name, "TABLE", database_name)
@@ -633,7 +2588,7 @@ def get_table_ddl(table_name: str, database_name: str = None) -> str:
 # ADVANCED MANAGEMENT TOOLS
 # ============================================
 
-@mcp.tool()
+@threaded_tool()
 def inspect_locks(database_name: str = None) -> str:
     """
     Checks for blocking sessions and locked objects.
@@ -669,7 +2624,7 @@ def inspect_locks(database_name: str = None) -> str:
         finally:
             cursor.close()
 
-@mcp.tool()
+@threaded_tool()
 def kill_session(sid: int, serial: int, database_name: str = None) -> str:
     """
     Kills a specific database session.
@@ -686,7 +2641,7 @@ def kill_session(sid: int, serial: int, database_name: str = None) -> str:
         finally:
             cursor.close()
 
-@mcp.tool()
+@threaded_tool()
 def search_in_table(table_name: str, search_term: str, database_name: str = None) -> str:
     """Searches for text in a table."""
     try:
@@ -694,11 +2649,8 @@ def search_in_table(table_name: str, search_term: str, database_name: str = None
             cursor = conn.cursor()
             try:
                 # (Simplified logic - getting text columns)
-                cursor.execute("""
-                    SELECT column_name FROM user_tab_columns
-                    WHERE table_name = :tn AND data_type IN ('CHAR','VARCHAR2')
-                """, tn=table_name.upper())
-                cols = [r[0] for r in cursor.fetchall()]
+                rows = cached_metadata(cursor, database_name, table_name, SQL_TEXT_COLUMNS, tn=table_name.upper())
+                cols = [r[0] for r in rows]
                 if not cols: return "No text columns found."
                 
                 where = " OR ".join([f"UPPER({c}) LIKE UPPER(:t)" for c in cols])
@@ -712,7 +2664,7 @@ def search_in_table(table_name: str, search_term: str, database_name: str = None
     except Exception as e:
         return f"Error: {e}"
 
-@mcp.tool()
+@threaded_tool()
 def get_session_info() -> str:
     """Returns detailed information about ALL current database sessions/pools."""
     global _pools
@@ -720,9 +2672,24 @@ def get_session_info() -> str:
         return "No active connection pools."
         
     result = "## System Session Info\n\n"
+    result += f"**Driver Mode**: {'thin' if oracledb.is_thin_mode() else 'thick'}\n"
+    result += (
+        f"**Metadata Cache**: {len(_metadata_cache)} tables, "
+        f"hits={_metadata_cache.hits}, misses={_metadata_cache.misses}\n"
+        f"**Object Index**: {len(_object_index)} names from {', '.join(_object_index.databases()) or 'no databases'}\n"
+        f"**Result Cache**: {len(_result_cache)} results, {_result_cache.bytes / 1048576:.1f}/"
+        f"{_result_cache.max_bytes / 1048576:.0f}MB, hits={_result_cache.hits}, misses={_result_cache.misses}\n"
+        f"**Open Query Cursors**: {len(_query_sessions)} (max {MAX_OPEN_CURSORS} per client, "
+        f"idle timeout {CURSOR_IDLE_TIMEOUT:.0f}s)\n\n"
+    )
     
-    for name, pool in _pools.items():
+    for name, pool in list(_pools.items()):
         result += f"### Database: {name}\n"
+        if pool is None:
+            cache = _sysdba_caches.get(name)
+            if cache:
+                result += f"- **SYSDBA Connections**: Open={cache.opened}, Busy={cache.busy}, Max={cache.max_connections}\n\n"
+            continue
         result += f"- **Pool Status**: Open={pool.opened}, Busy={pool.busy}\n"
         try:
             with pool.acquire() as conn:
@@ -731,6 +2698,7 @@ def get_session_info() -> str:
                 row = cursor.fetchone()
                 result += f"- **Connected as**: {row[1]} @ {row[0]}\n"
                 result += f"- **Version**: {conn.version}\n"
+                result += get_statement_cache_stats(cursor, conn.stmtcachesize)
                 cursor.close()
         except Exception as e:
             result += f"- **Check**: Failed to acquire test connection ({e})\n"
@@ -739,11 +2707,70 @@ def get_session_info() -> str:
     return result
 
 
+def get_statement_cache_stats(cursor, cache_size: int) -> str:
+    """
+    Reports statement cache effectiveness for the session behind 'cursor'.
+    Parse calls never reach the server on a client statement cache hit, so
+    hits ~= executions - parse calls and misses = parse calls.
+    """
+    try:
+        cursor.execute("""
+            SELECT n.name, s.value
+            FROM v$mystat s JOIN v$statname n ON n.statistic# = s.statistic#
+            WHERE n.name IN ('execute count', 'parse count (total)', 'parse count (hard)')
+        """)
+        stats = dict(cursor.fetchall())
+    except oracledb.DatabaseError as e:
+        return f"- **Statement Cache**: size={cache_size} (stats unavailable: {e})\n"
+    executions = stats.get("execute count", 0)
+    parses = stats.get("parse count (total)", 0)
+    hard = stats.get("parse count (hard)", 0)
+    return (
+        f"- **Statement Cache**: size={cache_size}, hits~{max(executions - parses, 0)}, "
+        f"misses={parses} (hard parses={hard}, sampled session)\n"
+    )
+
+
+@threaded_tool()
+def get_pool_metrics() -> str:
+    """
+    Returns connection pool sizing metrics for every database used so far:
+    acquire-wait and queue-depth histograms, timeouts and current usage.
+    Does not touch the database.
+    """
+    if not _pool_metrics:
+        return "No pool metrics recorded yet."
+
+    result = "## Pool Metrics\n\n"
+    result += "| Database | Acquires | Wait p50 | Wait p95 | Wait max | Timeouts | Waiting now | Busy/Open/Max |\n"
+    result += "|---|---|---|---|---|---|---|---|\n"
+    for name, metrics in sorted(_pool_metrics.items()):
+        wait = metrics.acquire_wait
+        pool = _pools.get(name)
+        if pool is not None:
+            usage = f"{pool.busy}/{pool.opened}/{pool.max}"
+        elif name in _sysdba_caches:
+            cache = _sysdba_caches[name]
+            usage = f"{cache.busy}/{cache.opened}/{cache.max_connections}"
+        else:
+            usage = "closed"
+        result += (
+            f"| **{name}** | {wait.count} | {wait.percentile(50):g}ms | {wait.percentile(95):g}ms | "
+            f"{wait.max:.1f}ms | {metrics.timeouts} | {metrics.waiters} | {usage} |\n"
+        )
+
+    result += "\n### Histograms\n"
+    for name, metrics in sorted(_pool_metrics.items()):
+        result += f"- **{name}** wait: {metrics.acquire_wait.format_buckets('ms')}\n"
+        result += f"- **{name}** queue depth at acquire: {metrics.queue_depth.format_buckets()}\n"
+    return result
+
+
 # ============================================
 # IMPORT TOOLS (Human-in-the-loop)
 # ============================================
 
-@mcp.tool()
+@threaded_tool()
 def analyze_import_file(file_path: str, table_name: str, database_name: str = None) -> str:
     """
     Step 1 of Import: Analyzes a file (CSV/Excel) against a target table schema.
@@ -770,7 +2797,7 @@ def analyze_import_file(file_path: str, table_name: str, database_name: str = No
     with get_connection(database_name) as conn:
         cursor = conn.cursor()
         try:
-            if not check_table_exists(cursor, table_name):
+            if not check_table_exists(cursor, table_name, database_name):
                 return f"Error: Table '{table_name}' does not exist in DB '{database_name or 'Default'}'."
                 
             # standardized column fetching
@@ -780,13 +2807,10 @@ def analyze_import_file(file_path: str, table_name: str, database_name: str = No
                 owner, t_name = t_name.split(".")
                 
             if owner:
-                sql_cols = "SELECT column_name, data_type, nullable FROM all_tab_columns WHERE owner=:o AND table_name=:t"
-                cursor.execute(sql_cols, o=owner, t=t_name)
+                db_cols_info = cached_metadata(cursor, database_name, table_name, SQL_IMPORT_ALL_COLUMNS, o=owner, t=t_name)
             else:
-                sql_cols = "SELECT column_name, data_type, nullable FROM user_tab_columns WHERE table_name=:t"
-                cursor.execute(sql_cols, t=t_name)
-                
-            db_cols_info = cursor.fetchall() # [(COL, TYPE, NULL), ...]
+                db_cols_info = cached_metadata(cursor, database_name, table_name, SQL_IMPORT_COLUMNS, t=t_name)
+            # [(COL, TYPE, NULL), ...]
             db_cols = {row[0]: {'type': row[1], 'null': row[2]} for row in db_cols_info}
             
         finally:
@@ -848,7 +2872,7 @@ def analyze_import_file(file_path: str, table_name: str, database_name: str = No
 # MAINTENANCE & DEV TOOLS (New!)
 # ============================================
 
-@mcp.tool()
+@threaded_tool()
 def list_invalid_objects(database_name: str = None) -> str:
     """
     Lists all Invalid objects in the current schema.
@@ -857,13 +2881,7 @@ def list_invalid_objects(database_name: str = None) -> str:
     with get_connection(database_name) as conn:
         cursor = conn.cursor()
         try:
-            sql = """
-                SELECT object_name, object_type, last_ddl_time 
-                FROM user_objects 
-                WHERE status = 'INVALID' 
-                ORDER BY object_type, object_name
-            """
-            cursor.execute(sql)
+            cursor.execute(SQL_INVALID_OBJECTS)
             rows = cursor.fetchall()
             
             if not rows: return "✅ All objects are VALID."
@@ -880,7 +2898,7 @@ def list_invalid_objects(database_name: str = None) -> str:
         finally:
             cursor.close()
 
-@mcp.tool()
+@threaded_tool()
 def compile_object(object_name: str, object_type: str, database_name: str = None) -> str:
     """
     Attempts to recompile an Invalid object.
@@ -910,7 +2928,7 @@ def compile_object(object_name: str, object_type: str, database_name: str = None
         finally:
             cursor.close()
 
-@mcp.tool()
+@threaded_tool()
 def check_tablespace_usage(database_name: str = None) -> str:
     """
     Checks the usage of Tablespaces (Storage monitoring).
@@ -955,8 +2973,8 @@ def check_tablespace_usage(database_name: str = None) -> str:
         finally:
             cursor.close()
 
-@mcp.tool()
-def generate_mock_data(table_name: str, row_count: int = 10, database_name: str = None) -> str:
+@threaded_tool()
+def generate_mock_data(table_name: str, row_count: int = 10, database_name: str = None, ctx: Context = None) -> str:
     """
     Generates and inserts fake/mock data into a table for testing.
     Uses 'Faker' library to guess data types.
@@ -968,16 +2986,19 @@ def generate_mock_data(table_name: str, row_count: int = 10, database_name: str
         cursor = conn.cursor()
         try:
             # 1. Get Schema
-            cursor.execute("SELECT column_name, data_type, data_length FROM user_tab_columns WHERE table_name = :tn ORDER BY column_id", tn=table_name.upper())
-            cols_info = cursor.fetchall()
+            cols_info = cached_metadata(cursor, database_name, table_name, SQL_MOCK_COLUMNS, tn=table_name.upper())
             if not cols_info: return f"Table `{table_name}` not found."
             
             columns = [c[0] for c in cols_info]
             types = {c[0]: c[1] for c in cols_info}
             lengths = {c[0]: c[2] for c in cols_info}
             
-            # 2. Generate Data
+            # 2. Generate and insert in BATCH_SIZE chunks (one commit at the end)
+            placeholders = ",".join([f":{i+1}" for i in range(len(columns))])
+            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+            progress = ProgressReporter(ctx, total=row_count)
             data_rows = []
+            inserted = 0
             for _ in range(row_count):
                 row_data = []
                 for col in columns:
@@ -1010,14 +3031,18 @@ def generate_mock_data(table_name: str, row_count: int = 10, database_name: str
                         
                     row_data.append(val)
                 data_rows.append(tuple(row_data))
-                
-            # 3. Insert
-            placeholders = ",".join([f":{i+1}" for i in range(len(columns))])
-            sql = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
-            
-            cursor.executemany(sql, data_rows)
+                if len(data_rows) >= BATCH_SIZE:
+                    cursor.executemany(sql, data_rows)
+                    inserted += len(data_rows)
+                    data_rows = []
+                    progress.update(inserted)
+
+            if data_rows:
+                cursor.executemany(sql, data_rows)
             conn.commit()
-            
+            invalidate_result_cache(database_name or GLOBAL_CONFIG["default_db"])
+            progress.update(row_count, force=True)
+
             return f"✅ Successfully generated and inserted {row_count} rows into `{table_name}`."
             
         except Exception as e:
@@ -1027,11 +3052,13 @@ def generate_mock_data(table_name: str, row_count: int = 10, database_name: str
             cursor.close()
 
 
-@mcp.tool()
-def import_data_from_file(file_path: str, table_name: str, column_mapping_json: str, database_name: str = None) -> str:
+@threaded_tool()
+def import_data_from_file(file_path: str, table_name: str, column_mapping_json: str, database_name: str = None,
+                          ctx: Context = None) -> str:
     """
     Step 2 of Import: Executes the import using a confirmed mapping.
     column_mapping_json: The JSON string returned by step 1 (key=FileCol, val=DBCol).
+    Rows are inserted in batches of BATCH_SIZE in one transaction (all or nothing).
     """
     try:
         mapping = json.loads(column_mapping_json)
@@ -1071,9 +3098,15 @@ def import_data_from_file(file_path: str, table_name: str, column_mapping_json:
             binds_str = ", ".join([f":{i+1}" for i in range(len(final_cols))])
             sql = f"INSERT INTO {table_name} ({cols_str}) VALUES ({binds_str})"
             
-            cursor.executemany(sql, data_tuples)
+            # Batches give progress points between inserts; commit once at the end
+            progress = ProgressReporter(ctx, total=len(data_tuples))
+            for start in range(0, len(data_tuples), BATCH_SIZE):
+                cursor.executemany(sql, data_tuples[start:start + BATCH_SIZE])
+                progress.update(min(start + BATCH_SIZE, len(data_tuples)))
             conn.commit()
-            
+            invalidate_result_cache(database_name or GLOBAL_CONFIG["default_db"])
+            progress.update(len(data_tuples), force=True)
+
             duration = time.time() - start_time
             return f"✅ Validated Import Successful!\n- Imported {len(data_tuples)} rows into `{table_name}`\n- Time: {duration:.2f}s"
             
@@ -1091,7 +3124,9 @@ if __name__ == "__main__":
     logger.info("Starting Oracle MCP Server (Multi-DB Enabled)...")
     try:
         validate_config()
-        # Pre-initialize pools logic could go here, or lazy load
+        if WARMUP_POOLS:
+            warm_up_pools()
+        start_catalog_refresher()
         mcp.run()
     except Exception as e:
         logger.error(f"Failed to start server: {e}")
@@ -2,6 +2,8 @@
 import pytest
 from unittest.mock import MagicMock, patch
 import sys
+import re
+import time
 import os
 from contextlib import contextmanager
 
@@ -21,7 +23,11 @@ import oracledb
 @pytest.fixture
 def mock_db_context():
     """Mocks the get_connection context manager"""
-    with patch("mcp_oracle_server.server.get_connection") as mock_get_conn:
+    from mcp_oracle_server.server import invalidate_metadata_cache
+    invalidate_metadata_cache()
+    with patch("mcp_oracle_server.server.get_connection") as mock_get_conn, \
+         patch("mcp_oracle_server.server._catalog", None), \
+         patch("mcp_oracle_server.server.CATALOG_FILE", ""):
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
@@ -105,3 +111,927 @@ def test_generate_mock_data(mock_db_context):
     
     assert "INSERT INTO TEST_TABLE" in sql
     assert len(data) == 5 # 5 rows generated
+
+def test_tools_run_as_async_in_worker_thread(mock_db_context):
+    import asyncio
+    import threading
+    from mcp_oracle_server.server import mcp
+
+    conn, cursor = mock_db_context
+    main_thread = threading.get_ident()
+    seen = {}
+
+    def fetchall():
+        seen["thread"] = threading.get_ident()
+        return []
+    cursor.fetchall.side_effect = fetchall
+
+    tool = mcp._tool_manager.get_tool("list_invalid_objects")
+    assert tool.is_async
+
+    asyncio.run(mcp.call_tool("list_invalid_objects", {}))
+    assert seen["thread"] != main_thread
+
+def test_warm_up_pools_skips_failed_and_slow_databases():
+    import threading
+    from mcp_oracle_server.server import warm_up_pools
+
+    release = threading.Event()
+
+    @contextmanager
+    def fake_get_connection(name):
+        if name == "down":
+            raise ConnectionError("ORA-12541: no listener")
+        if name == "slow":
+            release.wait(5)
+        yield MagicMock()
+
+    databases = {"ok": {"dsn": "a"}, "down": {"dsn": "b"}, "slow": {"dsn": "c"}}
+    with patch.dict("mcp_oracle_server.server.DATABASES", databases, clear=True), \
+         patch("mcp_oracle_server.server.init_oracle_client") as mock_init, \
+         patch("mcp_oracle_server.server.get_connection", side_effect=fake_get_connection):
+        results = warm_up_pools(timeout=0.2)
+    release.set()
+
+    mock_init.assert_called_once()
+    assert results["ok"] == "ready"
+    assert "no listener" in results["down"]
+    assert results["slow"].startswith("timed out")
+
+def test_autoscale_target_grows_and_shrinks_within_bounds():
+    from mcp_oracle_server.server import autoscale_target
+
+    # Saturated pool grows by increment, capped at upper bound
+    assert autoscale_target(2, busy=4, opened=4, avg_wait_ms=0, lower=2, upper=8, increment=2) == 4
+    assert autoscale_target(8, busy=8, opened=8, avg_wait_ms=0, lower=2, upper=8, increment=2) == 8
+    # Acquire waits alone trigger growth
+    assert autoscale_target(2, busy=1, opened=4, avg_wait_ms=500, lower=2, upper=8, increment=1) == 3
+    # Idle pool shrinks, never below lower bound
+    assert autoscale_target(4, busy=0, opened=4, avg_wait_ms=0, lower=2, upper=8, increment=1) == 3
+    assert autoscale_target(2, busy=0, opened=2, avg_wait_ms=0, lower=2, upper=8, increment=1) == 2
+
+def test_autoscale_pools_reconfigures_enabled_pools_only():
+    from mcp_oracle_server.server import autoscale_pools
+
+    busy_pool = MagicMock(min=2, busy=5, opened=5)
+    fixed_pool = MagicMock(min=2, busy=5, opened=5)
+    databases = {
+        "prod": {"pool_min": 2, "pool_max": 20, "pool_inc": 2, "autoscale": True},
+        "dev": {"pool_min": 2, "pool_max": 4, "pool_inc": 1, "autoscale": False},
+    }
+    with patch.dict("mcp_oracle_server.server.DATABASES", databases, clear=True), \
+         patch.dict("mcp_oracle_server.server._pools", {"prod": busy_pool, "dev": fixed_pool}, clear=True):
+        autoscale_pools()
+
+    busy_pool.reconfigure.assert_called_once_with(min=4)
+    fixed_pool.reconfigure.assert_not_called()
+
+def _fake_sysdba_conn():
+    conn = MagicMock()
+    conn.is_healthy.return_value = True
+    conn.transaction_in_progress = False
+    return conn
+
+def test_sysdba_cache_reuses_live_connection():
+    from mcp_oracle_server.server import StandaloneConnectionCache
+
+    conf = {"user": "sys", "password": "x", "dsn": "db", "sysdba_max": 2, "ping_interval": 60}
+    with patch("mcp_oracle_server.server.oracledb.connect", side_effect=lambda **kw: _fake_sysdba_conn()) as mock_connect:
+        cache = StandaloneConnectionCache("admin", conf)
+        first = cache.acquire()
+        cache.release(first)
+        second = cache.acquire()
+        cache.release(second)
+
+    assert first is second
+    assert mock_connect.call_count == 1
+    first.ping.assert_not_called()  # Not idle long enough to need a ping
+
+def test_sysdba_cache_reconnects_after_failed_ping_or_lost_session():
+    from mcp_oracle_server.server import StandaloneConnectionCache, is_connection_lost
+    from mcp_oracle_server.server import oracledb as real_oracledb
+
+    conf = {"user": "sys", "password": "x", "dsn": "db", "sysdba_max": 1, "ping_interval": 0}
+    with patch("mcp_oracle_server.server.oracledb.connect", side_effect=lambda **kw: _fake_sysdba_conn()) as mock_connect:
+        cache = StandaloneConnectionCache("admin", conf)
+        stale = cache.acquire()
+        cache.release(stale)
+        stale.ping.side_effect = real_oracledb.DatabaseError("ORA-03113: end-of-file on communication channel")
+
+        fresh = cache.acquire()
+        assert fresh is not stale
+        stale.close.assert_called_once()
+
+        # A lost-session error discards the connection on release
+        cache.release(fresh, discard=True)
+        fresh.close.assert_called_once()
+        assert cache.opened == 0
+
+    assert mock_connect.call_count == 2
+    assert is_connection_lost(Exception("ORA-03114: not connected to ORACLE"))
+    assert not is_connection_lost(Exception("ORA-00942: table or view does not exist"))
+
+def test_resolve_driver_mode_auto_prefers_thin():
+    from mcp_oracle_server.server import resolve_driver_mode
+
+    with patch("mcp_oracle_server.server.DRIVER_MODE", "auto"):
+        with patch.dict("mcp_oracle_server.server.DATABASES", {"dev": {"dsn": "a"}}, clear=True):
+            assert resolve_driver_mode() == "thin"
+        with patch.dict("mcp_oracle_server.server.DATABASES",
+                        {"dev": {"dsn": "a"}, "legacy": {"dsn": "b", "requires_thick": True}}, clear=True):
+            assert resolve_driver_mode() == "thick"
+    with patch("mcp_oracle_server.server.DRIVER_MODE", "thick"):
+        assert resolve_driver_mode() == "thick"
+    with patch("mcp_oracle_server.server.DRIVER_MODE", "fast"):
+        with pytest.raises(ValueError):
+            resolve_driver_mode()
+
+def test_init_oracle_client_skips_instant_client_in_thin_mode():
+    from mcp_oracle_server import server
+
+    with patch.object(server, "_oracle_client_initialized", False), \
+         patch.object(server, "DRIVER_MODE", "thin"), \
+         patch.object(server.oracledb, "init_oracle_client") as mock_init:
+        server.init_oracle_client()
+        assert server._oracle_client_initialized
+    mock_init.assert_not_called()
+
+def test_init_session_preparses_metadata_statements():
+    from mcp_oracle_server.server import init_session, METADATA_STATEMENTS, SQL_USER_TABLE_EXISTS
+
+    conn = MagicMock()
+    conn.stmtcachesize = 3
+    conn.tag = None
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    init_session("missing", conn, None)
+
+    parsed = [c.args[0] for c in cursor.parse.call_args_list]
+    assert parsed == METADATA_STATEMENTS[:3]
+    assert SQL_USER_TABLE_EXISTS in parsed
+
+def test_check_table_exists_uses_shared_statement_text():
+    from mcp_oracle_server.server import check_table_exists, SQL_USER_TABLE_EXISTS, SQL_ALL_TABLE_EXISTS
+
+    cursor = MagicMock()
+    cursor.fetchall.return_value = [(1,)]
+    with patch("mcp_oracle_server.server.METADATA_CACHE_TTL", 0):
+        assert check_table_exists(cursor, "emp")
+        cursor.execute.assert_called_with(SQL_USER_TABLE_EXISTS, tn="EMP")
+        check_table_exists(cursor, "hr.emp")
+        cursor.execute.assert_called_with(SQL_ALL_TABLE_EXISTS, o="HR", tn="EMP")
+
+@pytest.fixture
+def isolated_pools():
+    """Empty pool registry with a single configured test database."""
+    from mcp_oracle_server import server
+    databases = {"shared": {"user": "u", "password": "p", "dsn": "host/svc"}}
+    with patch.dict(server.DATABASES, databases, clear=True), \
+         patch.dict(server._pools, {}, clear=True), \
+         patch.dict(server._pool_creations, {}, clear=True), \
+         patch.dict(server._pool_failures, {}, clear=True), \
+         patch.dict(server._breakers, {}, clear=True), \
+         patch.dict(server._pool_users, {}, clear=True), \
+         patch.dict(server._pool_last_used, {}, clear=True), \
+         patch.object(server, "init_oracle_client"):
+        yield server
+
+def test_warm_up_pools_logs_on_instead_of_trusting_create_pool(isolated_pools):
+    server = isolated_pools
+    # Thin mode: create_pool returns at once with no sessions; the logon fails later
+    pool = MagicMock(min=2, max=4, opened=0)
+    pool.acquire.side_effect = server.oracledb.DatabaseError("DPY-6005: cannot connect to database")
+
+    with patch.object(server.oracledb, "create_pool", return_value=pool):
+        results = server.warm_up_pools(timeout=1)
+
+    assert results["shared"] != "ready"
+    assert results["shared"].startswith("failed") and "DPY-6005" in results["shared"]
+
+def test_get_pool_is_single_flight_under_concurrency(isolated_pools):
+    import threading
+    server = isolated_pools
+    created = []
+
+    def fake_create_pool(**kwargs):
+        time.sleep(0.1)  # Widen the race window
+        pool = MagicMock(min=kwargs["min"], max=kwargs["max"])
+        created.append(pool)
+        return pool
+
+    results = []
+    with patch.object(server.oracledb, "create_pool", side_effect=fake_create_pool):
+        threads = [threading.Thread(target=lambda: results.append(server.get_pool("shared"))) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    assert len(created) == 1
+    assert len(results) == 16
+    assert all(pool is created[0] for pool in results)
+
+def test_get_pool_shares_failure_and_backs_off(isolated_pools):
+    server = isolated_pools
+    error = ConnectionError("ORA-12541: TNS:no listener")
+
+    with patch.object(server.oracledb, "create_pool", side_effect=error) as mock_create, \
+         patch.object(server, "POOL_RETRY_BACKOFF", 60):
+        with pytest.raises(ConnectionError):
+            server.get_pool("shared")
+        # Within the backoff window the cached failure is raised without a new attempt
+        with pytest.raises(ConnectionError):
+            server.get_pool("shared")
+        assert mock_create.call_count == 1
+
+        # Once the backoff expires the next caller retries
+        server._pool_failures["shared"]["retry_at"] = 0
+        mock_create.side_effect = None
+        mock_create.return_value = MagicMock()
+        assert server.get_pool("shared") is mock_create.return_value
+        assert "shared" not in server._pool_failures
+
+def test_build_session_sql_quotes_nls_values_and_rejects_injection():
+    from mcp_oracle_server.server import build_session_sql
+
+    sql = build_session_sql({"nls_date_format": "YYYY-MM-DD HH24:MI:SS", "CURRENT_SCHEMA": "HR"})
+    assert sql == (
+        "BEGIN EXECUTE IMMEDIATE 'ALTER SESSION SET NLS_DATE_FORMAT = ''YYYY-MM-DD HH24:MI:SS''';"
+        " EXECUTE IMMEDIATE 'ALTER SESSION SET CURRENT_SCHEMA = HR'; END;"
+    )
+    assert build_session_sql({}) is None
+    with pytest.raises(ValueError):
+        build_session_sql({"CURRENT_SCHEMA": "HR; DROP TABLE X"})
+
+def test_init_session_applies_settings_once_and_tags_session():
+    from mcp_oracle_server.server import init_session, get_session_tag
+
+    db_conf = {"session_settings": {"OPTIMIZER_MODE": "ALL_ROWS"}, "module": "mcp-oracle-server",
+               "client_identifier": "agent-42"}
+    tag = get_session_tag(db_conf)
+    conn = MagicMock()
+    conn.stmtcachesize = 0
+    conn.tag = None
+    cursor = conn.cursor.return_value.__enter__.return_value
+
+    with patch.dict("mcp_oracle_server.server.DATABASES", {"rpt": db_conf}, clear=True):
+        init_session("rpt", conn, tag)
+
+    cursor.execute.assert_called_once_with(
+        "BEGIN EXECUTE IMMEDIATE 'ALTER SESSION SET OPTIMIZER_MODE = ALL_ROWS'; END;"
+    )
+    assert conn.module == "mcp-oracle-server"
+    assert conn.client_identifier == "agent-42"
+    assert conn.tag == tag
+    assert tag == get_session_tag({"session_settings": {"OPTIMIZER_MODE": "ALL_ROWS"}})
+
+def test_circuit_breaker_opens_fails_fast_and_recovers():
+    from mcp_oracle_server.server import CircuitBreaker, CircuitOpenError
+
+    breaker = CircuitBreaker("dead", threshold=2, cooldown=30)
+    breaker.before_call()
+    breaker.record_failure(ConnectionError("ORA-12170: TNS:Connect timeout"))
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+    breaker.record_failure(ConnectionError("ORA-12170: TNS:Connect timeout"))
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError, match="ORA-12170"):
+        breaker.before_call()
+
+    # Cooldown elapsed: exactly one trial call goes through
+    breaker._opened_at -= 31
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_call()
+
+def test_get_connection_fails_fast_while_circuit_open(isolated_pools):
+    server = isolated_pools
+    breaker = server.CircuitBreaker("shared", threshold=1, cooldown=60)
+    with patch.dict(server._breakers, {"shared": breaker}), \
+         patch.object(server.oracledb, "create_pool", side_effect=ConnectionError("ORA-12541")) as mock_create:
+        with pytest.raises(ConnectionError):
+            with server.get_connection("shared"):
+                pass
+        with pytest.raises(server.CircuitOpenError):
+            with server.get_connection("shared"):
+                pass
+        assert mock_create.call_count == 1
+        assert "open (1 failures)" in server.list_databases()
+
+def test_idle_pool_is_reaped_and_recreated_lazily(isolated_pools):
+    server = isolated_pools
+    server.DATABASES["shared"]["idle_close"] = 300
+    pools = [MagicMock(min=1, max=2), MagicMock(min=1, max=2)]
+
+    with patch.object(server, "_reaped_pools", set()), \
+         patch.object(server, "start_pool_reaper"), \
+         patch.object(server.oracledb, "create_pool", side_effect=pools):
+        with server.get_connection("shared"):
+            # In use: never reaped, however old the timestamp
+            server._pool_last_used["shared"] -= 1000
+            server.reap_idle_pools()
+            assert "shared" in server._pools
+
+        server.reap_idle_pools()  # Just released: not idle long enough
+        assert "shared" in server._pools
+
+        server._pool_last_used["shared"] -= 301
+        server.reap_idle_pools()
+        assert "shared" not in server._pools
+        pools[0].close.assert_called_once()
+
+        with server.get_connection("shared"):
+            pass
+        assert server._pools["shared"] is pools[1]
+        assert server._pool_users["shared"] == 0
+
+def test_histogram_buckets_and_percentiles():
+    from mcp_oracle_server.logger import Histogram
+
+    hist = Histogram([1, 10, 100])
+    for value in [0.5, 0.7, 5, 50, 500]:
+        hist.record(value)
+    assert hist.count == 5
+    assert hist.percentile(50) == 10
+    assert hist.percentile(100) == 500
+    assert hist.format_buckets("ms") == "<=1ms: 2, <=10ms: 1, <=100ms: 1, >100ms: 1"
+
+def test_acquire_timeout_raises_busy_error_without_tripping_breaker(isolated_pools):
+    server = isolated_pools
+    server.DATABASES["shared"].update({"acquire_timeout": 2, "pool_max": 3})
+    pool = MagicMock(min=1, max=3)
+    pool.acquire.side_effect = server.oracledb.DatabaseError(
+        "DPY-4005: timed out waiting for the connection pool to return a connection"
+    )
+
+    with patch.dict(server._pool_metrics, {}, clear=True), \
+         patch.object(server.oracledb, "create_pool", return_value=pool):
+        for _ in range(server.CIRCUIT_BREAKER_THRESHOLD + 1):
+            with pytest.raises(server.PoolBusyError, match="busy: all 3 connections in use, 0 waiters"):
+                with server.get_connection("shared"):
+                    pass
+        assert server._breakers["shared"].state == server.CircuitBreaker.CLOSED
+        assert server._pool_metrics["shared"].timeouts == server.CIRCUIT_BREAKER_THRESHOLD + 1
+        assert server._pool_users["shared"] == 0
+        assert "| **shared** |" in server.get_pool_metrics()
+
+def test_get_connection_releases_sysdba_connection(isolated_pools):
+    server = isolated_pools
+    cache = MagicMock()
+    conn = MagicMock()
+    cache.acquire.return_value = conn
+    with patch.dict(server.DATABASES, {"admin": {"dsn": "x", "mode": "SYSDBA"}}, clear=True), \
+         patch.dict(server._sysdba_caches, {"admin": cache}), \
+         patch.object(server, "_checkout_pool", return_value=None):
+        with server.get_connection("admin") as got:
+            assert got is conn
+    cache.release.assert_called_once_with(conn, discard=False)
+
+def test_metadata_cache_serves_repeats_and_revalidates_on_ddl_time():
+    from mcp_oracle_server import server
+
+    cursor = MagicMock()
+    ddl_times = iter([("2024-01-01",), ("2024-01-01",), ("2024-06-01",)])
+    cursor.fetchone.side_effect = lambda: next(ddl_times)
+    cursor.fetchall.return_value = [("CUSTOMER_ID", "NUMBER", 22)]
+
+    with patch.object(server, "_metadata_cache", server.LRUCache(max_entries=10)), \
+         patch.object(server, "METADATA_CACHE_TTL", 60):
+        first = server.cached_metadata(cursor, "dev", "customers", server.SQL_MOCK_COLUMNS, tn="CUSTOMERS")
+        second = server.cached_metadata(cursor, "dev", "customers", server.SQL_MOCK_COLUMNS, tn="CUSTOMERS")
+        assert first == second
+        assert cursor.fetchall.call_count == 1  # Repeat served without a round trip
+
+        entry = server._metadata_cache.get(("dev", "", "CUSTOMERS"))
+        entry["checked_at"] -= 61  # TTL expired, DDL time unchanged -> reuse
+        server.cached_metadata(cursor, "dev", "customers", server.SQL_MOCK_COLUMNS, tn="CUSTOMERS")
+        assert cursor.fetchall.call_count == 1
+
+        entry["checked_at"] -= 61  # TTL expired, table altered -> refetch
+        server.cached_metadata(cursor, "dev", "customers", server.SQL_MOCK_COLUMNS, tn="CUSTOMERS")
+        assert cursor.fetchall.call_count == 2
+
+        assert server.invalidate_metadata_cache("dev") == 1
+
+def test_lru_cache_evicts_least_recently_used():
+    from mcp_oracle_server.cache import LRUCache
+
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+def test_catalog_store_incremental_refresh(tmp_path):
+    import datetime
+    from mcp_oracle_server.catalog import CatalogStore
+    store = CatalogStore(str(tmp_path / "catalog.db"))
+    wm = datetime.datetime(2026, 1, 1, 12, 0)
+    store.apply_refresh(
+        "sales", wm, [("ORDERS", 1000), ("CUSTOMERS", 50)], ["ORDERS", "CUSTOMERS"],
+        columns=[("ORDERS", 1, "ID", "NUMBER", 22, 10, 0, "N"), ("CUSTOMERS", 1, "NAME", "VARCHAR2", 100, None, None, "Y")],
+        constraints=[("ORDERS", "PK_ORDERS", "P", "ID", 1, None)],
+        indexes=[("ORDERS", "PK_ORDERS", "UNIQUE", "ID")],
+    )
+    assert store.get_watermark("sales") == wm
+    assert store.find_table("orders") == ["sales"]
+    orders = store.get_table("sales", "orders")
+    assert orders["num_rows"] == 1000
+    assert orders["columns"] == [("ID", "NUMBER", 22, 10, 0, "N", None)]
+    assert orders["indexes"] == [("PK_ORDERS", "UNIQUE", "ID")]
+
+    # Second refresh: CUSTOMERS dropped, ORDERS unchanged but row estimate updated
+    store.apply_refresh("sales", wm, [("ORDERS", 2000)], [], [], [], [])
+    assert store.get_table("sales", "CUSTOMERS") is None
+    assert store.get_table("sales", "ORDERS")["num_rows"] == 2000
+    assert len(store.get_table("sales", "ORDERS")["columns"]) == 1
+
+    store.mark_stale("sales")
+    assert store.snapshot_age("sales") is None
+    assert store.find_table("ORDERS") == []
+    store.close()
+
+def test_describe_table_served_from_catalog_snapshot(tmp_path):
+    from mcp_oracle_server import server
+    from mcp_oracle_server.catalog import CatalogStore
+    store = CatalogStore(str(tmp_path / "catalog.db"))
+    store.apply_refresh(
+        server.GLOBAL_CONFIG["default_db"], None, [("ORDERS", 10)], ["ORDERS"],
+        [("ORDERS", 1, "ID", "NUMBER", 22, 10, 0, "N")], [], []
+    )
+    with patch.object(server, "_catalog", store), \
+         patch.object(server, "get_connection") as mock_get_conn:
+        result = server.describe_table("orders")
+    mock_get_conn.assert_not_called()
+    assert "NUMBER(10,0)" in result
+    assert "catalog snapshot" in result
+
+    # Past CATALOG_MAX_AGE the snapshot is bypassed for a live query
+    with patch.object(server, "_catalog", store), \
+         patch.object(server, "CATALOG_MAX_AGE", -1), \
+         patch.object(server, "get_connection") as mock_get_conn:
+        server.describe_table("orders")
+    mock_get_conn.assert_called_once()
+    store.close()
+
+def test_locate_table_fans_out_with_deadline(isolated_pools):
+    server = isolated_pools
+    databases = {"fast": {"dsn": "a"}, "slow": {"dsn": "b"}, "down": {"dsn": "c"}}
+
+    def fake_locate(db_name, table_name):
+        if db_name == "slow":
+            time.sleep(1)
+            return ["own table"]
+        if db_name == "down":
+            raise ConnectionError("listener refused")
+        return ["own table", "public synonym -> HR.EMPLOYEES"]
+
+    with patch.dict(server.DATABASES, databases, clear=True), \
+         patch.object(server, "_catalog", None), \
+         patch.object(server, "CATALOG_FILE", ""), \
+         patch.object(server, "_locate_in_database", side_effect=fake_locate):
+        start = time.monotonic()
+        result = server.locate_table("EMPLOYEES", timeout=0.2)
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 0.9
+    assert "unique to database **`fast`**" in result
+    assert "public synonym -> HR.EMPLOYEES" in result
+    assert "`slow`: timed out" in result
+    assert "`down`: listener refused" in result
+
+def test_locate_table_from_snapshot_keeps_synonyms(isolated_pools, tmp_path):
+    from mcp_oracle_server.catalog import CatalogStore
+    server = isolated_pools
+    store = CatalogStore(str(tmp_path / "catalog.db"))
+    store.apply_refresh(
+        "sales", None, [("ORDERS", 10)], [], [], [], [],
+        aliases=[("ORDERS", "PUBLIC", "SYNONYM", "SALES.ORDERS"), ("ORDERS", "ARCHIVE", "TABLE", None)]
+    )
+
+    with patch.dict(server.DATABASES, {"sales": {"dsn": "a"}}, clear=True), \
+         patch.object(server, "_catalog", store), \
+         patch.object(server, "_locate_in_database") as mock_live:
+        result = server.locate_table("orders")
+    store.close()
+
+    mock_live.assert_not_called()
+    assert "**sales**: own table, table ARCHIVE.ORDERS, public synonym -> SALES.ORDERS" in result
+    assert "catalog snapshot for: sales" in result
+
+def test_object_index_ranks_fuzzy_matches():
+    from mcp_oracle_server.object_index import ObjectIndex
+    index = ObjectIndex()
+    index.replace("sales", [
+        ("CUSTOMERS", "TABLE", None), ("CUST_MASTER", "TABLE", None),
+        ("ORDERS", "TABLE", None), ("CUSTOMER_ID", "COLUMN", "ORDERS"),
+    ], signature=1)
+    index.replace("hr", [("CUSTOMER", "VIEW", None)], signature=1)
+
+    names = [r["name"] for r in index.search("customer")]
+    assert names[0] == "CUSTOMER"
+    assert names[1:3] == ["CUSTOMERS", "CUSTOMER_ID"]
+    assert "ORDERS" not in names
+    assert [r["name"] for r in index.search("cust", types={"TABLE"})][:2] == ["CUSTOMERS", "CUST_MASTER"]
+    assert index.search("customer", databases={"hr"})[0]["occurrences"] == [("hr", "VIEW", None)]
+
+    # Reloading a database drops names that disappeared from it
+    index.replace("sales", [("ORDERS", "TABLE", None)], signature=2)
+    assert [r["name"] for r in index.search("customers")] == ["CUSTOMER"]
+    assert index.signature("sales") == 2
+
+def test_describe_tables_single_query(mock_db_context):
+    from mcp_oracle_server.server import describe_tables
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.fetchall.return_value = [
+        ("ORDERS", "ID", "NUMBER", 22, 10, 0, "N", 1, None, "Customer orders"),
+        ("ORDERS", "NOTE", "VARCHAR2", 200, None, None, "Y", None, "Free text", "Customer orders"),
+    ]
+
+    result = describe_tables(table_names=["orders", "missing"])
+
+    assert mock_cursor.execute.call_count == 1
+    sql, = mock_cursor.execute.call_args.args
+    binds = mock_cursor.execute.call_args.kwargs
+    assert len(binds) == 10  # padded to the smallest bucket
+    assert binds["t0"] == "ORDERS" and binds["t9"] is None
+    assert "### ORDERS -- Customer orders" in result
+    assert "- ID NUMBER(10,0) PK NOT NULL" in result
+    assert "- NOTE VARCHAR2(200) -- Free text" in result
+    assert "**Not found**: MISSING" in result
+
+def test_describe_tables_pattern_caps_tables_in_sql(mock_db_context):
+    from mcp_oracle_server.server import describe_tables
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.fetchall.return_value = [
+        (f"T{i:03d}", "ID", "NUMBER", 22, None, None, "N", None, None, None) for i in range(101)
+    ]
+
+    result = describe_tables(pattern="t%")
+
+    sql, = mock_cursor.execute.call_args.args
+    assert "FETCH FIRST :max_tables ROWS ONLY" in sql
+    assert mock_cursor.execute.call_args.kwargs == {"pattern": "T%", "max_tables": 101}
+    assert result.startswith("## 100 tables")
+    assert "more than 100 tables" in result
+
+def test_describe_tables_rejects_bad_input():
+    from mcp_oracle_server.server import describe_tables
+    assert "Error" in describe_tables()
+    assert "Error" in describe_tables(pattern="ORD'; --")
+    assert "Error" in describe_tables(table_names=["HR.EMP"])
+
+def test_result_cache_byte_budget_and_ttl():
+    from mcp_oracle_server.cache import ResultCache
+    cache = ResultCache(max_bytes=100)
+    cache.put("a", "x", size=60, ttl=60)
+    cache.put("b", "y", size=30, ttl=60)
+    assert cache.get("a")[0] == "x"  # "a" is now most recently used
+    cache.put("c", "z", size=30, ttl=60)
+    assert cache.get("b") is None
+    assert cache.bytes == 90
+    cache.put("big", "w", size=500, ttl=60)  # larger than the budget: not stored
+    assert cache.get("big") is None
+    cache.put("short", "v", size=1, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+
+def test_read_only_query_served_from_result_cache(mock_db_context):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchmany.return_value = [(1,)]
+    db_conf = {"dsn": "x", "result_cache": True, "result_cache_ttl": 60}
+    with patch.dict(server.DATABASES, {"cached": db_conf}), \
+         patch.object(server, "_result_cache", server.ResultCache()):
+        first = server.run_read_only_query("SELECT id FROM t", database_name="cached")
+        second = server.run_read_only_query("SELECT id\n  FROM t;", database_name="cached")
+        assert mock_cursor.execute.call_count == 1
+        assert "cached, age 0s" in second and "cached, age" not in first
+
+        server.run_read_only_query("SELECT id FROM t", database_name="cached", use_cache=False)
+        assert mock_cursor.execute.call_count == 2
+
+        server.invalidate_result_cache("cached")
+        server.run_read_only_query("SELECT id FROM t", database_name="cached")
+        assert mock_cursor.execute.call_count == 3
+
+def test_normalize_sql_keeps_literals():
+    from mcp_oracle_server.server import normalize_sql
+    assert normalize_sql("SELECT  *\n FROM t WHERE a = 'x  y';") == "SELECT * FROM t WHERE a = 'x  y'"
+
+def test_read_only_query_passes_bind_params(mock_db_context):
+    from mcp_oracle_server.server import run_read_only_query
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("NAME",)]
+    mock_cursor.fetchmany.return_value = [("Alice",)]
+
+    run_read_only_query("SELECT name FROM emp WHERE dept_id = :dept", params='{"dept": 10}')
+    mock_cursor.execute.assert_called_with("SELECT name FROM emp WHERE dept_id = :dept", {"dept": 10})
+
+    run_read_only_query("SELECT name FROM emp WHERE dept_id = :1", params=[20])
+    mock_cursor.execute.assert_called_with("SELECT name FROM emp WHERE dept_id = :1", [20])
+
+    assert "Error" in run_read_only_query("SELECT 1 FROM dual", params="{not json")
+    assert "Error" in run_read_only_query("SELECT 1 FROM dual", params="42")
+
+def test_pagination_binds_offset_and_page_size(mock_db_context):
+    from mcp_oracle_server.server import run_query_with_pagination
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.fetchone.return_value = (120,)
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchall.return_value = [(51,)]
+
+    result = run_query_with_pagination("SELECT id FROM t WHERE a = :a", page=2, page_size=50, params={"a": 1})
+
+    count_call, page_call = mock_cursor.execute.call_args_list
+    assert count_call.args == ("SELECT COUNT(*) FROM (SELECT id FROM t WHERE a = :a)", {"a": 1})
+    assert ":mcp_offset" in page_call.args[0]
+    assert page_call.args[1] == {"a": 1, "mcp_offset": 50, "mcp_page_size": 50}
+    assert "Page 2 of 3" in result
+
+def test_keyset_pagination_continuation_token(mock_db_context):
+    import re
+    import datetime
+    from mcp_oracle_server.server import run_query_with_pagination
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("CREATED",), ("ID",)]
+    day = datetime.datetime(2026, 3, 1)
+    mock_cursor.fetchall.return_value = [(day, 1), (day, 2), (day, 3)]
+
+    first = run_query_with_pagination("SELECT created, id FROM t", page_size=2,
+                                      order_by="created, id", count_mode="none")
+    sql, binds = mock_cursor.execute.call_args.args
+    assert mock_cursor.execute.call_count == 1  # no COUNT(*)
+    assert "WHERE" not in sql and "ORDER BY CREATED, ID FETCH FIRST :mcp_fetch_rows" in sql
+    assert binds == {"mcp_fetch_rows": 3}
+    token = re.search(r'continuation_token="([^"]+)"', first).group(1)
+
+    mock_cursor.fetchall.return_value = [(day, 3)]
+    second = run_query_with_pagination("SELECT created, id FROM t", page_size=2, order_by="created, id",
+                                       continuation_token=token, count_mode="none")
+    sql, binds = mock_cursor.execute.call_args.args
+    assert "WHERE (CREATED > :mcp_k0) OR (CREATED = :mcp_k0 AND ID > :mcp_k1)" in sql
+    assert binds == {"mcp_k0": day, "mcp_k1": 2, "mcp_fetch_rows": 3}
+    assert "Last page" in second
+
+    # Tokens are tied to the query they were issued for
+    assert "different query" in run_query_with_pagination("SELECT created, id FROM u", order_by="created, id",
+                                                          continuation_token=token)
+    assert "Error" in run_query_with_pagination("SELECT 1 FROM t", order_by="id; DROP")
+
+def test_open_query_fetch_next_and_close(mock_db_context):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,), (4,)], [(5,)]]
+    mock_get_conn = server.get_connection
+
+    with patch.dict(server._query_sessions, {}, clear=True), \
+         patch.object(server, "start_cursor_reaper"):
+        first = server.open_query("SELECT id FROM t", page_size=2)
+        query_id = re.search(r"Query `(\w+)`", first).group(1)
+        assert "rows 1-2" in first and "fetch_next" in first
+        assert mock_cursor.prefetchrows == 3
+
+        second = server.fetch_next(query_id)
+        assert "rows 3-4" in second
+        assert mock_cursor.execute.call_count == 1  # never re-executed
+        mock_get_conn.return_value.__exit__.assert_not_called()
+
+        last = server.fetch_next(query_id)
+        assert "Query closed" in last
+        mock_get_conn.return_value.__exit__.assert_called_once()
+        assert "not open" in server.fetch_next(query_id)
+
+def test_open_query_per_client_cap_and_idle_cleanup(mock_db_context):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchmany.return_value = [(1,), (2,)]
+
+    with patch.dict(server._query_sessions, {}, clear=True), \
+         patch.object(server, "start_cursor_reaper"), \
+         patch.object(server, "MAX_OPEN_CURSORS", 2):
+        server.open_query("SELECT id FROM t", page_size=2)
+        server.open_query("SELECT id FROM t", page_size=2)
+        assert "already open" in server.open_query("SELECT id FROM t", page_size=2)
+
+        first, second = list(server._query_sessions)
+        server.fetch_next(first, rows=10_000_000)  # Clamped, and exhausted -> closed
+        mock_cursor.fetchmany.assert_called_with(server.MAX_ARRAYSIZE)
+
+        busy = server._query_sessions[second]
+        busy.last_used -= server.CURSOR_IDLE_TIMEOUT
+        with busy.lock:  # A fetch in progress is not closed under it
+            assert server.close_idle_query_sessions() == 0
+        assert server.close_idle_query_sessions() == 1
+        assert "Query `" in server.open_query("SELECT id FROM t", page_size=2)
+
+def test_client_key_ignores_client_supplied_id():
+    from mcp_oracle_server import server
+    session_a, session_b = object(), object()
+    a1 = MagicMock(session=session_a, client_id="shared")
+    a2 = MagicMock(session=session_a, client_id="rotated")
+    b = MagicMock(session=session_b, client_id="shared")
+    assert server.client_key(a1) == server.client_key(a2)
+    assert server.client_key(a1) != server.client_key(b)
+    assert server.client_label(a1) == "shared"
+    assert server.client_key(None) == "local"
+
+def test_pagination_count_modes(mock_db_context):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchall.return_value = [(1,)]
+    mock_cursor.fetchone.return_value = (1000,)
+
+    def executed():
+        return [c.args[0] for c in mock_cursor.execute.call_args_list]
+
+    with patch.object(server, "_count_cache", server.LRUCache(max_entries=10, ttl=60)):
+        server.run_query_with_pagination("SELECT id FROM big", page=1, count_mode="cached")
+        result = server.run_query_with_pagination("SELECT id FROM big", page=2, count_mode="cached")
+    assert sum(sql.startswith("SELECT COUNT(*)") for sql in executed()) == 1
+    assert "Total: 1,000 (cached)" in result
+
+    mock_cursor.execute.reset_mock()
+    result = server.run_query_with_pagination("SELECT id FROM big", count_mode="estimate")
+    assert executed()[0].startswith("EXPLAIN PLAN SET STATEMENT_ID")
+    assert not any(sql.startswith("SELECT COUNT(*)") for sql in executed())
+    mock_conn.rollback.assert_called_once()
+    assert "Page 1 of ~20 (Total: ~1,000 (estimate)" in result
+
+    mock_cursor.execute.reset_mock()
+    result = server.run_query_with_pagination("SELECT id FROM big", count_mode="none")
+    assert len(executed()) == 1
+    assert result.startswith("## Page 1 (DB:")
+    assert "Error" in server.run_query_with_pagination("SELECT id FROM big", count_mode="fast")
+
+def test_fetch_sizing_per_tool_and_database():
+    from mcp_oracle_server import server
+    dbs = {"big": {"dsn": "x", "max_arraysize": 500, "export_arraysize": 20000}}
+    with patch.dict(server.DATABASES, dbs):
+        # A page of 51 rows: all rows plus end-of-fetch ride on the execute
+        assert server.fetch_sizing("big", 51) == (51, 52)
+        assert server.estimate_round_trips(51, (51, 52)) == 1
+        assert server.fetch_sizing("big", 5000) == (500, 500)
+        assert server.fetch_sizing("big", bulk=True) == (20000, 20000)
+    assert server.estimate_round_trips(100000, (5000, 5000)) == 21
+
+def test_read_only_query_sets_fetch_sizing(mock_db_context):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchmany.return_value = [(1,)]
+    server.run_read_only_query("SELECT id FROM t")
+    assert mock_cursor.arraysize == server.MAX_ROWS_DISPLAY + 1
+    assert mock_cursor.prefetchrows == server.MAX_ROWS_DISPLAY + 2
+
+def test_read_only_query_call_timeout(mock_db_context):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.execute.side_effect = server.oracledb.DatabaseError("DPY-4024: call timeout of 500 ms exceeded")
+
+    result = server.run_read_only_query("SELECT * FROM huge", timeout_ms=500)
+
+    assert "timed out after 500ms" in result
+    assert mock_conn.call_timeout == 0  # reset before the connection goes back to the pool
+    assert not server._inflight
+
+def test_cancel_query_interrupts_running_call(mock_db_context):
+    import threading
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    started, cancelled = threading.Event(), threading.Event()
+
+    def slow_execute(*args, **kwargs):
+        started.set()
+        cancelled.wait(5)
+        raise server.oracledb.DatabaseError("ORA-01013: user requested cancel of current operation")
+
+    mock_cursor.execute.side_effect = slow_execute
+    mock_conn.cancel.side_effect = cancelled.set
+    results = []
+    worker = threading.Thread(target=lambda: results.append(server.run_read_only_query("SELECT * FROM huge")))
+    worker.start()
+    assert started.wait(5)
+
+    listing = server.cancel_query()
+    request_id = re.search(r"\| `(\w+)` \|", listing).group(1)
+    assert "SELECT * FROM huge" in listing
+    assert "Cancel sent" in server.cancel_query(request_id)
+    worker.join(5)
+
+    mock_conn.cancel.assert_called_once()
+    assert f"Query {request_id} was cancelled" in results[0]
+    assert "No queries are running" in server.cancel_query()
+
+def test_progress_reporter_throttles_notifications():
+    from mcp_oracle_server import server
+    sent = []
+    ctx = MagicMock()
+    with patch.object(server.anyio.from_thread, "run", side_effect=lambda fn, *args: sent.append(args)):
+        progress = server.ProgressReporter(ctx, total=1000, interval=60)
+        for done in range(0, 1000, 10):
+            progress.update(done)
+        assert sent == []  # within the interval: nothing sent
+        progress.update(1000, force=True)
+    assert len(sent) == 1
+    done, total, message = sent[0]
+    assert (done, total) == (1000, 1000)
+    assert "1,000/1,000 rows" in message and "rows/s" in message
+
+    # Direct calls (no event loop) silently disable reporting
+    progress = server.ProgressReporter(ctx, interval=0.001)
+    progress.update(5, force=True)
+    assert progress.ctx is None
+
+def test_export_reports_progress(mock_db_context, tmp_path):
+    from mcp_oracle_server import server
+    mock_conn, mock_cursor = mock_db_context
+    mock_cursor.description = [("ID",)]
+    mock_cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,)], []]
+    sent = []
+    with patch.object(server.anyio.from_thread, "run", side_effect=lambda fn, *args: sent.append(args)), \
+         patch.object(server, "PROGRESS_INTERVAL", 1e-9):
+        result = server.export_query_to_csv("SELECT id FROM t", "out.csv", output_path=str(tmp_path), ctx=MagicMock())
+    assert "Exported 3 rows" in result
+    assert sent[-1][0] == 3 and "MB written" in sent[-1][2]
+
+def test_run_query_on_databases_merges_concurrently():
+    from mcp_oracle_server import server
+    databases = {"dev": {"dsn": "a"}, "uat": {"dsn": "b"}, "prod": {"dsn": "c"}, "old": {"dsn": "d"}}
+
+    def fake_query(db_name, sql, binds, timeout_ms, max_rows):
+        time.sleep(0.2)
+        if db_name == "prod":
+            raise ConnectionError("ORA-12541: TNS:no listener")
+        if db_name == "old":
+            return ["OTHER"], [(1,)], 200.0
+        return ["STATUS"], [("VALID",), ("INVALID",)], 200.0
+
+    with patch.dict(server.DATABASES, databases, clear=True), \
+         patch.object(server, "_query_one_database", side_effect=fake_query):
+        start = time.monotonic()
+        result = server.run_query_on_databases("SELECT status FROM v$instance")
+        elapsed = time.monotonic() - start
+
+    assert elapsed < 0.6  # concurrent, not 4 x 0.2s
+    assert "DATABASE | STATUS" in result
+    assert "dev | VALID" in result and "uat | INVALID" in result
+    assert "| prod | ❌ ORA-12541: TNS:no listener |" in result
+    assert "| old | ❌ column mismatch: OTHER |" in result
+    assert "| dev | ✅ ok | 2 | 200ms |" in result
+
+def test_run_query_on_databases_validates_input():
+    from mcp_oracle_server import server
+    with patch.dict(server.DATABASES, {"dev": {"dsn": "a"}}, clear=True):
+        assert "Unknown database" in server.run_query_on_databases("SELECT 1 FROM dual", databases=["dev", "nope"])
+        assert "Only SELECT" in server.run_query_on_databases("DELETE FROM t")
+
+def test_run_query_on_databases_bounds_rows_and_time():
+    from mcp_oracle_server import server
+    calls = []
+
+    def fake_query(db_name, sql, binds, timeout_ms, max_rows):
+        calls.append((timeout_ms, max_rows))
+        return ["ID"], [(1,)], 1.0
+
+    with patch.dict(server.DATABASES, {"dev": {"dsn": "a", "call_timeout_ms": 0}}, clear=True), \
+         patch.object(server, "_query_one_database", side_effect=fake_query):
+        server.run_query_on_databases("SELECT 1 FROM dual", max_rows_per_database=10_000_000)
+    assert calls == [(int(server.LOCATE_TIMEOUT * 1000), server.MAX_ROWS_DISPLAY)]
+
+def test_run_query_on_databases_deadline_uses_each_acquire_timeout():
+    from mcp_oracle_server import server
+
+    def fake_query(db_name, sql, binds, timeout_ms, max_rows):
+        time.sleep(0.3)  # Still waiting for a connection within its own acquire_timeout
+        return ["ID"], [(1,)], 300.0
+
+    databases = {"busy": {"dsn": "a", "call_timeout_ms": 100, "acquire_timeout": 1}}
+    with patch.dict(server.DATABASES, databases, clear=True), \
+         patch.object(server, "POOL_ACQUIRE_TIMEOUT", 0), \
+         patch.object(server, "_query_one_database", side_effect=fake_query):
+        result = server.run_query_on_databases("SELECT 1 FROM dual")
+    assert "| busy | ✅ ok | 1 |" in result
+
+
+def test_generate_mock_data_inserts_in_batches(mock_db_context):
+    from mcp_oracle_server import server
+    conn, cursor = mock_db_context
+    cursor.fetchall.return_value = [("ID", "NUMBER", 22), ("NAME", "VARCHAR2", 50)]
+    with patch.object(server, "BATCH_SIZE", 2):
+        result = server.generate_mock_data("TEST_TABLE", 5)
+    assert "generated and inserted 5 rows" in result
+    assert [len(c.args[1]) for c in cursor.executemany.call_args_list] == [2, 2, 1]
+    conn.commit.assert_called_once()